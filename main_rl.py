@@ -22,7 +22,8 @@ if __name__ == '__main__':
         "dir_name": "test_results",
         "road_file": "simple_road.yaml",  # When used, used this file to preset (parts of) the road
         # "log_mediator": "ACTIONS",  # Can be left out (or None), ALL, or ACTIONS
-        # "save_fig": "testrun.png",  # When uncommented, saves figures in images directory
+        # "save_fig": "testrun.png",  # When uncommented, saves figures in images directory (also without rendering)
+        # "trace_dir": "traces",  # When uncommented, records the state of every step of every run in this directory
         "rl_settings_file": "rl_settings.yaml",
         "rl_method": DQN,  # Used both for training (determines training method) and loading
         "rl_model": "test_model_2",
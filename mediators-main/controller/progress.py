@@ -0,0 +1,51 @@
+import datetime
+import time
+
+
+class Progress:
+    """
+    Keeps track of the finished runs and simulated steps of every combination of additional run parameters (e.g. tree
+    and noise), and prints the throughput and the estimated remaining time of every combination that is not finished
+    yet, at most once every interval seconds.
+    """
+
+    def __init__(self, labels, runs, interval):
+        self.labels = labels  # The label of every combination
+        self.runs = runs  # The number of runs of every combination that need to be run
+        self.interval = interval
+        self.finished_runs = [0] * len(labels)  # The number of finished runs of every combination
+        self.steps = 0  # The number of simulated steps over all runs
+        self.start_time = time.time()
+        self.last_report = self.start_time
+
+    def add_run(self, i, steps):
+        """
+        Adds a finished run with the given number of steps to combination i.
+        """
+        self.finished_runs[i] += 1
+        self.steps += steps
+
+    def report(self, force=False):
+        """
+        Prints the progress if interval seconds passed since the previous report, or if force is True.
+        """
+        now = time.time()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        elapsed = max(now - self.start_time, 1e-9)
+        finished = sum(self.finished_runs)
+        total = sum(self.runs)
+        runs_per_second = finished / elapsed
+        print('Progress: {0}/{1} runs ({2:.1f}%), {3:.2f} runs/s, {4:.0f} steps/s'.format(
+            finished, total, 100 * finished / max(total, 1), runs_per_second, self.steps / elapsed))
+
+        # The runs of the combinations are started in order, so a combination is expected to be finished when all runs
+        # of the combinations before it are finished as well
+        remaining = 0
+        for label, runs, finished_runs in zip(self.labels, self.runs, self.finished_runs):
+            remaining += runs - finished_runs
+            if finished_runs == runs:
+                continue
+            eta = datetime.timedelta(seconds=round(remaining / runs_per_second)) if runs_per_second > 0 else "unknown"
+            print('    {0}: {1}/{2} runs, ETA {3}'.format(label, finished_runs, runs, eta))
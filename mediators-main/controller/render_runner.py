@@ -0,0 +1,110 @@
+import datetime
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSlot, QMutex, QWaitCondition
+
+from controller.runner import SingleRun
+from view.viewer_manager import ViewerManager
+
+
+class RenderedRun(SingleRun):
+    """
+    Class that is used to execute a single run in an environment that is rendered by a viewer, which draws the
+    snapshots of the environment in the main thread and can pause the run.
+    """
+
+    def __init__(self, env, mediator, stats, seed_start, viewer, save_fig=None, start_time=None):
+        super().__init__(env, mediator, stats, seed_start, save_fig, start_time)
+
+        # Mutex and WaitCondition are used together to pause the worker until it is woken up again.
+        # This is used to pause the simulation, and to wait for the viewer to draw the final figure.
+        self.mtx = QMutex()
+        self.cond = QWaitCondition()
+
+        self.viewer = viewer
+        self.viewer.worker = self
+        self.viewer.cond = self.cond
+
+    def wait_while_paused(self):
+        self.mtx.lock()
+        if self.paused:
+            self.cond.wait(self.mtx)
+        self.mtx.unlock()
+
+    def push_snapshot(self):
+        """
+        Pushes a snapshot of the data of the environment to the viewer, which draws the latest snapshot at its own
+        frame rate. The worker does not wait for the viewer, except after the last step: then it is paused until the
+        viewer drew (and possibly saved) the final figure.
+        """
+        snapshot = self.env.data.snapshot()
+        if not self.env.done:
+            self.viewer.snapshots.push(snapshot)
+            return
+        # The viewer saves the final figure itself, since it is drawn in the main thread
+        self.viewer.fig_path = self.get_figure_path()
+        # The mutex is locked before pushing, so the viewer can only wake the worker up once it is waiting
+        self.mtx.lock()
+        self.viewer.snapshots.push(snapshot, last=True)
+        self.cond.wait(self.mtx)
+        self.mtx.unlock()
+
+    def save_figure(self):
+        # The figure is saved by the viewer (see push_snapshot)
+        pass
+
+    def pause(self):
+        """
+        Pause the current run.
+        """
+        self.mtx.lock()
+        self.paused = True
+        self.mtx.unlock()
+
+    def resume(self):
+        """
+        Resume the current run if it was paused.
+        """
+        self.mtx.lock()
+        self.paused = False
+        self.mtx.unlock()
+        self.cond.wakeAll()
+
+
+class RenderRunner(QtCore.QObject):
+    """
+    Class that runs a simulation on one thread and renders it. Simulations that are not rendered are run without
+    PyQt5 (see Simulator).
+    """
+
+    sig_done = QtCore.pyqtSignal(int)  # Signal send to simulator to indicate the run is finished
+
+    def __init__(self, worker_id, env, mediator, stats, run_nos, save_fig, journal=None):
+        super().__init__()
+        self.worker_id = worker_id
+        self.env = env
+        self.mediator = mediator
+        self.stats = stats
+        self.run_nos = run_nos  # The numbers of the runs that are executed (counted from the seed in the config)
+        self.save_fig = save_fig
+        self.journal = journal  # If defined, the journal to which every finished run is added (see Journal)
+
+        # Creates the viewers. It is created here, so it lives in the main thread.
+        self.viewer_manager = ViewerManager(self.env.config)
+
+    @pyqtSlot()
+    def run_simulation(self):
+        """
+        Run the simulation until it's done.
+        """
+        start_time = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
+        for i in self.run_nos:
+            # The seeds of the runs are not necessarily consecutive, so every run sets its own seed (see SingleRun)
+            self.env.current_seed = None
+            run = RenderedRun(self.env, self.mediator, self.stats, i, self.viewer_manager.get_viewer(i), self.save_fig,
+                              start_time)
+            run.run()
+            if self.journal is not None:
+                self.journal.add(self.env.current_seed, run.summary)
+
+        self.sig_done.emit(self.worker_id)  # Tell the simulator that this run is finished
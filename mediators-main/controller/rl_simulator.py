@@ -1,8 +1,8 @@
+import os
+
 from controller.simulator import Simulator
-from gym_simulator.envs import MediatorEnv
+from controller.specs import EnvSpec, MediatorSpec
 from gym_simulator.io.writer import Writer
-from gym_simulator.mediator.rl_mediator import RLMediator
-from reinforcement_learning.load import Loader
 
 
 class RLSimulator(Simulator):
@@ -47,22 +47,41 @@ class RLSimulator(Simulator):
         by 1.
         """
         for noise in self.additional_run_parameters:
-            env = MediatorEnv(self.config_file, self.driver_profile, self.view_file,
-                              use_run_configurations=self.use_run_configurations, road_file=self.road_file,
-                              include_road_data=self.include_road_data, route_data_file=self.route_data_file,
-                              render=self.render, rl_settings_file=self.rl_settings_file)
-            vec_env = self.sub_proc_vec_env([lambda: env])
+            env_spec = EnvSpec(self.config_file, self.driver_profile, self.view_file,
+                               use_run_configurations=self.use_run_configurations, road_file=self.road_file,
+                               include_road_data=self.include_road_data, route_data_file=self.route_data_file,
+                               render=self.render, rl_settings_file=self.rl_settings_file,
+                               trace_dir=self.__get_trace_dir(noise), record_history=self.save_fig is not None)
+            mediator_spec = MediatorSpec.from_noise(noise, log_mediator=self.log_mediator, tta_levels=self.tta_levels,
+                                                    rl_method=self.rl_method, rl_model=self.rl_model,
+                                                    sub_proc_vec_env=self.sub_proc_vec_env)
+            env = env_spec.build()
             self.envs.append(env)
-            self.mediators.append(RLMediator(Loader(self.rl_method, self.rl_model, vec_env).load(), self.log_mediator,
-                                             noise, self.tta_levels))
+            self.mediators.append(mediator_spec.build(env))
+            self.specs.append((env_spec, mediator_spec))
 
         self.start_simulation()
 
+    def __get_trace_dir(self, noise):
+        """
+        Returns the directory in which the traces of the runs with the given noise are recorded, or None if no traces
+        are recorded.
+        """
+        if self.trace_dir is None:
+            return None
+        return os.path.join(self.trace_dir, Writer().get_decision_maker_dir(method=self.rl_method,
+                                                                          model_name=self.rl_model, noise=noise,
+                                                                          tta_levels=self.tta_levels))
+
     def get_additional_run_parameters(self):
         return self.additional_run_parameters
 
+    def get_decision_maker_dir(self, i):
+        return Writer().get_decision_maker_dir(method=self.rl_method, model_name=self.rl_model,
+                                               noise=self.additional_run_parameters[i], tta_levels=self.tta_levels)
+
     def write_results(self, i):
-        Writer().write_statistics(self.config_file, self.envs[i].driver_preferences.__dict__,
-                                  self.multiple_stats[i].get_dict(), method=self.rl_method, model_name=self.rl_model,
-                                  write_all_runs=True, config_dir_preamble=self.dir_name,
-                                  noise=self.additional_run_parameters[i], tta_levels=self.tta_levels)
+        self.result_dirs[i] = Writer().write_statistics(
+            self.config_file, self.envs[i].driver_preferences.__dict__, self.multiple_stats[i].get_dict(),
+            method=self.rl_method, model_name=self.rl_model, write_all_runs=True, config_dir_preamble=self.dir_name,
+            noise=self.additional_run_parameters[i], tta_levels=self.tta_levels, directory=self.result_dirs.get(i))
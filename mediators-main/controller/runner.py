@@ -1,40 +1,24 @@
-import datetime
 import os
 
-from PyQt5 import QtCore
-from PyQt5.QtCore import pyqtSlot, QMutex, QWaitCondition
-from PyQt5.QtWidgets import QApplication
-
+from controller.specs import get_env_and_mediator
 from gym_simulator.evaluation.statistics import Statistics
-from view.viewer import Viewer
 
 
-class SingleRun(QtCore.QObject):
+class SingleRun:
     """
-    Class that is used to execute a single run in an environment.
+    Class that is used to execute a single run in an environment. It does not depend on PyQt5, so runs that are not
+    rendered can be executed without it (see RenderedRun for runs that are rendered).
     """
-    sig_render = QtCore.pyqtSignal()  # Signal sent to viewer to trigger a rerender
 
-    def __init__(self, env, mediator, stats, seed_start, viewer=None, save_fig=None, start_time=None):
-        super().__init__()
+    def __init__(self, env, mediator, stats, seed_start, save_fig=None, start_time=None):
         self.env = env
         self.mediator = mediator
-        self.stats = stats
+        self.stats = stats  # The stats that are updated with the results of the run, if defined
         self.seed_start = seed_start
-
-        # Mutex and WaitCondition are used together to pause the worker until it is woken up again.
-        # This is useful when rendering the simulator.
-        self.mtx = QMutex()
-        self.cond = QWaitCondition()
-        self.paused = False
-
-        self.viewer = viewer
+        self.summary = None  # The summary of the results of the run (see Statistics.summarize_run)
+        self.paused = False  # Can only be set by a viewer (see RenderedRun)
         self.save_fig = save_fig
         self.start_time = start_time
-        if self.viewer is not None:
-            self.viewer.worker = self
-            self.viewer.cond = self.cond
-            self.sig_render.connect(self.viewer.update_plots)
 
     def run(self):
         # If the current_seed is None it means it is the first run. It is initialized to the seed it should start at
@@ -43,7 +27,7 @@ class SingleRun(QtCore.QObject):
             self.env.current_seed = self.env.config.seed + self.seed_start - 1
         self.env.reset()  # Environment is always reset at beginning of run
 
-        # Set the worker of the environment to this class, such that the env can emit the render signal
+        # Set the worker of the environment to this class, such that the env can push snapshots to the viewer
         self.env.cur_worker = self
         print('Seed: {0}'.format(self.env.current_seed))
 
@@ -52,20 +36,17 @@ class SingleRun(QtCore.QObject):
         cum_reward = 0
         reward_initialized = False
         while not done:
-            if self.viewer is not None:
-                # Process events here to ensure it pauses immediately
-                QApplication.instance().processEvents()
-            # Possibly pause the simulation here
-            self.mtx.lock()
+            # Possibly pause the simulation here. The flag is checked without locking, so only a paused simulation
+            # has to wait for the lock.
             if self.paused:
-                self.cond.wait(self.mtx)
-            self.mtx.unlock()
+                self.wait_while_paused()
 
             if self.mediator.is_random():
                 action = self.env.action_space.sample()
             else:
+                self.env.fast_forward(self.mediator)  # Possibly skip steps in which nothing happens
                 action = self.mediator.get_action(self.env)  # Get the action from the mediator
-                if self.env.allow_render and "FUTURE_ACTIONS" in self.env.config.views:
+                if self.env.record_history and "FUTURE_ACTIONS" in self.env.config.views:
                     # Set a future action for the mediator
                     self.mediator.set_future_action(self.env)
             obs, reward, done, info = self.env.step(action)  # Take a step in the environment with the action
@@ -76,103 +57,89 @@ class SingleRun(QtCore.QObject):
 
         if reward_initialized:
             print("Total reward: {0}".format(cum_reward))
-        self.__save_figure()
-        self.stats.update(self.env)  # When the run is finished, update the stats
+        self.save_figure()
+        # When the run is finished, update the stats
+        self.summary = Statistics.summarize_run(self.env)
+        if self.stats is not None:
+            self.stats.add_run(self.summary)
 
     def __render(self):
-        # If rendered is True, it means the environment emitted a render signal at this step
-        rendered = self.env.render()
-        if rendered:
-            # When the environment rendered, it means the viewer needs time to update. So the worker is paused until
-            # the viewer updated its plots, after which it will wake the worker up.
-            self.mtx.lock()
-            self.cond.wait(self.mtx)
-            self.mtx.unlock()
-
-    def __save_figure(self):
-        if self.viewer is not None and self.save_fig is not None:
-            directory = os.path.join("images", self.start_time)
-            if not os.path.isdir(directory):
-                os.makedirs(directory)
-            file_name = self.env.current_seed
-            if self.mediator.noise:
-                noise = self.mediator.noise
-                file_name = "{0}_noise_ttaf_{1}_ttau_{2}_ttdf_{3}_ttdu_{4}".format(file_name, noise["ttaf"],
-                                                                                   noise["ttau"], noise["ttdf"],
-                                                                                   noise["ttdu"])
-            file_name = "{0}_{1}".format(file_name, self.save_fig)
-            self.viewer.fig.savefig(os.path.join(directory, file_name), dpi=600)
-
-    def pause(self):
+        # The environment pushes a snapshot to the viewer (see RenderedRun.push_snapshot) if this step is rendered
+        self.env.render()
+
+    def wait_while_paused(self):
         """
-        Pause the current run.
+        Waits until the run is resumed. A run without a viewer is never paused.
         """
-        self.mtx.lock()
-        self.paused = True
-        self.mtx.unlock()
+        pass
 
-    def resume(self):
+    def save_figure(self):
         """
-        Resume the current run if it was paused.
+        Saves the figure of the finished run if save_fig is set. The figure is rendered from the data of the environment
+        (see render_figure), which requires the environment to record its history.
         """
-        self.mtx.lock()
-        self.paused = False
-        self.mtx.unlock()
-        self.cond.wakeAll()
-
-
-class MultithreadedRunner:
-    """
-    Class that runs a simulation. This can be part of a larger pool.
-    """
-
-    def run_simulation(self, env, mediator, worker_id, runs, seed_start):
+        if self.env.record_history:
+            file_path = self.get_figure_path()
+            if file_path is not None:
+                # Imported here, so matplotlib is only loaded when figures are saved
+                from view.offline_renderer import render_figure
+                render_figure(self.env.config, self.env.data, file_path, dpi=600)
+
+    def get_figure_path(self):
         """
-        Run the simulation until it's done.
+        Returns the path to which the figure of the current run is saved, or None if save_fig is not set. The directory
+        of the path is created if it does not exist yet.
         """
-        print('Process {0} started from seed {1} to {2}'.format(worker_id, env.config.seed + seed_start,
-                                                                env.config.seed + seed_start + runs - 1))
-        stats = Statistics(env.config)
-
-        for i in range(runs):
-            run = SingleRun(env, mediator, stats, seed_start)
-            run.run()
-
-        print('Process {0} is finished'.format(worker_id))
-        return stats
+        if self.save_fig is None:
+            return None
+        directory = os.path.join("images", self.start_time)
+        # Processes running in parallel can create the directory at the same time
+        os.makedirs(directory, exist_ok=True)
+        file_name = self.env.current_seed
+        if self.mediator.noise:
+            noise = self.mediator.noise
+            file_name = "{0}_noise_ttaf_{1}_ttau_{2}_ttdf_{3}_ttdu_{4}".format(file_name, noise["ttaf"], noise["ttau"],
+                                                                               noise["ttdf"], noise["ttdu"])
+        file_name = "{0}_{1}".format(file_name, self.save_fig)
+        return os.path.join(directory, file_name)
+
+
+def execute_runs(env, mediator, run_nos, stats=None, save_fig=None, start_time=None):
+    """
+    Executes the runs with the given numbers (counted from the seed in the config) in the environment, one after the
+    other, and yields the number and the summary of the results (see Statistics.summarize_run) of every finished run.
+    If stats is defined, it is updated with the results as well.
+    """
+    for i in run_nos:
+        # The seeds of the runs are not necessarily consecutive, so every run sets its own seed (see SingleRun.run)
+        env.current_seed = None
+        run = SingleRun(env, mediator, stats, i, save_fig, start_time)
+        run.run()
+        yield i, run.summary
 
 
-class RenderRunner(QtCore.QObject):
+class MultithreadedRunner:
     """
-    Class that runs a simulation on one thread, and possibly renders it.
+    Class that runs a chunk of runs of a simulation. This can be part of a larger pool.
     """
 
-    sig_done = QtCore.pyqtSignal(int)  # Signal send to simulator to indicate the run is finished
-
-    def __init__(self, worker_id, env, mediator, stats, runs, render, save_fig):
-        super().__init__()
-        self.worker_id = worker_id
-        self.env = env
-        self.mediator = mediator
-        self.stats = stats
-        self.runs = runs
-        self.render = render
-        self.save_fig = save_fig
+    def run_simulation(self, env_spec, mediator_spec, summaries, key, chunk_no, runs, seed_start, save_fig=None,
+                       start_time=None):
+        """
+        Run the runs of the chunk with consecutive seeds starting from seed_start until they are done.
 
-        self.viewers = []
-        if self.render:
-            for i in range(runs):
-                self.viewers.append(Viewer(self.env.config, i))
+        As soon as a run is finished, a tuple with key, the number of the run (counted from the seed in the config) and
+        the summary of its results (see Statistics.summarize_run) is put in the summaries queue, so the stats can be
+        updated while the other runs are still running.
 
-    @pyqtSlot()
-    def run_simulation(self):
+        The environment and mediator are built from the specs, once per process (see get_env_and_mediator). If save_fig
+        is set, the figure of every run is rendered and saved in this process.
         """
-        Run the simulation until it's done.
-        """
-        start_time = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
-        for i in range(self.runs):
-            run = SingleRun(self.env, self.mediator, self.stats, i,
-                            self.viewers[i] if len(self.viewers) > 0 else None, self.save_fig, start_time)
-            run.run()
-
-        self.sig_done.emit(self.worker_id)  # Tell the simulator that this run is finished
+        env, mediator = get_env_and_mediator(env_spec, mediator_spec)
+        print('Chunk {0} started from seed {1} to {2}'.format(chunk_no, env.config.seed + seed_start,
+                                                              env.config.seed + seed_start + runs - 1))
+        for run_no, summary in execute_runs(env, mediator, range(seed_start, seed_start + runs), save_fig=save_fig,
+                                            start_time=start_time):
+            summaries.put((key, run_no, summary))
+
+        print('Chunk {0} is finished'.format(chunk_no))
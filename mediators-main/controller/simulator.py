@@ -1,21 +1,27 @@
+import datetime
+import math
+import os
+import queue
 import sys
 from abc import ABC, abstractmethod
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QThread, pyqtSlot
-
 from gym_simulator.evaluation.statistics import Statistics
+from gym_simulator.io.journal import Journal
+from gym_simulator.io.writer import Writer
 
-from controller.runner import MultithreadedRunner, RenderRunner
+from controller.progress import Progress
+from controller.runner import MultithreadedRunner, execute_runs
 
 import time
 
+from pathos.helpers import mp
 from pathos.multiprocessing import ProcessingPool as Pool
 
 
 class Simulator(ABC):
     """
     Abstract class to run the simulator for one or more runs using PyQT5 and a fork of Python's multiprocessing module.
+    PyQt5 is only imported when the runs are rendered, so simulations that are not rendered can run without it.
     """
 
     def __init__(self, settings):
@@ -34,16 +40,24 @@ class Simulator(ABC):
         self.render = settings.render
         self.dir_name = settings.dir_name
         self.no_threads = min(settings.get("no_threads", 1), self.runs)
+        self.chunk_size = settings.get("chunk_size", None)
+        self.progress_interval = settings.get("progress_interval", 10)
+        self.flush_interval = settings.get("flush_interval", 60)
+        self.resume = settings.get("resume", False)
         self.driver_profile = settings.driver_profile
         self.log_mediator = settings.get("log_mediator", None)
         self.save_fig = settings.get("save_fig", None)
+        self.trace_dir = settings.get("trace_dir", None)
         self.additional_run_parameters = None
         self.threads = []
         self.envs = []  # This will hold the environment object
         self.mediators = []  # This will hold the mediator object
+        self.specs = []  # This will hold the specs from which the environment and mediator are built (see EnvSpec)
         self.multiple_stats = []  # This will hold the stats over all the runs
         self.start_time = None  # This will be initialized at start of the simulation
         self.finished_count = 0
+        self.result_dirs = {}  # The directory to which the results of every combination are written
+        self.journals = []  # The journal of the finished runs of every combination (see Journal)
 
     @abstractmethod
     def run(self):
@@ -62,100 +76,273 @@ class Simulator(ABC):
 
     def start_simulation(self):
         """
-        Starts the simulation. In case of multithreading, starts all threads.
+        Starts the simulation. If the runs are rendered, every combination of additional run parameters is run in its
+        own thread of a PyQt5 application. Else, the combinations are run one after the other in this process if
+        no_threads is 1, or in a pool of processes otherwise.
         """
         self.start_time = time.time()
+        # The journals of the finished runs of every combination, with which the simulation can be resumed
+        self.journals = [Journal(self.get_journal_path(i), self.resume, self.get_input_hashes(i))
+                         for i in range(len(self.get_additional_run_parameters()))]
+
+        if self.render:
+            self.__run_rendered()
+        else:
+            # Used as name of the directory in which the figures are saved
+            fig_start_time = datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
+            if self.no_threads == 1:
+                self.__run_sequentially(fig_start_time)
+            else:
+                self.__run_in_pool(fig_start_time)
 
-        if self.render or self.no_threads == 1:
-            # Initiate a PyQt5 application
-            self.qapp = QApplication(sys.argv)
+    def __run_rendered(self):
+        """
+        Runs every combination of additional run parameters in its own thread, and renders the runs. Returns when the
+        PyQt5 application is quit by closing the window(s).
+        """
+        # Imported here, so PyQt5 is only needed when rendering
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QThread
+        from controller.render_runner import RenderRunner
 
-            for i in range(len(self.get_additional_run_parameters())):
-                # Initiate the thread in which this run will be executed
-                thread = QThread()
-                thread.setObjectName('Environment')
+        # Initiate a PyQt5 application
+        qapp = QApplication(sys.argv)
 
-                # Create a Statistics object to hold stats
-                self.multiple_stats.append(Statistics(self.envs[i].config))
+        for i in range(len(self.get_additional_run_parameters())):
+            # Initiate the thread in which this run will be executed
+            thread = QThread()
+            thread.setObjectName('Environment')
 
-                # Initiate the worker that will execute the run
-                worker = RenderRunner(i, self.envs[i], self.mediators[i], self.multiple_stats[i], self.runs,
-                                      self.render, self.save_fig)
+            # Create a Statistics object to hold stats, which starts with the runs in the journal
+            self.multiple_stats.append(Statistics(self.envs[i].config))
+            journal_summaries = self.__get_journal_summaries(i)
+            for run_no in sorted(journal_summaries):
+                self.multiple_stats[i].add_run(journal_summaries[run_no])
 
-                worker.moveToThread(thread)  # Move it into the created thread so it runs in there
-                worker.sig_done.connect(lambda index: self.__finalize(index))  # Finalize the thread
+            # Initiate the worker that will execute the runs that are not in the journal
+            worker = RenderRunner(i, self.envs[i], self.mediators[i], self.multiple_stats[i],
+                                  self.__get_missing_runs(i), self.save_fig, self.journals[i])
 
-                # Store thread and worker to list to prevent garbage collection
-                self.threads.append((thread, worker))
-                # Connect the running of the simulation to the start of the thread
-                thread.started.connect(worker.run_simulation)
-                thread.start()  # Start the thread so the simulation run will start
+            worker.moveToThread(thread)  # Move it into the created thread so it runs in there
+            worker.sig_done.connect(lambda index: self.__finalize(index))  # Finalize the thread
 
-            # Execute the PyQt5 application, causing it to run
-            self.qapp.exec()
-        else:
-            for i in range(len(self.get_additional_run_parameters())):
-                # Get a list of tuples defining seed starts and number of runs for all processes
-                seed_starts_and_runs = self.__calculate_seed_starts_and_runs()
-                # Initiate a worker object
-                worker = MultithreadedRunner()
-                # Workaround to pass a function with multiple arguments to the map function of Pool
-                run_sim = lambda x: worker.run_simulation(*x)
-
-                args = []  # List that contains tuples, where each tuples contains arguments for one process
-                for thread_no in range(self.no_threads):
-                    seed_start, total_runs = seed_starts_and_runs[thread_no]
-                    args.append((self.envs[i], self.mediators[i], thread_no, total_runs, seed_start))
-
-                # Initiate a ParallelProcessing Pool
-                pool = Pool(nodes=self.no_threads)
-                # Run the function
-                results = pool.map(run_sim, args)
-                # Since the processes have no shared memory, stats need to be merged here
-                stats = results[0]
-                for j in range(1, len(results)):
-                    stats.merge(results[j])
-                self.multiple_stats.append(stats)
+            # Store thread and worker to list to prevent garbage collection
+            self.threads.append((thread, worker))
+            # Connect the running of the simulation to the start of the thread
+            thread.started.connect(worker.run_simulation)
+            thread.start()  # Start the thread so the simulation run will start
+
+        # Execute the PyQt5 application, causing it to run
+        qapp.exec()
+
+    def __run_sequentially(self, fig_start_time):
+        """
+        Runs all combinations of additional run parameters one after the other in this process, without PyQt5. As in
+        __run_in_pool, the progress is printed every progress_interval seconds, the results of the combinations that
+        are not finished yet are written every flush_interval seconds, and the runs that are in the journal of a
+        combination are not run again.
+        """
+        parameters = self.get_additional_run_parameters()
+        missing_runs = [self.__get_missing_runs(i) for i in range(len(parameters))]
+        pending_summaries = self.__init_stats()
+        progress = Progress([str(p) for p in parameters], [len(runs) for runs in missing_runs], self.progress_interval)
+        last_flush = time.time()
+        for i in range(len(parameters)):
+            for run_no, summary in execute_runs(self.envs[i], self.mediators[i], missing_runs[i],
+                                                save_fig=self.save_fig, start_time=fig_start_time):
+                self.__receive_summary(i, run_no, summary, pending_summaries, progress)
+                progress.report()
+                if time.time() - last_flush >= self.flush_interval:
+                    last_flush = time.time()
+                    self.__flush()
+        progress.report(force=True)
+
+    def __run_in_pool(self, fig_start_time):
+        """
+        Runs all combinations of additional run parameters in one pool of no_threads processes. The runs of every
+        combination are split into chunks of consecutive seeds (see __calculate_chunks), and the chunks of all
+        combinations are put in one queue. A process takes the next chunk from the queue as soon as it finished its
+        previous one, so no process is idle until the last chunks of the last combination are running.
+
+        The processes send a summary of every finished run back through another queue, with which the stats are
+        updated while the other runs are still running. The progress is printed every progress_interval seconds, and
+        the results of the combinations that are not finished yet are written every flush_interval seconds, so they
+        are not lost if the simulation stops early. The results of a combination are written as soon as all of its
+        runs are finished.
+
+        The runs that are in the journal of a combination (see Journal) are not run again, but their summaries are
+        used to update the stats.
+        """
+        parameters = self.get_additional_run_parameters()
+        missing_runs = [self.__get_missing_runs(i) for i in range(len(parameters))]
+        # Initiate a worker object
+        worker = MultithreadedRunner()
+        # Workaround to pass a function with multiple arguments to the map function of Pool
+        run_chunk = lambda x: worker.run_simulation(*x)
+
+        # The queue is managed by a separate process, so it can be passed to the processes of the pool
+        manager = mp.Manager()
+        summaries = manager.Queue()
+        args = []  # List that contains tuples, where each tuple contains the arguments for one chunk
+        for i in range(len(parameters)):
+            # Only the specs are sent to the processes, which build the environment and mediator themselves
+            env_spec, mediator_spec = self.specs[i]
+            for chunk_no, (seed_start, total_runs) in enumerate(self.__calculate_chunks(missing_runs[i])):
+                args.append((env_spec, mediator_spec, summaries, i, chunk_no, total_runs, seed_start, self.save_fig,
+                             fig_start_time))
+
+        pending_summaries = self.__init_stats()
+        progress = Progress([str(p) for p in parameters], [len(runs) for runs in missing_runs], self.progress_interval)
+        last_flush = time.time()
+        # Initiate a ParallelProcessing Pool, which is used for all combinations
+        pool = Pool(nodes=self.no_threads)
+        try:
+            finished_chunks = pool.uimap(run_chunk, args)
+            remaining_chunks = len(args)
+            while remaining_chunks > 0:
+                try:
+                    # Raises the exception of a chunk if it failed
+                    finished_chunks.next(timeout=0.2)
+                    remaining_chunks -= 1
+                except mp.TimeoutError:
+                    pass
+                self.__receive_summaries(summaries, pending_summaries, progress)
+                progress.report()
+                if time.time() - last_flush >= self.flush_interval:
+                    last_flush = time.time()
+                    self.__flush()
+            # All summaries of a chunk are in the queue before the chunk is finished
+            self.__receive_summaries(summaries, pending_summaries, progress)
+            progress.report(force=True)
+        finally:
+            pool.close()
+            pool.join()
+            pool.clear()
+            manager.shutdown()
+
+    def __init_stats(self):
+        """
+        Creates the stats of every combination, which are updated with the runs in the journal (see Journal) right
+        away. Returns the pending summaries of every combination: the summaries of the runs that are received before the
+        runs with lower seeds of the same combination. The stats are updated in the order of the seeds, so the results
+        do not depend on the order in which the runs finish.
+        """
+        self.multiple_stats = [Statistics(env.config) for env in self.envs]
+        pending_summaries = [self.__get_journal_summaries(i) for i in range(len(self.multiple_stats))]
+        for i in range(len(self.multiple_stats)):
+            self.__add_pending_runs(i, pending_summaries)
+        return pending_summaries
+
+    def __receive_summaries(self, summaries, pending_summaries, progress):
+        """
+        Updates the stats with the summaries of the runs that are in the queue, and writes the results of the
+        combinations of which all runs are finished.
+        """
+        while True:
+            try:
+                i, run_no, summary = summaries.get_nowait()
+            except queue.Empty:
+                return
+            self.__receive_summary(i, run_no, summary, pending_summaries, progress)
+
+    def __receive_summary(self, i, run_no, summary, pending_summaries, progress):
+        """
+        Adds the summary of the finished run of combination i to the journal, the progress and the stats.
+        """
+        self.journals[i].add(self.envs[i].config.seed + run_no, summary)
+        progress.add_run(i, summary['steps'])
+        pending_summaries[i][run_no] = summary
+        self.__add_pending_runs(i, pending_summaries)
+
+    def __add_pending_runs(self, i, pending_summaries):
+        """
+        Updates the stats of combination i with the pending summaries that directly follow the runs that are already in
+        the stats, and writes the results if all runs of the combination are finished.
+        """
+        stats = self.multiple_stats[i]
+        while stats.total_runs in pending_summaries[i]:
+            stats.add_run(pending_summaries[i].pop(stats.total_runs))
+            if stats.total_runs == self.runs:
                 self.__finalize(i)
 
-    def __calculate_seed_starts_and_runs(self):
+    def __flush(self):
+        """
+        Writes the results of the runs of the combinations that are not finished yet.
+        """
+        for i, stats in enumerate(self.multiple_stats):
+            if 0 < stats.total_runs < self.runs:
+                stats.finalize(time.time() - self.start_time)
+                self.write_results(i)
+
+    def __calculate_chunks(self, run_nos):
         """
-        Function that calculates a list of tuples containing a seed start and number of runs in the case of
-        parallel processing.
+        Function that calculates a list of tuples containing a seed start and number of runs for every chunk of runs in
+        the case of parallel processing, given the (sorted) numbers of the runs that need to be run. A chunk only
+        contains runs with consecutive seeds. If chunk_size is not set in the settings, the runs are split into (at
+        most) four chunks per process, which are small enough to balance the load between the processes, while the
+        chunks do not add much overhead.
         """
-        # If there are fewer runs than threads, each run simply gets its own thread
-        if self.runs <= self.no_threads:
-            return [(i, 1) for i in range(self.runs)]
+        chunk_size = self.chunk_size or max(math.ceil(self.runs / (4 * self.no_threads)), 1)
+        chunks = []
+        for run_no in run_nos:
+            if chunks and run_no == chunks[-1][0] + chunks[-1][1] and chunks[-1][1] < chunk_size:
+                chunks[-1] = (chunks[-1][0], chunks[-1][1] + 1)
+            else:
+                chunks.append((run_no, 1))
+        return chunks
 
-        # This calculates the minimum number of runs for each thread (since int rounds down)
-        min_runs = int(self.runs / self.no_threads)
-        # If there is a remainder, it means the first <remainder> processes perform one extra run
-        remainder = self.runs % self.no_threads
-        seeds_and_runs = []
-        cur_seed = 0
-        for i in range(self.no_threads):
-            total_runs = min_runs + 1 if i < remainder else min_runs
-            seeds_and_runs.append((cur_seed, total_runs))
-            cur_seed += total_runs
-        return seeds_and_runs
+    def get_journal_path(self, i):
+        """
+        Returns the path of the journal of the runs of combination i (see Journal). It is stored with the results of the
+        combination, so the journal is specific to the config file, the decision maker, the noise and the levels.
+        """
+        return os.path.join(Writer().get_config_dir(self.config_file, self.dir_name), self.get_decision_maker_dir(i),
+                            "journal.pkl")
+
+    def get_input_hashes(self, i):
+        """
+        Returns the hashes of the files that combination i is parsed from (see EnvSpec.get_input_files and
+        MediatorSpec.get_input_files), with which its journal checks that a resumed simulation has the same input.
+        """
+        env_spec, mediator_spec = self.specs[i]
+        return Writer().hash_input_files(env_spec.get_input_files() + mediator_spec.get_input_files())
+
+    def __get_missing_runs(self, i):
+        """
+        Returns the numbers of the runs of combination i (counted from the seed in the config) that are not in its
+        journal.
+        """
+        seed = self.envs[i].config.seed
+        return [run_no for run_no in range(self.runs) if seed + run_no not in self.journals[i].summaries]
+
+    def __get_journal_summaries(self, i):
+        """
+        Returns the summaries of the runs of combination i that are in its journal, per run number.
+        """
+        seed = self.envs[i].config.seed
+        return {journal_seed - seed: summary for journal_seed, summary in self.journals[i].summaries.items()
+                if 0 <= journal_seed - seed < self.runs}
 
-    @pyqtSlot()
     def __finalize(self, i):
         """
-        Writes stats to a file and exits the application if no GUI is open.
+        Writes stats to a file. When rendering, the PyQt5 application quits when closing the window(s).
         """
         self.multiple_stats[i].finalize(time.time() - self.start_time)
         self.write_results(i)
+        self.journals[i].close()
         self.finished_count += 1
 
-        if not self.render and self.finished_count == len(self.get_additional_run_parameters()):
-            # When not rendering, immediately quit the application once a run is done. Else, the app will quit
-            # when closing the window(s).
-            sys.exit()
+    @abstractmethod
+    def get_decision_maker_dir(self, i):
+        """
+        Returns the name of the directory for the results of combination i (see Writer.get_decision_maker_dir).
+        """
+        pass
 
     @abstractmethod
     def write_results(self, i):
         """
-        Write the results to a file.
+        Write the results to a file. If the results of combination i were written before (e.g. the partial results
+        of a combination that was not finished yet), they are overwritten, see result_dirs.
         """
         pass
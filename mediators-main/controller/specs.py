@@ -0,0 +1,123 @@
+import os
+from dataclasses import dataclass, fields
+
+from gym_simulator.config.config_parser import ConfigParser
+from gym_simulator.config.road_parser import RoadParser
+from gym_simulator.envs import MediatorEnv
+from gym_simulator.mediator.rl_mediator import RLMediator
+from gym_simulator.mediator.tree_mediator import TreeMediator
+from mediator_system.decision_rules.tree_parser import TreeParser
+from mediator_system.preferences.preferences_parser import PreferencesParser
+from reinforcement_learning.load import Loader
+from reinforcement_learning.rl_settings_parser import RLSettingsParser
+
+
+@dataclass(frozen=True)
+class EnvSpec:
+    """
+    Describes how to build a MediatorEnv: the files it is parsed from and the arguments that are passed to it. A spec
+    is small and hashable, so it can be sent to the worker processes of a pool instead of the environment itself,
+    which contains the parsed config, road and route data. The worker builds the environment from the spec (see
+    get_env_and_mediator).
+    """
+
+    config_file: str
+    driver_preferences_file: str
+    view_file: str
+    use_run_configurations: bool = False
+    road_file: str = None
+    include_road_data: bool = False
+    route_data_file: str = None
+    render: bool = True
+    rl_settings_file: str = None
+    trace_dir: str = None
+    record_history: bool = False
+
+    def build(self):
+        """
+        Returns a new environment built from the spec.
+        """
+        return MediatorEnv(**{field.name: getattr(self, field.name) for field in fields(self)})
+
+    def get_input_files(self):
+        """
+        Returns the files that the environment is parsed from and that affect the results of its runs. The view file
+        only affects the plots, so it is not included.
+        """
+        config_loc, ttd_loc, _ = ConfigParser.get_locations(self.config_file, self.view_file,
+                                                            self.use_run_configurations)
+        input_files = [config_loc, ttd_loc,
+                       PreferencesParser.get_location(self.driver_preferences_file, self.use_run_configurations)]
+        if self.road_file is not None:
+            road_loc, route_data_loc = RoadParser.get_locations(self.road_file, self.include_road_data,
+                                                                self.route_data_file, self.use_run_configurations)
+            input_files += [road_loc, route_data_loc] if self.include_road_data else [road_loc]
+        if self.rl_settings_file:
+            input_files.append(RLSettingsParser.get_location(self.rl_settings_file, self.use_run_configurations))
+        return input_files
+
+
+@dataclass(frozen=True)
+class MediatorSpec:
+    """
+    Describes how to build the mediator of an environment. If tree_file is set, a TreeMediator is built from the tree
+    file, else an RLMediator is built from the model that is loaded with rl_method and rl_model. The noise is stored
+    as a tuple of items, so the spec is hashable (see from_noise).
+    """
+
+    log_mediator: str = None
+    noise_items: tuple = None
+    tta_levels: str = "levels"
+    tree_file: str = None
+    rl_method: str = None
+    rl_model: str = None
+    sub_proc_vec_env: type = None
+
+    @staticmethod
+    def from_noise(noise, **kwargs):
+        """
+        Returns a spec with the given noise dictionary (or None) and other arguments.
+        """
+        return MediatorSpec(noise_items=tuple(noise.items()) if noise else None, **kwargs)
+
+    @property
+    def noise(self):
+        return dict(self.noise_items) if self.noise_items else None
+
+    def build(self, env):
+        """
+        Returns a new mediator for the environment built from the spec.
+        """
+        if self.tree_file is not None:
+            return TreeMediator(env.config, self.tree_file, env.action_mapper, self.log_mediator, self.noise,
+                                self.tta_levels)
+        vec_env = self.sub_proc_vec_env([lambda: env])
+        return RLMediator(Loader(self.rl_method, self.rl_model, vec_env).load(), self.log_mediator, self.noise,
+                          self.tta_levels)
+
+    def get_input_files(self):
+        """
+        Returns the files that the mediator is parsed or loaded from: the tree file and the files of its subtrees, or
+        the files of the RL model.
+        """
+        if self.tree_file is not None:
+            return TreeParser.get_locations(self.tree_file)
+        model_dir = Loader.get_model_dir(self.rl_method, self.rl_model)
+        return sorted(os.path.join(root, file) for root, dirs, files in os.walk(model_dir) for file in files)
+
+
+# The environments and mediators that are built in this process, per pair of specs
+_cache = {}
+
+
+def get_env_and_mediator(env_spec, mediator_spec):
+    """
+    Returns the environment and mediator built from the specs. They are only built the first time they are requested
+    in a process, after which the same objects are returned, so a worker process builds them once for all chunks of
+    runs it executes with these specs.
+    """
+    key = (env_spec, mediator_spec)
+    if key not in _cache:
+        env = env_spec.build()
+        _cache[key] = (env, mediator_spec.build(env))
+    return _cache[key]
@@ -1,7 +1,8 @@
+import os
+
 from controller.simulator import Simulator
-from gym_simulator.envs import MediatorEnv
+from controller.specs import EnvSpec, MediatorSpec
 from gym_simulator.io.writer import Writer
-from gym_simulator.mediator.tree_mediator import TreeMediator
 
 
 class TreeSimulator(Simulator):
@@ -48,23 +49,41 @@ class TreeSimulator(Simulator):
         environments are created, and within each environment 100 runs are executed.
         """
         for (tree_file, noise) in self.additional_run_parameters:
-            env = MediatorEnv(self.config_file, self.driver_profile, self.view_file,
-                              use_run_configurations=self.use_run_configurations, road_file=self.road_file,
-                              include_road_data=self.include_road_data, route_data_file=self.route_data_file,
-                              render=self.render)
+            env_spec = EnvSpec(self.config_file, self.driver_profile, self.view_file,
+                               use_run_configurations=self.use_run_configurations, road_file=self.road_file,
+                               include_road_data=self.include_road_data, route_data_file=self.route_data_file,
+                               render=self.render, trace_dir=self.__get_trace_dir(tree_file, noise),
+                               record_history=self.save_fig is not None)
+            mediator_spec = MediatorSpec.from_noise(noise, log_mediator=self.log_mediator, tta_levels=self.tta_levels,
+                                                    tree_file=tree_file)
+            env = env_spec.build()
             self.envs.append(env)
-            self.mediators.append(TreeMediator(env.config, tree_file, env.action_mapper, self.log_mediator, noise,
-                                               self.tta_levels))
+            self.mediators.append(mediator_spec.build(env))
+            self.specs.append((env_spec, mediator_spec))
 
         self.start_simulation()
 
+    def __get_trace_dir(self, tree_file, noise):
+        """
+        Returns the directory in which the traces of the runs with the given tree and noise are recorded, or None if no
+        traces are recorded.
+        """
+        if self.trace_dir is None:
+            return None
+        return os.path.join(self.trace_dir, Writer().get_decision_maker_dir(tree_file=tree_file, noise=noise,
+                                                                          tta_levels=self.tta_levels))
+
     def get_additional_run_parameters(self):
         return self.additional_run_parameters
 
+    def get_decision_maker_dir(self, i):
+        tree_file, noise = self.additional_run_parameters[i]
+        return Writer().get_decision_maker_dir(tree_file=tree_file, noise=noise, tta_levels=self.tta_levels)
+
     def write_results(self, i):
         tree = self.mediators[i].mediator_interface.tree
-        Writer().write_statistics(self.config_file, self.envs[i].driver_preferences.__dict__,
-                                  self.multiple_stats[i].get_dict(), tree_file=self.additional_run_parameters[i][0],
-                                  parsed_tree=tree.get_subtree_string(), write_all_runs=True,
-                                  config_dir_preamble=self.dir_name, noise=self.additional_run_parameters[i][1],
-                                  tta_levels=self.tta_levels)
+        self.result_dirs[i] = Writer().write_statistics(
+            self.config_file, self.envs[i].driver_preferences.__dict__, self.multiple_stats[i].get_dict(),
+            tree_file=self.additional_run_parameters[i][0], parsed_tree=tree.get_subtree_string(), write_all_runs=True,
+            config_dir_preamble=self.dir_name, noise=self.additional_run_parameters[i][1], tta_levels=self.tta_levels,
+            directory=self.result_dirs.get(i))
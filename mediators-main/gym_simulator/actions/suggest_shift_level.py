@@ -1,5 +1,5 @@
 from gym_simulator.actions.abstract_action import AbstractAction
-from gym_simulator.utils.utils import calculate_probability_per_timestep, level_index
+from gym_simulator.utils.utils import calculate_probability_per_timestep, level_index, GeometricSampler
 
 
 class SuggestShiftLevel(AbstractAction):
@@ -31,6 +31,7 @@ class SuggestShiftLevel(AbstractAction):
         # Similar logic as for Correct Fatigue
         self.response_prob_per_timestep = calculate_probability_per_timestep(
             total_timesteps, response_probability)
+        self.response_sampler = GeometricSampler(rng)  # Used if geometric sampling is enabled
 
     def is_pending(self):
         return self.suggestion_accepted is None
@@ -42,7 +43,7 @@ class SuggestShiftLevel(AbstractAction):
         if not super().step(position):
             return
         # There is a possibility that the driver does not respond (which is interpreted as a decline of the suggestion)
-        if self.rng.rand() < self.response_prob_per_timestep:
+        if self._responds():
             # If the driver responds, there is a predefined probability that he accepts the suggestion
             if self.rng.rand() < self.acceptance_probability:
                 self.suggestion_accepted = True
@@ -54,6 +55,14 @@ class SuggestShiftLevel(AbstractAction):
 
         self.remaining_time -= self.config.timestep
 
+    def _responds(self):
+        """
+        Returns True if the driver responds to the suggestion in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.response_sampler.occurs(self.response_prob_per_timestep)
+        return self.rng.rand() < self.response_prob_per_timestep
+
     def end_action(self):
         if self.rng.rand() < self.acceptance_probability:
             self.suggestion_accepted = True
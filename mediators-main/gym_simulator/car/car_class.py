@@ -1,4 +1,4 @@
-from gym.utils import seeding
+from gym_simulator.utils.utils import GeometricSampler, create_rng
 
 
 class Car:
@@ -12,12 +12,15 @@ class Car:
         the road class such that the car knows on which road it is driving.
         """
         self.config = config
-        self.rng, _ = seeding.np_random(seed)
+        self.rng = create_rng(seed)
         self.road = road
         self.position = 0.0  # Starting position
         self.speed = 0.0  # Initial speed
         self.current_level = config.initial_level  # Initial automation level
         self.timestamp = 0.0  # Initial time
+        # Used instead of drawing a random number in every timestep to decide on a speed change, if geometric sampling
+        # is enabled
+        self.speed_sampler = GeometricSampler(self.rng)
 
     def step(self, timestamp):
         """
@@ -32,7 +35,35 @@ class Car:
         # speed
         else:
             self.speed = self.calculate_speed()
-            self.position = round(self.position + (self.speed / (3600.0 / self.config.timestep)), 5)
+            self.position = self.get_next_position(self.position)
+
+    def get_next_position(self, position):
+        """
+        Returns the position after one timestep, driving at the current speed from the given position.
+        """
+        return round(position + (self.speed / (3600.0 / self.config.timestep)), 5)
+
+    def has_steady_speed(self):
+        """
+        Returns True if the speed is within reach of the target speed, such that it only changes randomly.
+        """
+        return self._get_full_acceleration(self.road.get_target_speed()) is None
+
+    def get_steps_until_speed_change(self):
+        """
+        Returns the number of timesteps until the speed randomly changes (including the current one), given that the
+        speed is steady. Only available if geometric sampling is enabled.
+        """
+        return self.speed_sampler.get_remaining_steps(self._get_speed_change_probability())
+
+    def skip_steps(self, steps, position, timestamp):
+        """
+        Skips steps timesteps in which the speed stays the same, after which the car is at the given position and the
+        last step started at the given timestamp.
+        """
+        self.speed_sampler.skip(steps)
+        self.position = position
+        self.timestamp = timestamp
 
     def get_ttaf(self, level_type="levels", position=None):
         """
@@ -97,18 +128,11 @@ class Car:
         """
         target_speed = self.road.get_target_speed()
         current_speed = self.speed
-        # If the target speed cannot be reached within one timestep with full acceleration, acceleration should be full
-        if target_speed - (current_speed + (self.config.acc_coefficient * self.config.timestep * 3.6)) > \
-                self.config.speed_tolerance:
-            return self.config.acc_coefficient
-        # If the target speed cannot be reached within one timestep with full negative acceleration, acceleration should
-        # be fully negative
-        elif (current_speed - (self.config.acc_coefficient * self.config.timestep * 3.6)) - target_speed > \
-                self.config.speed_tolerance:
-            return -self.config.acc_coefficient
+        full_acceleration = self._get_full_acceleration(target_speed)
+        if full_acceleration is not None:
+            return full_acceleration
         # When the speed is within range target_speed +/- speed_tolerance, only change speed with a small probability
-        elif (self.current_level > "L0" and self.rng.rand() < 0.01) or \
-                (self.current_level == "L0" and self.rng.rand() < 0.02):
+        elif self._changes_speed():
             if current_speed <= target_speed:
                 # If current speed is smaller than target speed, we accelerate
                 max_speed_increase = target_speed + self.config.speed_tolerance - current_speed
@@ -121,3 +145,33 @@ class Car:
                 return self.rng.rand() * max_deceleration
         else:
             return 0
+
+    def _get_full_acceleration(self, target_speed):
+        """
+        Returns the full (positive or negative) acceleration if the target speed cannot be reached within one timestep,
+        else None.
+        """
+        # If the target speed cannot be reached within one timestep with full acceleration, acceleration should be full
+        if target_speed - (self.speed + (self.config.acc_coefficient * self.config.timestep * 3.6)) > \
+                self.config.speed_tolerance:
+            return self.config.acc_coefficient
+        # If the target speed cannot be reached within one timestep with full negative acceleration, acceleration should
+        # be fully negative
+        elif (self.speed - (self.config.acc_coefficient * self.config.timestep * 3.6)) - target_speed > \
+                self.config.speed_tolerance:
+            return -self.config.acc_coefficient
+        return None
+
+    def _changes_speed(self):
+        """
+        Returns True if the speed randomly changes in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.speed_sampler.occurs(self._get_speed_change_probability())
+        return self.rng.rand() < self._get_speed_change_probability()
+
+    def _get_speed_change_probability(self):
+        """
+        Returns the probability per timestep that the speed changes while it's within reach of the target speed.
+        """
+        return 0.01 if self.current_level > "L0" else 0.02
@@ -11,15 +11,7 @@ class ConfigParser:
     """
 
     def __init__(self, config_file, view_file="view.yaml", custom_loc=False):
-        config_dir = os.path.join(ROOT_DIR, 'gym_simulator', 'config')
-        # If custom_loc is True it means run configurations are used, and therefore the files should be taken from
-        # there. Else, the files will be in the default directory defined above.
-        if custom_loc:
-            config_loc = config_file
-            view_loc = view_file
-        else:
-            config_loc = os.path.join(config_dir, 'config_files', config_file)
-            view_loc = os.path.join(config_dir, 'view', view_file)
+        config_loc, ttd_loc, view_loc = ConfigParser.get_locations(config_file, view_file, custom_loc)
 
         with open(config_loc, 'r') as stream:
             try:
@@ -27,7 +19,7 @@ class ConfigParser:
             except yaml.YAMLError as exc:
                 print(exc)
 
-        with open(os.path.join(config_dir, 'ttd_values', 'ttd.yaml'), 'r') as stream:
+        with open(ttd_loc, 'r') as stream:
             try:
                 self.config_map.update(yaml.safe_load(stream))
             except yaml.YAMLError as exc:
@@ -39,6 +31,20 @@ class ConfigParser:
             except yaml.YAMLError as exc:
                 print(exc)
 
+    @staticmethod
+    def get_locations(config_file, view_file="view.yaml", custom_loc=False):
+        """
+        Returns the locations of the config file, the TTD values file and the view file that are parsed.
+        """
+        config_dir = os.path.join(ROOT_DIR, 'gym_simulator', 'config')
+        ttd_loc = os.path.join(config_dir, 'ttd_values', 'ttd.yaml')
+        # If custom_loc is True it means run configurations are used, and therefore the files should be taken from
+        # there. Else, the files will be in the default directory defined above.
+        if custom_loc:
+            return config_file, ttd_loc, view_file
+        return (os.path.join(config_dir, 'config_files', config_file), ttd_loc,
+                os.path.join(config_dir, 'view', view_file))
+
     def parse(self):
         """
         Create an object of the Config class from the parsed YAML files.
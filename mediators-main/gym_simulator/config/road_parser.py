@@ -12,15 +12,7 @@ class RoadParser:
     """
 
     def __init__(self, road_file, include_route_data=False, route_data_file=None, custom_loc=False):
-        # If custom_loc is True it means run configurations are used, and therefore the files should be taken from
-        # there. Else, the files will be in the default directory defined below.
-        if custom_loc:
-            road_loc = road_file
-            route_data_loc = route_data_file
-        else:
-            road_dir = os.path.join(ROOT_DIR, 'gym_simulator', 'config', 'predefined_road')
-            road_loc = os.path.join(road_dir, road_file)
-            route_data_loc = os.path.join(road_dir, route_data_file) if include_route_data else None
+        road_loc, route_data_loc = RoadParser.get_locations(road_file, include_route_data, route_data_file, custom_loc)
 
         with open(road_loc, 'r') as stream:
             try:
@@ -33,6 +25,20 @@ class RoadParser:
             with open(route_data_loc, 'rb') as f:
                 self.route_data = pickle.load(f)
 
+    @staticmethod
+    def get_locations(road_file, include_route_data=False, route_data_file=None, custom_loc=False):
+        """
+        Returns the locations of the road file and the route data file that are parsed. The route data file is only
+        parsed if include_route_data is True.
+        """
+        # If custom_loc is True it means run configurations are used, and therefore the files should be taken from
+        # there. Else, the files will be in the default directory defined below.
+        if custom_loc:
+            return road_file, route_data_file
+        road_dir = os.path.join(ROOT_DIR, 'gym_simulator', 'config', 'predefined_road')
+        route_data_loc = os.path.join(road_dir, route_data_file) if include_route_data else None
+        return os.path.join(road_dir, road_file), route_data_loc
+
     def parse(self, config):
         """
         Create an object of the PresetRoad class from the parsed YAML files.
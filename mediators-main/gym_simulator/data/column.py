@@ -0,0 +1,70 @@
+import copy
+
+import numpy as np
+
+
+class Column:
+    """
+    Growable, typed column of values (one per timestep) backed by a NumPy array. The array is allocated in chunks of
+    chunk_size values, and grows by doubling its number of chunks when it is full, so appending is amortized O(1).
+    values() returns a view on the filled part of the array, which can be passed to NumPy and matplotlib without copying.
+    """
+
+    def __init__(self, dtype, chunk_size=4096, values=()):
+        self.chunk_size = chunk_size
+        self._buffer = np.empty(chunk_size, dtype=dtype)
+        self._length = 0
+        self._shared = False  # True if a snapshot shares the array with this column
+        self.extend(values)
+
+    def append(self, value):
+        if self._length == len(self._buffer):
+            self._grow(self._length + 1)
+        self._buffer[self._length] = value
+        self._length += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buffer.dtype)
+        if self._length + len(values) > len(self._buffer):
+            self._grow(self._length + len(values))
+        self._buffer[self._length:self._length + len(values)] = values
+        self._length += len(values)
+
+    def values(self):
+        """
+        Returns a view on all values in the column. The view is not updated by later appends.
+        """
+        return self._buffer[:self._length]
+
+    def snapshot(self):
+        """
+        Returns a copy of the column in O(1), which shares the array with this column. Values are only appended after
+        the filled part of the array (or to a new array when it grows), so the values of the copy are not changed by
+        later appends. When a value of this column is changed afterwards, the array is copied first (see __setitem__),
+        so the values of the copy are not changed by that either. The copy should not be changed itself.
+        """
+        self._shared = True
+        return copy.copy(self)
+
+    def _grow(self, length):
+        chunks = max(2 * len(self._buffer), length + self.chunk_size - 1) // self.chunk_size
+        buffer = np.empty(chunks * self.chunk_size, dtype=self._buffer.dtype)
+        buffer[:self._length] = self._buffer[:self._length]
+        self._buffer = buffer
+        self._shared = False
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        return self.values()[index]
+
+    def __setitem__(self, index, value):
+        # Copy on write, since the snapshots should keep the values they were taken with
+        if self._shared:
+            self._buffer = self._buffer.copy()
+            self._shared = False
+        self.values()[index] = value
+
+    def __iter__(self):
+        return iter(self.values())
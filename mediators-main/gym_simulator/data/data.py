@@ -1,58 +1,76 @@
+import copy
 import sys
+from bisect import bisect_left, bisect_right
+
+import numpy as np
 
 from gym_simulator.config.allowed_values import RoadEventType
+from gym_simulator.data.column import Column
 from gym_simulator.evaluation.safety_types import SafetyType
+from gym_simulator.utils.utils import level_index
 
 
 class Data:
     """
     Class to hold all (historical) data of the simulation. Currently used for visualisation and result purposes.
+
+    The values of every timestep are stored in Columns (NumPy arrays). Levels are stored as their index including L0
+    (see level_index), where a driver request of None is stored as -1. Other values that are None are stored as NaN.
     """
 
     def __init__(self, env):
-        # Most of the data only needs to be initialized and stored when rendering. Only safety events need to be
-        # logged in all cases because these are documented in the results
-        if env.allow_render:
+        # Most of the data only needs to be initialized and stored when rendering (or when the history is recorded to
+        # render a figure later). Only safety events need to be logged in all cases because these are documented in
+        # the results
+        if env.record_history:
             self.config = env.config
             self.max_automation_levels = env.road.max_automation_levels.levels  # The max automation levels array
             self.optimistic_automation_levels = env.road.max_automation_levels.optimistic_levels
             self.pessimistic_automation_levels = env.road.max_automation_levels.pessimistic_levels
-            self.current_levels = [env.car.current_level]  # Array with current level for each step
-            self.positions = [env.car.position]
-            self.speeds = [env.car.speed]
-            self.times = [env.time_passed]
+            self.current_levels = Column(np.int8, values=[level_index(env.car.current_level, True)])  # Level per step
+            self.positions = Column(np.float64, values=[env.car.position])
+            self.speeds = Column(np.float64, values=[env.car.speed])
+            self.times = Column(np.float64, values=[env.time_passed])
             self.road_parts = env.road.road_parts  # The road parts
             self.road_length = env.road.total_distance
             self.estimated_total_time = env.road.estimated_total_time
-            self._update_events(env)
+            self._init_events(env)
 
             self.ttaf = self._init_ttaf(env)
             self.optimistic_ttaf = self._init_ttaf(env, "optimistic_levels")
             self.pessimistic_ttaf = self._init_ttaf(env, "pessimistic_levels")
-            self.real_ttaf = {
-                "L2": [],
-                "L3": [],
-                "L4": []
+            self._real_ttaf = {
+                "L2": Column(np.float64),
+                "L3": Column(np.float64),
+                "L4": Column(np.float64)
             }
-            self.real_route_ttaf_l2 = [env.car.get_parsed_ttaf_l2()]
+            self.real_route_ttaf_l2 = Column(np.float64, values=[_none_to_nan(env.car.get_parsed_ttaf_l2())])
 
             self.ttau = self._init_ttau(env)
             self.optimistic_ttau = self._init_ttau(env, "optimistic_levels")
             self.pessimistic_ttau = self._init_ttau(env, "pessimistic_levels")
-            self.real_ttau = {
-                "L2": [],
-                "L3": [],
-                "L4": []
+            self._real_ttau = {
+                "L2": Column(np.float64),
+                "L3": Column(np.float64),
+                "L4": Column(np.float64)
             }
-            self.real_route_ttau_l2 = [env.car.get_parsed_ttau_l2()]
-
-            self._update_driver_events(env)
-            self.fatigue = [env.driver.fatigue]  # Fatigue history
-            self.distraction = [env.driver.distraction if env.driver.ndrt == 0 else None]  # Distraction history
-            self.driver_request = [env.driver.driver_request]
-            self.ndrt = [env.driver.ndrt if env.driver.ndrt > 0 else None]  # NDRT history
-            self.ttdf = [self.estimated_total_time if env.driver.ttdf == sys.maxsize else env.driver.ttdf]  # TTDF history
-            self.ttdu = [self.estimated_total_time if env.driver.ttdu == sys.maxsize else env.driver.ttdu]  # TTDU history
+            self.real_route_ttau_l2 = Column(np.float64, values=[_none_to_nan(env.car.get_parsed_ttau_l2())])
+
+            # The number of steps for which the real TTAF and TTAU have been calculated, see _update_real_tta
+            self.real_tta_length = 1
+            self.done = env.done  # Whether the simulation was done in the last update
+
+            self._init_driver_events(env)
+            self.fatigue = Column(np.int8, values=[env.driver.fatigue])  # Fatigue history
+            # Distraction history
+            self.distraction = Column(np.float32, values=[env.driver.distraction if env.driver.ndrt == 0 else np.nan])
+            self.driver_request = Column(np.int8, values=[_request_index(env.driver.driver_request)])
+            self.ndrt = Column(np.float32, values=[env.driver.ndrt if env.driver.ndrt > 0 else np.nan])  # NDRT history
+            # TTDF and TTDU history
+            self.ttdf = Column(np.float64, values=[
+                self.estimated_total_time if env.driver.ttdf == sys.maxsize else env.driver.ttdf])
+            self.ttdu = Column(np.float64, values=[
+                self.estimated_total_time if env.driver.ttdu == sys.maxsize else env.driver.ttdu])
             self.actions = {}  # Action history
             self.future_actions = {}  # Future actions
             self.evaluation = {}
@@ -61,42 +79,38 @@ class Data:
                 self.evaluation[safety_type] = {'start': [], 'end': []}
                 self.last_step_was_active[safety_type] = False
 
-        self._update_safety_events(env)
+        self._init_safety_events(env)
 
     def update(self, env):
         """
         Update necessary data for current timestep.
         """
-        if env.allow_render:
+        if env.record_history:
             self.max_automation_levels = env.road.max_automation_levels.levels
             self.optimistic_automation_levels = env.road.max_automation_levels.optimistic_levels
             self.pessimistic_automation_levels = env.road.max_automation_levels.pessimistic_levels
-            self.current_levels.append(env.car.current_level)
+            self.current_levels.append(level_index(env.car.current_level, True))
             self.positions.append(env.car.position)
             self.speeds.append(env.car.speed)
             self.times.append(env.time_passed)
-            self._update_events(env)
 
             self._update_ttaf(env, self.ttaf)
             self._update_ttaf(env, self.optimistic_ttaf, "optimistic_levels")
             self._update_ttaf(env, self.pessimistic_ttaf, "pessimistic_levels")
-            self.real_route_ttaf_l2.append(env.car.get_parsed_ttaf_l2())
+            self.real_route_ttaf_l2.append(_none_to_nan(env.car.get_parsed_ttaf_l2()))
 
             self._update_ttau(env, self.ttau)
             self._update_ttau(env, self.optimistic_ttau, "optimistic_levels")
             self._update_ttau(env, self.pessimistic_ttau, "pessimistic_levels")
-            self.real_route_ttau_l2.append(env.car.get_parsed_ttau_l2())
-
-            self._update_real_tta(env)
+            self.real_route_ttau_l2.append(_none_to_nan(env.car.get_parsed_ttau_l2()))
+            self.done = env.done
 
-            self._update_driver_events(env)
             self.fatigue.append(env.driver.fatigue)
-            self.distraction.append(env.driver.distraction if env.driver.ndrt == 0 else None)
-            self.driver_request.append(env.driver.driver_request)
-            self.ndrt.append(env.driver.ndrt if env.driver.ndrt > 0 or (self.ndrt[-1] is not None and self.ndrt[-1] > 0)
-                             else None)
-            if self.ndrt[-1] is not None and self.ndrt[-1] > 0 and \
-                    self.distraction[-2] is not None and self.distraction[-2] == 0:
+            self.distraction.append(env.driver.distraction if env.driver.ndrt == 0 else np.nan)
+            self.driver_request.append(_request_index(env.driver.driver_request))
+            # Comparisons with NaN are always False
+            self.ndrt.append(env.driver.ndrt if env.driver.ndrt > 0 or self.ndrt[-1] > 0 else np.nan)
+            if self.ndrt[-1] > 0 and self.distraction[-2] == 0:
                 self.ndrt[-2] = 0
             self.ttdf.append(env.driver.ttdf)
             self.ttdu.append(env.driver.ttdu)
@@ -117,14 +131,33 @@ class Data:
                     self.future_actions[key] = [future_action]
             self._update_evaluation(env)
 
-        self._update_safety_events(env)
+    def snapshot(self):
+        """
+        Returns a copy of the data that is not changed by later updates, so it can be read by another thread (e.g. by
+        the Viewer) while the simulation continues. Columns are copied in O(1) (see Column.snapshot), and the lists
+        and dictionaries that are changed by updates are copied shallowly, so the time it takes does not depend on the
+        number of steps.
+        """
+        # The real TTAF and TTAU are calculated here, so they are not calculated on the copy
+        self._update_real_tta()
+        snapshot = copy.copy(self)
+        for name, value in vars(self).items():
+            if name != "config":
+                setattr(snapshot, name, _snapshot(value))
+        # Events that are still pending are changed by later updates (e.g. their end), which is only possible for the
+        # latest event of every kind, so these are copied as well
+        for name in ("actions", "future_actions", "driver_events", "safety_events"):
+            for events in getattr(snapshot, name, {}).values():
+                if events:
+                    events[-1] = copy.copy(events[-1])
+        return snapshot
 
     def _init_ttaf(self, env, level_type="levels"):
         ttaf = env.car.get_ttaf(level_type)
         return {  # Dictionary with history of TTAF for all automation levels
-            "L2": [ttaf[0]],
-            "L3": [ttaf[1]],
-            "L4": [ttaf[2]]
+            "L2": Column(np.float64, values=[ttaf[0]]),
+            "L3": Column(np.float64, values=[ttaf[1]]),
+            "L4": Column(np.float64, values=[ttaf[2]])
         }
 
     def _update_ttaf(self, env, ttaf_history, level_type="levels"):
@@ -136,9 +169,9 @@ class Data:
     def _init_ttau(self, env, level_type="levels"):
         ttau = env.car.get_ttau(level_type)
         return {  # Dictionary with history of TTAU for all automation levels
-            "L2": [ttau[0]],
-            "L3": [ttau[1]],
-            "L4": [ttau[2]]
+            "L2": Column(np.float64, values=[ttau[0]]),
+            "L3": Column(np.float64, values=[ttau[1]]),
+            "L4": Column(np.float64, values=[ttau[2]])
         }
 
     def _update_ttau(self, env, ttau_history, level_type="levels"):
@@ -147,60 +180,117 @@ class Data:
         ttau_history["L3"].append(ttau[1])
         ttau_history["L4"].append(ttau[2])
 
-    def _update_real_tta(self, env):
-        # Calculates the real TTAF and TTAU values after a relevant maximum level change occurs, by calculating
-        # how long the previous piece of road took to drive
-        if len(self.positions) < 2:
+    @property
+    def real_ttaf(self):
+        """
+        Dictionary with the history of the real TTAF for all automation levels, which is calculated when it's needed.
+        """
+        self._update_real_tta()
+        return self._real_ttaf
+
+    @property
+    def real_ttau(self):
+        """
+        Dictionary with the history of the real TTAU for all automation levels, which is calculated when it's needed.
+        """
+        self._update_real_tta()
+        return self._real_ttau
+
+    def _update_real_tta(self):
+        """
+        Calculates the real TTAF and TTAU values for the steps that were added since the last call. The values are
+        calculated after every relevant maximum level change, by calculating how long the previous piece of road took
+        to drive. The result is the same as when the values are calculated in every update.
+        """
+        length = len(self.positions)
+        if length <= self.real_tta_length:
             return
+        max_levels = self.max_automation_levels
+        ends = [entry[1] for entry in max_levels]
+        positions = self.positions.values()
+        # In the last step of a simulation that is done, all remaining values are calculated (see _add_real_tta)
+        last_step = length - 1 if self.done else length
 
-        max_levels = env.road.max_automation_levels.levels
-        prev_position = self.positions[-2]
-        cur_position = self.positions[-1]
-        # Indicates a max available level change, so real TTAF for previous part can be calculated
-        if any(prev_position < entry[1] < cur_position for entry in max_levels) or env.done:
+        # A maximum level changes in step i if positions[i - 1] < end < positions[i]
+        first_index = bisect_right(ends, positions[self.real_tta_length - 1])
+        last_index = bisect_left(ends, positions[last_step - 1])
+        starts = self._get_real_tta_starts(max_levels, last_index)
+        for index in range(first_index, last_index):
+            if positions[np.searchsorted(positions, ends[index])] > ends[index]:
+                self._add_real_tta(max_levels, index, starts[index], False, None)
+
+        if self.done:
+            prev_position = positions[-2]
+            cur_position = positions[-1]
             indices = [i for i, entry in enumerate(max_levels) if prev_position < entry[1] < cur_position]
-            if len(indices) == 0 and env.done:
-                indices = [next(i + 1 if i < len(max_levels) - 1 else i for i, entry in enumerate(max_levels) if entry[1] < cur_position and
+            if len(indices) == 0:
+                indices = [next(i + 1 if i < len(max_levels) - 1 else i for i, entry in enumerate(max_levels) if
+                                entry[1] < cur_position and
                                 (i == len(max_levels) - 1 or cur_position < max_levels[i + 1][1]))]
+            starts = self._get_real_tta_starts(max_levels, max(indices) + 1)
             for index in indices:
-                cur_max_level = max_levels[index][0]
-                next_max_level = None if index >= len(max_levels) - 1 or env.done else max_levels[index + 1][0]
-                for level in ["L2", "L3", "L4"]:
-                    if next_max_level is None or env.done or cur_max_level >= level > next_max_level \
-                            or cur_max_level < level <= next_max_level:
-                        if cur_max_level >= level:
-                            start = next((max_level[1] for max_level in reversed(max_levels[:index])
-                                          if max_level[0] < level), 0.0)
-                        else:
-                            start = next((max_level[1] for max_level in reversed(max_levels[:index])
-                                          if max_level[0] >= level), 0.0)
-                        end = max_levels[index][1] if not env.done else cur_position
-                        start_position_index = next(i for i, pos in enumerate(self.positions) if pos >= start)
-                        end_position_index = next(i for i, pos in enumerate(self.positions) if pos >= end)
-
-                        time_passed_end = self.times[end_position_index]
-                        if end >= self.road_length or env.done:
-                            end_position_index += 1
-
-                        for i, position in enumerate(self.positions[start_position_index:end_position_index]):
-                            start_time_passed_index = start_position_index + i
-                            if cur_max_level < level:
-                                self.real_ttau[level].append(0)
-                            elif index == len(max_levels) - 1 and cur_max_level >= level:
-                                self.real_ttau[level].append(sys.maxsize)
-                            else:
-                                self.real_ttau[level].append(
-                                    round(time_passed_end - self.times[start_time_passed_index], 2))
-
-                            if cur_max_level >= level:
-                                self.real_ttaf[level].append(0)
-                            elif index == len(max_levels) - 1 and cur_max_level < level:
-                                self.real_ttaf[level].append(sys.maxsize)
-                            else:
-                                self.real_ttaf[level].append(
-                                    round(time_passed_end - self.times[start_time_passed_index], 2))
-
-    def _update_events(self, env):
+                self._add_real_tta(max_levels, index, starts[index], True, cur_position)
+        self.real_tta_length = length
+
+    @staticmethod
+    def _get_real_tta_starts(max_levels, count):
+        """
+        Returns for the first count max levels and for every level, the end of the last previous max level below the
+        level, and the end of the last previous max level that is at least the level (0.0 if there is none).
+        """
+        starts = []
+        below = {"L2": 0.0, "L3": 0.0, "L4": 0.0}
+        at_least = {"L2": 0.0, "L3": 0.0, "L4": 0.0}
+        for max_level, end in max_levels[:count]:
+            starts.append((dict(below), dict(at_least)))
+            for level in ["L2", "L3", "L4"]:
+                if max_level < level:
+                    below[level] = end
+                else:
+                    at_least[level] = end
+        return starts
+
+    def _add_real_tta(self, max_levels, index, starts, done, cur_position):
+        """
+        Adds the real TTAF and TTAU values for the piece of road before the max level with the given index, for the
+        levels whose availability changes at the end of the max level. starts holds the starts of these pieces of road.
+        """
+        cur_max_level = max_levels[index][0]
+        next_max_level = None if index >= len(max_levels) - 1 or done else max_levels[index + 1][0]
+        below, at_least = starts
+        for level in ["L2", "L3", "L4"]:
+            if next_max_level is None or done or cur_max_level >= level > next_max_level \
+                    or cur_max_level < level <= next_max_level:
+                start = below[level] if cur_max_level >= level else at_least[level]
+                end = max_levels[index][1] if not done else cur_position
+                # The positions are non-decreasing, so this is the first index with a position >= start
+                start_position_index = int(np.searchsorted(self.positions.values(), start))
+                end_position_index = int(np.searchsorted(self.positions.values(), end))
+
+                time_passed_end = float(self.times[end_position_index])
+                if end >= self.road_length or done:
+                    end_position_index += 1
+
+                times = self.times.values()[start_position_index:end_position_index].tolist()
+                times_left = [round(time_passed_end - time_passed, 2) for time_passed in times]
+                if cur_max_level < level:
+                    self._real_ttau[level].extend(np.zeros(len(times)))
+                elif index == len(max_levels) - 1 and cur_max_level >= level:
+                    self._real_ttau[level].extend(np.full(len(times), sys.maxsize, dtype=np.float64))
+                else:
+                    self._real_ttau[level].extend(times_left)
+
+                if cur_max_level >= level:
+                    self._real_ttaf[level].extend(np.zeros(len(times)))
+                elif index == len(max_levels) - 1 and cur_max_level < level:
+                    self._real_ttaf[level].extend(np.full(len(times), sys.maxsize, dtype=np.float64))
+                else:
+                    self._real_ttaf[level].extend(times_left)
+
+    def _init_events(self, env):
+        """
+        Sorts the road events by type and name. New events are added by _add_road_event.
+        """
         self.road_events = {  # Dictionary with static and dynamic road events
             "static": {},
             "dynamic": {}
@@ -212,17 +302,33 @@ class Data:
             self.road_events["dynamic"][allowed_dynamic_event] = []
 
         for event in env.road.event_manager.events:
-            if event.event_type == RoadEventType.STATIC:
-                self.road_events["static"][event.name].append(event)
-            elif event.event_type == RoadEventType.DYNAMIC:
-                self.road_events["dynamic"][event.name].append(event)
+            self._add_road_event(event)
+        env.road.event_manager.add_event_listener(self._add_road_event)
 
-    def _update_driver_events(self, env):
+    def _add_road_event(self, event):
+        if event.event_type == RoadEventType.STATIC:
+            events = self.road_events["static"][event.name]
+        elif event.event_type == RoadEventType.DYNAMIC:
+            events = self.road_events["dynamic"][event.name]
+        else:
+            return
+        # Keep the events in the same order as the events of the event manager, which are sorted by their start
+        index = next((i for i, other in enumerate(events) if other.start > event.start), len(events))
+        events.insert(index, event)
+
+    def _init_driver_events(self, env):
+        """
+        Sorts the driver events by type. New events are added by _add_driver_event.
+        """
         self.driver_events = {}
         for allowed_driver_event in self.config.allowed_driver_events:
             self.driver_events[allowed_driver_event] = []
         for event in env.driver.all_events:
-            self.driver_events[event.get_enum()].append(event)
+            self._add_driver_event(event)
+        env.driver.add_event_listener(self._add_driver_event)
+
+    def _add_driver_event(self, event):
+        self.driver_events[event.get_enum()].append(event)
 
     def _update_evaluation(self, env):
         safety_events = env.safety
@@ -238,9 +344,34 @@ class Data:
                 self.evaluation[safety_type]['end'][-1] = self.positions[-1]
             self.last_step_was_active[safety_type] = current_step_is_active
 
-    def _update_safety_events(self, env):
+    def _init_safety_events(self, env):
+        """
+        Sorts the safety events by name. New events are added by _add_safety_event.
+        """
         self.safety_events = {}
         for possible_event in env.safety.possible_events:
             self.safety_events[possible_event.get_name()] = []
         for event in env.safety.all_events:
-            self.safety_events[event.name].append(event)
+            self._add_safety_event(event)
+        env.safety.add_event_listener(self._add_safety_event)
+
+    def _add_safety_event(self, event):
+        self.safety_events[event.name].append(event)
+
+
+def _snapshot(value):
+    if isinstance(value, Column):
+        return value.snapshot()
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _none_to_nan(value):
+    return np.nan if value is None else value
+
+
+def _request_index(request):
+    return -1 if request is None else level_index(request, True)
@@ -1,4 +1,4 @@
-from gym.utils import seeding
+from gym_simulator.utils.utils import create_rng
 
 from gym_simulator.config.allowed_values import DriverEvent
 from gym_simulator.events.driver_events.distraction import Distraction
@@ -20,7 +20,7 @@ class Driver:
             calculation of possible driver events.
         """
         self.config = config
-        self.rng, _ = seeding.np_random(seed)
+        self.rng = create_rng(seed)
         self.car = car
         self.timestep = config.timestep
         self.fatigue = config.initial_fatigue
@@ -35,6 +35,7 @@ class Driver:
         self.driver_event_generator = DriverEventGenerator(self.config, self.rng, estimated_total_time)
         self.pending_events = []  # Active driver events
         self.all_events = []  # Keeps track of all events that occurred during the simulation, for visualisation
+        self.event_listeners = []  # Functions that are called with every new event
         # Keeps track for each shift level of the last time a suggestions to that level was declined
         self.last_decline = {'L0': None, 'L2': None, 'L3': None, 'L4': None}
 
@@ -63,8 +64,7 @@ class Driver:
         # Possibly generates a new driver event
         new_event = self.driver_event_generator.generate_next_event(self.car, self.pending_events)
         if new_event:
-            self.all_events.append(new_event)
-            self.pending_events.append(new_event)
+            self._add_event(new_event)
         # Step through the pending events, and update the list afterwards (possibly some aren't pending anymore)
         for event in self.pending_events:
             event.step(self, self.car)
@@ -97,8 +97,7 @@ class Driver:
                 self.update_distraction = True
                 break
         if ndrt:
-            self.pending_events.append(ndrt)
-            self.all_events.append(ndrt)
+            self._add_event(ndrt)
 
     def convert_ndrt_to_distraction(self):
         """
@@ -117,8 +116,19 @@ class Driver:
                 self.update_distraction = True
                 break
         if distraction:
-            self.pending_events.append(distraction)
-            self.all_events.append(distraction)
+            self._add_event(distraction)
+
+    def add_event_listener(self, listener):
+        """
+        Adds a function that is called with every new driver event.
+        """
+        self.event_listeners.append(listener)
+
+    def _add_event(self, event):
+        self.all_events.append(event)
+        self.pending_events.append(event)
+        for listener in self.event_listeners:
+            listener(event)
 
     def end_events(self, end, event_type):
         """
@@ -167,13 +177,7 @@ class Driver:
         if self.update_fatigue:
             self.ttdu_fatigue = self._fatigue_ttdu()
         else:
-            # If no update necessary, either decrement TTDU by one timestep, unless it's zero, then keep it at zero
-            self.ttdu_fatigue = max(0, self.ttdu_fatigue - self.timestep)
-            # Possibly update fatigue level based on TTDU such that ttdu_fatigue and fatigue level are always congruous
-            if self.ttdu_fatigue <= self.config.ttdu['fatigue'][self.car.current_level][4]:
-                self.fatigue = 4
-            elif self.ttdu_fatigue <= self.config.ttdu['fatigue'][self.car.current_level][self.fatigue + 1]:
-                self.fatigue = self.fatigue + 1
+            self.ttdu_fatigue, self.fatigue = self._decrement_fatigue_ttdu(self.ttdu_fatigue)
 
         # Distraction level changed and thus ttdu_distraction needs to be updated
         if self.update_distraction:
@@ -196,6 +200,53 @@ class Driver:
         self.update_fatigue = False
         self.update_distraction = False
 
+    def _decrement_fatigue_ttdu(self, ttdu_fatigue):
+        """
+        Returns the TTDU based on fatigue one timestep after ttdu_fatigue, together with the fatigue level belonging to
+        it.
+        """
+        # If no update necessary, either decrement TTDU by one timestep, unless it's zero, then keep it at zero
+        ttdu_fatigue = max(0, ttdu_fatigue - self.timestep)
+        # Possibly update fatigue level based on TTDU such that ttdu_fatigue and fatigue level are always congruous
+        if ttdu_fatigue <= self.config.ttdu['fatigue'][self.car.current_level][4]:
+            return ttdu_fatigue, 4
+        elif ttdu_fatigue <= self.config.ttdu['fatigue'][self.car.current_level][self.fatigue + 1]:
+            return ttdu_fatigue, self.fatigue + 1
+        return ttdu_fatigue, self.fatigue
+
+    def get_future_ttdu(self):
+        """
+        Yields the TTDU after each of the next timesteps, given that no driver events happen or change, for as long as
+        the fatigue level stays the same.
+        """
+        ttdu_fatigue = self.ttdu_fatigue
+        ttdu_distraction = self.ttdu_distraction
+        while True:
+            ttdu_fatigue, fatigue = self._decrement_fatigue_ttdu(ttdu_fatigue)
+            if fatigue != self.fatigue:
+                return
+            ttdu_distraction = max(0, ttdu_distraction - self.timestep)
+            yield min(ttdu_fatigue, ttdu_distraction, self.ttdu_ndrt)
+
+    def get_steps_until_next_event(self):
+        """
+        Returns the number of timesteps until a driver event is generated or a pending driver event changes something
+        (including the current one).
+        """
+        return min([self.driver_event_generator.get_steps_until_next_event(self.pending_events)] +
+                   [event.get_steps_until_change(self, self.car) for event in self.pending_events])
+
+    def skip_steps(self, steps):
+        """
+        Skips steps timesteps in which no driver events happen or change and the fatigue level stays the same, so only
+        the TTDU decreases. The car should already be at its new position.
+        """
+        self.driver_event_generator.skip_steps(steps, self.pending_events)
+        for event in self.pending_events:
+            event.skip_steps(steps, self.car.position)
+        for _ in range(steps):
+            self._update_ttdu()
+
     def _distraction_ttdu(self):
         """
         Returns the TTDU value in the YAML file belonging to current distraction level
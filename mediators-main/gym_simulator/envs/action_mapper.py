@@ -6,7 +6,7 @@ from gym_simulator.actions.enforce_shift_level import EnforceShiftLevel
 from gym_simulator.actions.prepare_driver import PrepareDriver
 from gym_simulator.actions.suggest_shift_level import SuggestShiftLevel
 
-from gym.utils import seeding
+from gym_simulator.utils.utils import create_rng
 
 
 class ActionMapper:
@@ -37,7 +37,7 @@ class ActionMapper:
         """
         Create a new random nummer generator.
         """
-        self.rng, _ = seeding.np_random(seed)
+        self.rng = create_rng(seed)
 
     def get_action_string(self, i):
         """
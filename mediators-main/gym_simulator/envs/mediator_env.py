@@ -1,4 +1,8 @@
+import os
+from itertools import islice
+
 import gym
+import numpy as np
 from gym import spaces
 
 from gym_simulator.car.car_class import Car
@@ -10,6 +14,7 @@ from gym_simulator.envs.observations.observation_manager import ObservationManag
 from gym_simulator.envs.reward.reward_factory import RewardFactory
 from gym_simulator.evaluation.evaluation import EvaluationMetrics
 from gym_simulator.evaluation.safety_events import SafetyEvents
+from gym_simulator.io.trace import TraceRecorder
 from gym_simulator.roads.road import Road
 from gym_simulator.data.data import Data
 from mediator_system.preferences.preferences_parser import PreferencesParser
@@ -24,9 +29,16 @@ class MediatorEnv(gym.Env):
     metadata = {"render.modes": ["human"]}
 
     def __init__(self, config_file, driver_preferences_file, view_file, use_run_configurations=False, road_file=None,
-                 include_road_data=False, route_data_file=None, render=True, rl_settings_file=None):
+                 include_road_data=False, route_data_file=None, render=True, rl_settings_file=None, trace_dir=None,
+                 record_history=False):
         """
         Initializes everything related to the environment.
+
+        If trace_dir is defined, the state of every step is recorded in a trace file per seed in this directory (see
+        TraceRecorder).
+
+        If render or record_history is True, the history of the simulation is kept in Data, so the plots of a run can be
+        rendered (possibly after it finished, see render_figure).
         """
         # Holds all settings for the simulation
         self.config = ConfigParser(config_file, view_file, use_run_configurations).parse()
@@ -41,6 +53,9 @@ class MediatorEnv(gym.Env):
             self.config) if road_file is not None else None
         self.action_mapper = ActionMapper(self.config.available_actions)  # Used for initializing actions
         self.allow_render = render  # If True, plots visualizing the simulation will be rendered
+        self.record_history = render or record_history  # If True, the history of the simulation is kept in Data
+        self.trace_dir = trace_dir  # If defined, the directory in which a trace of every run is recorded
+        self.trace_recorder = None  # Records the trace of the current run
 
         self.road = None  # Road object
         self.car = None  # Car object
@@ -66,6 +81,8 @@ class MediatorEnv(gym.Env):
 
         self.current_seed = None  # The seed used for the simulation
         self.done = False  # When True, the current simulation terminates
+        self.next_fast_forward_step = 0  # The first step at which fast forwarding is attempted again
+        self.fast_forward_backoff = 1  # The number of steps to wait after a failed attempt to fast forward
 
         # Action space used for gym environment
         # self.action_space = spaces.Discrete(len(self.action_mapper.available_actions), self.current_seed)
@@ -77,7 +94,7 @@ class MediatorEnv(gym.Env):
             # Used to calculate rewards based on current state
             self.reward_calculator = RewardFactory(self.rl_settings).get_reward_calculator(self)
 
-        self.cur_worker = None  # The thread that the environment is running in, which emits a signal to the viewer
+        self.cur_worker = None  # The thread that the environment is running in, which pushes snapshots to the viewer
 
     def step(self, gym_action):
         """
@@ -125,6 +142,11 @@ class MediatorEnv(gym.Env):
         self.done = self.done or self.car.position >= self.road.total_distance
         if self.done:
             self.evaluation.finalize(self.data, self.time_passed)
+        if self.trace_recorder is not None:
+            self.trace_recorder.record(self, gym_action)
+            if self.done:
+                self.trace_recorder.close()
+                self.trace_recorder = None
 
         self.action_args = {}
         if self.rl_settings:
@@ -132,6 +154,74 @@ class MediatorEnv(gym.Env):
         else:
             return {}, None, self.done, {}
 
+    def fast_forward(self, mediator):
+        """
+        If fast_forward is set in the config, skips all upcoming steps in which nothing happens. This is the case when no
+        action is pending, no safety event is active, the speed of the car is steady, the active driver and road events
+        don't change, and the mediator returns DN. Steps are skipped up to the next position where something on the road
+        changes, the next change of the fatigue level, the TTDU becoming zero, or the next random event, which is
+        known in advance with geometric sampling. The state after skipping is identical to the state after taking the
+        same steps one by one.
+
+        Returns the number of skipped steps.
+        """
+        if self.steps < self.next_fast_forward_step or not self._is_quiet():
+            return 0
+
+        # Only the position, the time passed and the TTDU change in the steps that can be skipped
+        max_steps = min(self.car.get_steps_until_speed_change(), self.driver.get_steps_until_next_event(),
+                        self.road.get_steps_until_next_event()) - 1
+        if max_steps < 2:
+            return 0
+        next_change = self.road.get_next_change(self.car.position)
+        positions = [self.car.position]
+        times = [self.time_passed]
+        ttdus = [self.driver.ttdu]
+        for ttdu in islice(self.driver.get_future_ttdu(), max_steps):
+            position = self.car.get_next_position(positions[-1])
+            if position >= next_change or (ttdu == 0 and self.car.current_level < "L3"):
+                break
+            positions.append(position)
+            times.append(times[-1] + self.config.timestep)
+            ttdus.append(ttdu)
+
+        steps = len(positions) - 1
+        if steps < 2:
+            return 0
+        # The mediator should return DN in every skipped step, so in the states before the last step
+        while steps > 1 and not mediator.is_idle_until(self, positions[steps - 1], times[steps - 1], ttdus[steps - 1]):
+            steps //= 2
+        if steps < 2:
+            # Wait longer after every time the mediator might not return DN, so it isn't checked in every step
+            self.fast_forward_backoff = min(2 * self.fast_forward_backoff, 64)
+            self.next_fast_forward_step = self.steps + self.fast_forward_backoff
+            return 0
+        self.fast_forward_backoff = 1
+
+        self.car.skip_steps(steps, positions[steps], times[steps - 1])
+        self.driver.skip_steps(steps)
+        self.road.skip_steps(steps, self.car)
+        self.safety.time_passed = times[steps - 1]
+        self.evaluation.skip_steps(steps, self.car.current_level)
+        self.steps += steps
+        self.time_passed = times[steps]
+        self.last_action = None
+        self.switched = False
+        self.action_ended = False
+        self.resolved_action = None
+        self.action_args = {}
+        return steps
+
+    def _is_quiet(self):
+        """
+        Returns True if fast forwarding is possible, and nothing happens in the current step apart from the car driving
+        and the TTDU decreasing, given that the mediator returns DN.
+        """
+        return self.config.fast_forward and self.config.geometric_sampling and not self.record_history and \
+            self.trace_recorder is None and not self.rl_settings and not self.done and \
+            (self.preset_road is None or not self.preset_road.includes_route_data()) and \
+            self.pending_action is None and not self.safety.active_events and self.car.has_steady_speed()
+
     def _update(self):
         if self.preset_road is not None and self.preset_road.includes_route_data() and \
                 self.steps >= len(self.preset_road.route_data['timestamps']):
@@ -166,14 +256,15 @@ class MediatorEnv(gym.Env):
         else:
             self.current_seed = self.current_seed + 1
 
-        self.road = Road(self.config, self.current_seed + 1, self.preset_road)
-        self.car = Car(self.config, self.current_seed + 2, self.road)
-        self.driver = Driver(self.config, self.current_seed + 3, self.car, self.road.estimated_total_time)
+        road_seed, car_seed, driver_seed, action_seed = self.get_component_seeds()
+        self.road = Road(self.config, road_seed, self.preset_road)
+        self.car = Car(self.config, car_seed, self.road)
+        self.driver = Driver(self.config, driver_seed, self.car, self.road.estimated_total_time)
         self.safety = SafetyEvents(self.config, self.driver, self.car)
         self.evaluation = EvaluationMetrics(self.config, self.safety)
 
         self.pending_action = None
-        self.action_mapper.reset_rng(self.current_seed + 4)
+        self.action_mapper.reset_rng(action_seed)
         self.action_ended = False
 
         # Other variables
@@ -183,8 +274,30 @@ class MediatorEnv(gym.Env):
 
         self.data = Data(self)
         self.done = False
+        if self.trace_recorder is not None:
+            # The previous run was not finished
+            self.trace_recorder.close()
+            self.trace_recorder = None
+        if self.trace_dir is not None:
+            self.trace_recorder = TraceRecorder(os.path.join(self.trace_dir, "{0}.trace".format(self.current_seed)))
+            self.trace_recorder.record(self)
+        self.next_fast_forward_step = 0
+        self.fast_forward_backoff = 1
         return self.get_observations() if self.rl_settings else {}
 
+    def get_component_seeds(self):
+        """
+        Returns the seeds of the road, car, driver and action mapper of the current run.
+
+        If seed_streams is set in the config, these are independent streams spawned from a SeedSequence of the seed of
+        the run, so the random numbers of a run only depend on its own seed. Else, they are the seed of the run plus 1
+        to 4, which means that the streams of neighbouring runs overlap (e.g. the car of a run uses the same seed as the
+        road of the next run).
+        """
+        if self.config.seed_streams:
+            return np.random.SeedSequence(self.current_seed).spawn(4)
+        return [self.current_seed + i for i in range(1, 5)]
+
     def render(self, mode="human"):
         """
         Possibly renders the simulation.
@@ -193,6 +306,6 @@ class MediatorEnv(gym.Env):
         """
         if self.allow_render and ((self.config.render_intermediate and self.car.position >= self.config.start_from and
                                    self.time_passed % self.config.render_interval == 0) or self.done):
-            self.cur_worker.sig_render.emit()
+            self.cur_worker.push_snapshot()
             return True
         return False
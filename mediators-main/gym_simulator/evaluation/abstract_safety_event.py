@@ -4,7 +4,8 @@ from abc import abstractmethod
 class AbstractSafetyEvent:
     """
     Abstract class for any event that needs evaluation (see the directories in this directory). Any such event needs to
-    inherit from this class.
+    inherit from this class. Every event also defines a static check method, which returns whether the event is active
+    without creating it (see safety_factory).
     """
 
     def __init__(self, config, car, unsafety_type, name):
@@ -12,7 +12,11 @@ class CarUnfit(AbstractSafetyEvent):
         super().__init__(config, car, SafetyType.CRITICAL, CarUnfit.get_name())
 
     def is_active(self):
-        return self.car.current_level > self.car.road.current_max_level
+        return CarUnfit.check(self.car)
+
+    @staticmethod
+    def check(car):
+        return car.current_level > car.road.current_max_level
 
     @staticmethod
     def get_name():
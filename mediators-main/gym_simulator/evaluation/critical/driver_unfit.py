@@ -13,7 +13,11 @@ class DriverUnfit(AbstractSafetyEvent):
         self.driver = driver
 
     def is_active(self):
-        return self.car.current_level < "L3" and self.driver.ttdu == 0
+        return DriverUnfit.check(self.car, self.driver)
+
+    @staticmethod
+    def check(car, driver):
+        return car.current_level < "L3" and driver.ttdu == 0
 
     @staticmethod
     def get_name():
@@ -92,6 +92,24 @@ class EvaluationMetrics:
             # If an action ended or is pending, update the timestamp of the last action
             self.time_of_last_action = cur_time
 
+    def skip_steps(self, steps, current_level):
+        """
+        Takes steps evaluation steps at once, in which no action is taken or pending and no safety event is active, so
+        only the time driven in the current level increases.
+
+        If the timestep and the time driven are whole numbers (e.g. with the default timestep of 1 second), adding the
+        timestep is exact, so the time of all steps is added at once. Else, the timestep is added once per step, since
+        adding the time at once can give a slightly different float than taking the steps one by one.
+        """
+        timestep = self.config.timestep
+        time_driven = self.time_driven_in_level[current_level]
+        if float(timestep).is_integer() and float(time_driven).is_integer() and \
+                time_driven + steps * timestep < 2 ** 53:
+            self.time_driven_in_level[current_level] = time_driven + steps * timestep
+            return
+        for _ in range(steps):
+            self.time_driven_in_level[current_level] = self.time_driven_in_level[current_level] + timestep
+
     def finalize(self, data, time_passed):
         """
         Calculates several averages when the simulation has finished.
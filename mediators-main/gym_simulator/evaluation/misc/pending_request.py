@@ -12,7 +12,11 @@ class PendingRequest(AbstractSafetyEvent):
         self.driver = driver
 
     def is_active(self):
-        return self.driver.driver_request is not None and not self.car.current_level == self.driver.driver_request
+        return PendingRequest.check(self.car, self.driver)
+
+    @staticmethod
+    def check(car, driver):
+        return driver.driver_request is not None and not car.current_level == driver.driver_request
 
     @staticmethod
     def get_name():
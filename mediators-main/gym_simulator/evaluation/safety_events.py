@@ -1,11 +1,40 @@
 import inspect
 import os
 
-from gym_simulator.evaluation.safety_factory import create_safety_event
+from gym_simulator.evaluation.safety_factory import create_safety_event, safety_event_is_active
 from gym_simulator.evaluation.safety_types import SafetyType as st
 
 import importlib
 
+# Maps the names of all classes in the subdirectories of gym_simulator/evaluation to the classes. Built once, see
+# get_evaluation_classes.
+_evaluation_classes = None
+
+
+def get_evaluation_classes():
+    """
+    Returns a dictionary mapping all class names of the safety events to their classes, which is used to automatically
+    initialize the correct events. The modules are only imported the first time this is called.
+    """
+    global _evaluation_classes
+    if _evaluation_classes is None:
+        # The dictionary is only stored once it is complete, since environments can be created in several threads at
+        # the same time
+        evaluation_classes = {}
+        base_dir = os.path.join('gym_simulator', 'evaluation')
+        for child_dir in next(os.walk(base_dir))[1]:
+            if not child_dir == "__pycache__":
+                full_dir = os.path.join(base_dir, child_dir)
+                files = os.listdir(full_dir)
+                for file in files:
+                    if not file == "__pycache__":
+                        module = 'gym_simulator.evaluation.{0}.{1}'.format(child_dir, file[:-3])
+                        for name, cls in inspect.getmembers(importlib.import_module(module), inspect.isclass):
+                            if cls.__module__ == module:
+                                evaluation_classes[name] = cls
+        _evaluation_classes = evaluation_classes
+    return _evaluation_classes
+
 
 class SafetyEvents:
     """
@@ -25,28 +54,20 @@ class SafetyEvents:
         self.time_passed = 0
         self.time_of_last_switch = None
 
-        # Build a directory mapping all class names to their uninitialized objects. Used to automatically initialize
-        # correct event.
-        evaluation_classes = {}
-        base_dir = os.path.join('gym_simulator', 'evaluation')
-        for child_dir in next(os.walk(base_dir))[1]:
-            if not child_dir == "__pycache__":
-                full_dir = os.path.join(base_dir, child_dir)
-                files = os.listdir(full_dir)
-                for file in files:
-                    if not file == "__pycache__":
-                        module = 'gym_simulator.evaluation.{0}.{1}'.format(child_dir, file[:-3])
-                        for name, cls in inspect.getmembers(importlib.import_module(module), inspect.isclass):
-                            if cls.__module__ == module:
-                                evaluation_classes[name] = cls
-
         # Array holding possible safety events
         self.possible_events = []
         for metric in self.config.evaluation_metrics:
-            self.possible_events.append(evaluation_classes[metric])
+            self.possible_events.append(get_evaluation_classes()[metric])
         self.possible_events.reverse()
         self.active_events = []
         self.all_events = []
+        self.event_listeners = []  # Functions that are called with every safety event that starts
+
+    def add_event_listener(self, listener):
+        """
+        Adds a function that is called with every safety event that starts.
+        """
+        self.event_listeners.append(listener)
 
     def step(self, last_action, resolved_action, time_passed, has_switched):
         """
@@ -66,15 +87,18 @@ class SafetyEvents:
 
         self.active_events = [event for event in self.active_events if event.is_pending]
 
+        active_classes = [type(ev) for ev in self.active_events]
         for event in self.possible_events:
-            if any(isinstance(ev, event) for ev in self.active_events):
+            if event in active_classes:
                 continue
 
-            # Each event is created, and when it is active it is added to the active_events, else it is discarded
-            evt = create_safety_event(event, self, last_action, resolved_action)
-            if evt.is_active():
+            # An event is only created when it starts, in which case it is added to the active_events
+            if safety_event_is_active(event, self, last_action, resolved_action):
+                evt = create_safety_event(event, self, last_action, resolved_action)
                 self.active_events.append(evt)
                 self.all_events.append(evt)
+                for listener in self.event_listeners:
+                    listener(evt)
 
         # Stores some info for results
         for safety_type in st:
@@ -16,7 +16,7 @@ def create_safety_event(event, safety, last_action, pending_action):
     if event == DriverUnfit:
         return DriverUnfit(safety.config, safety.car, safety.driver)
     if event == UnnecessaryES:
-        return UnnecessaryES(safety.config, safety.car, safety.driver, last_action)
+        return UnnecessaryES(safety.config, safety.car, safety.driver)
     if event == DoubleSuggestion:
         return DoubleSuggestion(safety.config, safety.car, safety.driver, safety.time_passed, last_action)
     if event == PendingRequest:
@@ -25,3 +25,23 @@ def create_safety_event(event, safety, last_action, pending_action):
         return RecentSwitch(safety.config, safety.car, safety.time_passed, safety.time_of_last_switch, last_action)
     if event == QuickTakeover:
         return QuickTakeover(safety.config, safety.car, pending_action)
+
+
+def safety_event_is_active(event, safety, last_action, pending_action):
+    """
+    Returns True if the Safety Event is active in the current state, without creating the event.
+    """
+    if event == CarUnfit:
+        return CarUnfit.check(safety.car)
+    if event == DriverUnfit:
+        return DriverUnfit.check(safety.car, safety.driver)
+    if event == UnnecessaryES:
+        return UnnecessaryES.check(safety.car, safety.driver, last_action)
+    if event == DoubleSuggestion:
+        return DoubleSuggestion.check(safety.config, safety.driver, safety.time_passed, last_action)
+    if event == PendingRequest:
+        return PendingRequest.check(safety.car, safety.driver)
+    if event == RecentSwitch:
+        return RecentSwitch.check(safety.config, safety.time_passed, safety.time_of_last_switch, last_action)
+    if event == QuickTakeover:
+        return QuickTakeover.check(safety.config, pending_action)
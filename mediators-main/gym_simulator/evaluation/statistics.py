@@ -61,53 +61,32 @@ class Statistics:
         """
         Updates variables with results of current run.
         """
-        evaluation = env.evaluation
-        self.total_runs = self.total_runs + 1
-        self.total_time_driven = self.total_time_driven + env.time_passed
-        for level in self.total_time_driven_in_level.keys():
-            self.total_time_driven_in_level[level] = self.total_time_driven_in_level[level] + \
-                                                     evaluation.time_driven_in_level[level]
+        self.add_run(self.summarize_run(env))
 
+    @staticmethod
+    def summarize_run(env):
+        """
+        Returns a summary of the results of the finished run in env, which contains everything that is needed to update
+        the statistics with this run (see add_run). The summary is a small dictionary, so it can be sent from the
+        process in which the run is executed to the process that keeps the statistics.
+        """
+        evaluation = env.evaluation
+        safety_types = {}
         for st in SafetyType:
-            event_count = evaluation.safety_type_event_count[st]
-            if event_count > 0:
-                self.safety_type_active_runs[st] += 1
-                self.safety_type_total_events[st] += event_count
-                self.safety_type_total_events_time[st] += evaluation.safety_type_total_event_time[st]
-                if evaluation.safety_type_shortest_event[st] < self.safety_type_shortest_event[st]:
-                    self.safety_type_shortest_event[st] = evaluation.safety_type_shortest_event[st]
-                if evaluation.safety_type_longest_event[st] > self.safety_type_longest_event[st]:
-                    self.safety_type_longest_event[st] = evaluation.safety_type_longest_event[st]
-
-        safety_event_types = {}
+            safety_types[st] = (evaluation.safety_type_event_count[st], evaluation.safety_type_total_event_time[st],
+                                evaluation.safety_type_shortest_event[st], evaluation.safety_type_longest_event[st])
+        safety_events_per_name = {}
         for possible_event in env.safety.possible_events:
             name = possible_event.get_name()
-            if name in self.aggr_safety_events_per_type:
-                aggr = self.aggr_safety_events_per_type[name]
-                aggr['Total count'] = aggr['Total count'] + evaluation.safety_type_events_per_name[name]['Count']
-                aggr['Total duration'] = \
-                    aggr['Total duration'] + evaluation.safety_type_events_per_name[name]['Total duration']
-            else:
-                self.aggr_safety_events_per_type[name] = {
-                    'Total count': evaluation.safety_type_events_per_name[name]['Count'],
-                    'Total duration': evaluation.safety_type_events_per_name[name]['Total duration']
-                }
-            safety_event_types.update({
-                "{0} count".format(name): evaluation.safety_type_events_per_name[name]['Count'],
-                "{0} duration".format(name): evaluation.safety_type_events_per_name[name]['Total duration']
-            })
-
-        self.total_action_count = self.total_action_count + evaluation.action_count
-        self.total_time_between_actions = self.total_time_between_actions + evaluation.total_time_between_actions
-        if env.evaluation.made_es:
-            self.emergency_stops = self.emergency_stops + 1
+            safety_events_per_name[name] = (evaluation.safety_type_events_per_name[name]['Count'],
+                                            evaluation.safety_type_events_per_name[name]['Total duration'])
 
         single_run_dict = {
             'seed': env.current_seed,
             'Simulation time': env.time_passed,
             'Total time without action': evaluation.total_time_without_actions,
             'Action count': evaluation.action_count,
-            'Action frequency': evaluation.action_count * (100 / float(self.config.road_length)),
+            'Action frequency': evaluation.action_count * (100 / float(env.config.road_length)),
             'Avg time between actions': 0 if evaluation.action_count <= 1
             else float(evaluation.total_time_between_actions) / (evaluation.action_count - 1)
         }
@@ -121,8 +100,62 @@ class Statistics:
                 'Avg duration of {0} situation'.format(name): 0 if active_events == 0
                 else evaluation.safety_type_total_event_time[st] / active_events
             })
+        for name, (count, duration) in safety_events_per_name.items():
+            single_run_dict.update({
+                "{0} count".format(name): count,
+                "{0} duration".format(name): duration
+            })
+
+        return {
+            'steps': env.steps,
+            'time_passed': env.time_passed,
+            'time_driven_in_level': dict(evaluation.time_driven_in_level),
+            'safety_types': safety_types,
+            'safety_events_per_name': safety_events_per_name,
+            'action_count': evaluation.action_count,
+            'total_time_between_actions': evaluation.total_time_between_actions,
+            'made_es': evaluation.made_es,
+            'run': single_run_dict
+        }
+
+    def add_run(self, summary):
+        """
+        Updates variables with the summary of a run (see summarize_run).
+        """
+        self.total_runs = self.total_runs + 1
+        self.total_time_driven = self.total_time_driven + summary['time_passed']
+        for level in self.total_time_driven_in_level.keys():
+            self.total_time_driven_in_level[level] = self.total_time_driven_in_level[level] + \
+                                                     summary['time_driven_in_level'][level]
+
+        for st in SafetyType:
+            event_count, total_event_time, shortest_event, longest_event = summary['safety_types'][st]
+            if event_count > 0:
+                self.safety_type_active_runs[st] += 1
+                self.safety_type_total_events[st] += event_count
+                self.safety_type_total_events_time[st] += total_event_time
+                if shortest_event < self.safety_type_shortest_event[st]:
+                    self.safety_type_shortest_event[st] = shortest_event
+                if longest_event > self.safety_type_longest_event[st]:
+                    self.safety_type_longest_event[st] = longest_event
+
+        for name, (count, duration) in summary['safety_events_per_name'].items():
+            if name in self.aggr_safety_events_per_type:
+                aggr = self.aggr_safety_events_per_type[name]
+                aggr['Total count'] = aggr['Total count'] + count
+                aggr['Total duration'] = aggr['Total duration'] + duration
+            else:
+                self.aggr_safety_events_per_type[name] = {
+                    'Total count': count,
+                    'Total duration': duration
+                }
+
+        self.total_action_count = self.total_action_count + summary['action_count']
+        self.total_time_between_actions = self.total_time_between_actions + summary['total_time_between_actions']
+        if summary['made_es']:
+            self.emergency_stops = self.emergency_stops + 1
 
-        self.runs.append(dict(single_run_dict, **safety_event_types))
+        self.runs.append(summary['run'])
 
     def merge(self, other_stats):
         """
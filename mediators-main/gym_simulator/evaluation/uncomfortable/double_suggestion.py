@@ -21,13 +21,17 @@ class DoubleSuggestion(AbstractSafetyEvent):
             self.is_pending = False
 
     def is_active(self):
-        new_ssl = isinstance(self.last_action, SuggestShiftLevel)
+        return DoubleSuggestion.check(self.config, self.driver, self.time_passed, self.last_action)
+
+    @staticmethod
+    def check(config, driver, time_passed, last_action):
+        new_ssl = isinstance(last_action, SuggestShiftLevel)
         last_decline = None
         if new_ssl:
-            suggested_level = self.last_action.suggested_level
-            last_decline = self.driver.last_decline[suggested_level]
+            suggested_level = last_action.suggested_level
+            last_decline = driver.last_decline[suggested_level]
 
-        return new_ssl and last_decline and self.time_passed - last_decline < self.config.decline_threshold
+        return new_ssl and last_decline and time_passed - last_decline < config.decline_threshold
 
     @staticmethod
     def get_name():
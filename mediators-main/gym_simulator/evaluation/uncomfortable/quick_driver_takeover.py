@@ -19,9 +19,13 @@ class QuickTakeover(AbstractSafetyEvent):
             self.is_pending = False
 
     def is_active(self):
-        resolved_esl = isinstance(self.resolved_action, EnforceShiftLevel)
-        return resolved_esl and self.resolved_action.level_enforced and \
-            self.resolved_action.time_passed < self.config.comfortable_shift_time
+        return QuickTakeover.check(self.config, self.resolved_action)
+
+    @staticmethod
+    def check(config, resolved_action):
+        resolved_esl = isinstance(resolved_action, EnforceShiftLevel)
+        return resolved_esl and resolved_action.level_enforced and \
+            resolved_action.time_passed < config.comfortable_shift_time
 
     @staticmethod
     def get_name():
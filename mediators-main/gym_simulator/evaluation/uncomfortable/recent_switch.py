@@ -22,11 +22,15 @@ class RecentSwitch(AbstractSafetyEvent):
             self.is_pending = False
 
     def is_active(self):
-        new_ssl = isinstance(self.last_action, SuggestShiftLevel)
-        new_esl = isinstance(self.last_action, EnforceShiftLevel)
+        return RecentSwitch.check(self.config, self.time_passed, self.time_of_last_switch, self.last_action)
 
-        return (self.time_of_last_switch and (new_ssl or new_esl)
-                and self.time_passed - self.time_of_last_switch < self.config.uncomfortable_switch)
+    @staticmethod
+    def check(config, time_passed, time_of_last_switch, last_action):
+        new_ssl = isinstance(last_action, SuggestShiftLevel)
+        new_esl = isinstance(last_action, EnforceShiftLevel)
+
+        return (time_of_last_switch and (new_ssl or new_esl)
+                and time_passed - time_of_last_switch < config.uncomfortable_switch)
 
     @staticmethod
     def get_name():
@@ -8,17 +8,18 @@ class UnnecessaryES(AbstractSafetyEvent):
     Represents situation in which an unnecessary emergency stop is made.
     """
 
-    def __init__(self, config, car, driver, last_action):
+    def __init__(self, config, car, driver):
         super().__init__(config, car, SafetyType.UNCOMFORTABLE, UnnecessaryES.get_name())
         self.driver = driver
-        self.last_action = last_action
 
     def is_active(self):
-        active = isinstance(self.last_action, EmergencyStop) and \
-                 ((self.car.current_level < "L3" and self.driver.ttdu > 5.0) or
-                  (self.car.current_level > "L2" and self.driver.ttdf == 0))
-        self.last_action = None
-        return active
+        # The event is created in the step in which the emergency stop is made, and is not active in any later step
+        return False
+
+    @staticmethod
+    def check(car, driver, last_action):
+        return isinstance(last_action, EmergencyStop) and \
+            ((car.current_level < "L3" and driver.ttdu > 5.0) or (car.current_level > "L2" and driver.ttdf == 0))
 
     @staticmethod
     def get_name():
@@ -24,6 +24,19 @@ class AbstractDriverEvent(ABC):
         """
         pass
 
+    def get_steps_until_change(self, driver, car):
+        """
+        Returns the number of timesteps until the event changes something else than its end position (including the
+        current one). By default, events are assumed to change something in every timestep.
+        """
+        return 0
+
+    def skip_steps(self, steps, position):
+        """
+        Skips steps timesteps in which the event doesn't change, after which the car is at the given position.
+        """
+        self.end = position
+
     @abstractmethod
     def is_possible(self, current_level):
         """
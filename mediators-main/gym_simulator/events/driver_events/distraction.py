@@ -1,5 +1,6 @@
 from gym_simulator.config.allowed_values import DriverEvent
 from gym_simulator.events.driver_events.abstract_driver_event import AbstractDriverEvent
+from gym_simulator.utils.utils import GeometricSampler
 
 
 class Distraction(AbstractDriverEvent):
@@ -10,6 +11,7 @@ class Distraction(AbstractDriverEvent):
     def __init__(self, config, rng, starting_position):
         super().__init__(config, rng, starting_position)
         self.increased = False  # True as soon as the distraction increased once
+        self.sampler = GeometricSampler(rng)  # Used if geometric sampling is enabled
 
     def step(self, driver, car):
         if not self.is_pending:
@@ -22,22 +24,70 @@ class Distraction(AbstractDriverEvent):
             self.increased = True
         # Distraction is not at its max level yet, so there's a chance that it increases
         elif driver.distraction < 3:
-            rand_no = self.rng.rand()
+            outcome = self._draw_midway_outcome(driver)
             # Probability that distraction increases
-            if rand_no < self.config.distraction_increase_prob ** driver.distraction:
+            if outcome == "increase":
                 driver.distraction = driver.distraction + 1
                 driver.update_distraction = True
             # Probability that distraction ends midway
-            elif rand_no > (1 - self.config.distraction_ends_midway_prob):
+            elif outcome == "end":
                 driver.distraction = 0
                 driver.update_distraction = True
                 self.is_pending = False
         # Probability that distraction ends when it is at maximum level
-        elif self.rng.rand() < self.config.distractions_ends_prob:
+        elif self._ends_at_max_level():
             driver.distraction = 0
             driver.update_distraction = True
             self.is_pending = False
 
+    def get_steps_until_change(self, driver, car):
+        if (not self.increased and driver.distraction < 3) or car.current_level > "L2":
+            return 0
+        elif driver.distraction < 3:
+            return self.sampler.get_remaining_steps(self._get_change_prob(driver))
+        return self.sampler.get_remaining_steps(self.config.distractions_ends_prob)
+
+    def skip_steps(self, steps, position):
+        super().skip_steps(steps, position)
+        self.sampler.skip(steps)
+
+    def _get_change_prob(self, driver):
+        """
+        Returns the probability that the distraction increases or ends midway in the current timestep.
+        """
+        increase_prob = self.config.distraction_increase_prob ** driver.distraction
+        return increase_prob + 1 - max(1 - self.config.distraction_ends_midway_prob, increase_prob)
+
+    def _draw_midway_outcome(self, driver):
+        """
+        Returns "increase" if the distraction increases in the current timestep, "end" if it ends, and None if it stays
+        the same. The random number decides the outcome: below the increase probability it increases, above 1 minus
+        the probability to end midway it ends.
+        """
+        increase_prob = self.config.distraction_increase_prob ** driver.distraction
+        end_threshold = 1 - self.config.distraction_ends_midway_prob
+        if self.config.geometric_sampling:
+            # With geometric sampling, only the timestep in which the distraction changes is drawn, after which the
+            # random number is drawn from the ranges that lead to a change
+            change_prob = self._get_change_prob(driver)
+            if not self.sampler.occurs(change_prob):
+                return None
+            return "increase" if self.rng.rand() * change_prob < increase_prob else "end"
+        rand_no = self.rng.rand()
+        if rand_no < increase_prob:
+            return "increase"
+        elif rand_no > end_threshold:
+            return "end"
+        return None
+
+    def _ends_at_max_level(self):
+        """
+        Returns True if a distraction at the maximum level ends in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.sampler.occurs(self.config.distractions_ends_prob)
+        return self.rng.rand() < self.config.distractions_ends_prob
+
     def is_possible(self, current_level):
         return current_level < 'L3'
 
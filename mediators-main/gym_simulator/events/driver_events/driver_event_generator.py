@@ -1,5 +1,7 @@
+import sys
+
 from gym_simulator.config.enums_to_classes_mapping import map_driver_event_to_class
-from gym_simulator.utils.utils import calculate_probability_per_timestep
+from gym_simulator.utils.utils import calculate_probability_per_timestep, GeometricSampler
 
 
 class DriverEventGenerator:
@@ -18,6 +20,8 @@ class DriverEventGenerator:
         for prob in self.config.driver_event_probability:
             self.event_probs_per_timestep.append(calculate_probability_per_timestep(
                 estimated_total_time / self.config.timestep, prob))
+        # Used instead of drawing a random number in every timestep, if geometric sampling is enabled
+        self.samplers = [GeometricSampler(self.rng) for _ in self.allowed_events]
 
     def generate_next_event(self, car, pending_events):
         """
@@ -30,7 +34,7 @@ class DriverEventGenerator:
             # of the same type should already be pending (e.g. you cannot have 2 simultaneous distraction events)
             if self.event_counts[i] < self.config.max_occurrences_of_driver_event[i] and \
                     not any(isinstance(ev, event) for ev in pending_events):
-                if self.rng.rand() < self.event_probs_per_timestep[i]:
+                if self._occurs(i):
                     # Create a new event
                     self.event_counts[i] = self.event_counts[i] + 1
                     evt = event(self.config, self.rng, car.position)
@@ -38,6 +42,38 @@ class DriverEventGenerator:
                         return evt
         return None
 
+    def get_steps_until_next_event(self, pending_events):
+        """
+        Returns the number of timesteps until the next driver event is generated (including the current one). Only
+        available if geometric sampling is enabled.
+        """
+        return min((self.samplers[i].get_remaining_steps(self.event_probs_per_timestep[i])
+                    for i in self._get_possible_event_indices(pending_events)), default=sys.maxsize)
+
+    def skip_steps(self, steps, pending_events):
+        """
+        Counts down steps timesteps in which no driver event is generated.
+        """
+        for i in self._get_possible_event_indices(pending_events):
+            self.samplers[i].skip(steps)
+
+    def _get_possible_event_indices(self, pending_events):
+        """
+        Returns the indices of the events that have not reached their maximum number of occurrences yet, and are not
+        pending already.
+        """
+        return [i for i, event in enumerate(self.allowed_events)
+                if self.event_counts[i] < self.config.max_occurrences_of_driver_event[i] and
+                not any(isinstance(ev, event) for ev in pending_events)]
+
+    def _occurs(self, i):
+        """
+        Returns True if the event with index i happens in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.samplers[i].occurs(self.event_probs_per_timestep[i])
+        return self.rng.rand() < self.event_probs_per_timestep[i]
+
     def _map_possible_driver_events(self):
         """
         Returns a list of driver event classes that are allowed.
@@ -1,5 +1,6 @@
 from gym_simulator.config.allowed_values import DriverEvent
 from gym_simulator.events.driver_events.abstract_driver_event import AbstractDriverEvent
+from gym_simulator.utils.utils import GeometricSampler
 
 
 class DriverRequest(AbstractDriverEvent):
@@ -13,6 +14,7 @@ class DriverRequest(AbstractDriverEvent):
         self.requested_level = self.rng.choice([level for level in ["L0", "L2", "L3", "L4"]
                                                 if level <= self.config.maximum_automation_level])
         self.changed = False  # Indicates whether the request has already been assigned to the driver
+        self.sampler = GeometricSampler(rng)  # Used if geometric sampling is enabled
 
     def step(self, driver, car):
         if not self.is_pending:
@@ -22,10 +24,27 @@ class DriverRequest(AbstractDriverEvent):
             driver.driver_request = self.requested_level
             self.changed = True
         # Small probability that a driver cancels a request by itself
-        elif self.rng.rand() < self.config.driver_request_cancel_prob:
+        elif self._cancels():
             driver.driver_request = None
             self.is_pending = False
 
+    def get_steps_until_change(self, driver, car):
+        if not self.changed:
+            return 0
+        return self.sampler.get_remaining_steps(self.config.driver_request_cancel_prob)
+
+    def skip_steps(self, steps, position):
+        super().skip_steps(steps, position)
+        self.sampler.skip(steps)
+
+    def _cancels(self):
+        """
+        Returns True if the driver cancels the request in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.sampler.occurs(self.config.driver_request_cancel_prob)
+        return self.rng.rand() < self.config.driver_request_cancel_prob
+
     def is_possible(self, current_level):
         return not self.requested_level == current_level
 
@@ -1,5 +1,6 @@
 from gym_simulator.config.allowed_values import DriverEvent
 from gym_simulator.events.driver_events.abstract_driver_event import AbstractDriverEvent
+from gym_simulator.utils.utils import GeometricSampler
 
 
 class NDRT(AbstractDriverEvent):
@@ -10,6 +11,7 @@ class NDRT(AbstractDriverEvent):
     def __init__(self, config, rng, starting_position):
         super().__init__(config, rng, starting_position)
         self.changed = False  # Indicates if NDRT has been started
+        self.sampler = GeometricSampler(rng)  # Used if geometric sampling is enabled
 
     def step(self, driver, car):
         if not self.is_pending:
@@ -18,10 +20,27 @@ class NDRT(AbstractDriverEvent):
         if not self.changed:
             driver.ndrt = self.rng.randint(1, 4)  # Set the NDRT level randomly
             self.changed = True
-        elif self.rng.rand() < self.config.ndrt_ends_prob:
+        elif self._ends():
             driver.ndrt = 0
             self.is_pending = False
 
+    def get_steps_until_change(self, driver, car):
+        if not self.changed or car.current_level < "L3":
+            return 0
+        return self.sampler.get_remaining_steps(self.config.ndrt_ends_prob)
+
+    def skip_steps(self, steps, position):
+        super().skip_steps(steps, position)
+        self.sampler.skip(steps)
+
+    def _ends(self):
+        """
+        Returns True if the NDRT ends spontaneously in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.sampler.occurs(self.config.ndrt_ends_prob)
+        return self.rng.rand() < self.config.ndrt_ends_prob
+
     def is_possible(self, current_level):
         return current_level >= "L3"
 
@@ -1,6 +1,8 @@
+import sys
+
 from gym_simulator.config.allowed_values import RoadEventType
 from gym_simulator.events.road_events.road_event import RoadEvent
-from gym_simulator.utils.utils import calculate_probability_per_timestep
+from gym_simulator.utils.utils import calculate_probability_per_timestep, GeometricSampler
 
 
 class RoadEventGenerator:
@@ -18,11 +20,14 @@ class RoadEventGenerator:
         self.rng = rng
         self.dynamic_event_counts = {}
         self.dynamic_prob_per_timestep = {}
+        # Used instead of drawing a random number in every timestep, if geometric sampling is enabled
+        self.dynamic_samplers = {}
         for event_name, event in self.config.allowed_dynamic_events.items():
             self.dynamic_event_counts[event_name] = 0
             self.dynamic_prob_per_timestep[event_name] = \
                 calculate_probability_per_timestep(estimated_total_time / self.config.timestep,
                                                    event["probability"])
+            self.dynamic_samplers[event_name] = GeometricSampler(self.rng)
 
         # If there is a preset road it might include dynamic (and static) events. In that case, these (predefined)
         # events are used instead of randomly generating them.
@@ -79,12 +84,9 @@ class RoadEventGenerator:
         """
         Possibly generates a dynamic event. Returns None if no dynamic event is generated.
         """
-        # This specifies how far ahead an event is known, which is a random number within predefined bounds
-        lookahead_distance = self.rng.uniform(self.config.dynamic_event_min_lookahead,
-                                              self.config.dynamic_event_max_lookahead)
-
         # If dynamic events are predefined, use these
         if self.preset_road is not None and self.preset_road.includes_dynamic_events():
+            lookahead_distance = self._get_lookahead_distance()
             if self.next_dynamic_event is not None and \
                     self.next_dynamic_event.start <= car.position + lookahead_distance:
                 event_to_return = self.next_dynamic_event
@@ -92,15 +94,74 @@ class RoadEventGenerator:
                 return event_to_return
             return None
 
-        # If not predefined, randomly generate a dynamic event (or not, then None is returned)
+        # If not predefined, randomly generate a dynamic event (or not, then None is returned). With geometric sampling,
+        # the lookahead distance is only drawn when an event is generated
+        lookahead_distance = None if self.config.geometric_sampling else self._get_lookahead_distance()
         for event_name, event in self.config.allowed_dynamic_events.items():
             # Check if dynamic count does not exceed maximum dynamic event count yet
             if self.dynamic_event_counts[event_name] < event["max_occurrences"] and \
                     (active_events is None or event_name not in active_events):
-                if self.rng.rand() < self.dynamic_prob_per_timestep[event_name]:
+                if self._occurs(event_name):
                     self.dynamic_event_counts[event_name] += 1
+                    if lookahead_distance is None:
+                        lookahead_distance = self._get_lookahead_distance()
                     start = car.position + lookahead_distance
                     end = start + self.rng.uniform(event["min_length"], event["max_length"])
                     return RoadEvent(event_name, RoadEventType.DYNAMIC, start, end, event["default_level"],
                                      event["default_speed"])
         return None
+
+    def get_steps_until_next_dynamic_event(self, active_events):
+        """
+        Returns the number of timesteps until the next random dynamic event is generated (including the current one),
+        given the names of the active events. Only available if geometric sampling is enabled. If dynamic events are
+        preset, sys.maxsize is returned, see get_next_preset_dynamic_event_position.
+        """
+        if self.preset_road is not None and self.preset_road.includes_dynamic_events():
+            return sys.maxsize
+        return min((self.dynamic_samplers[event_name].get_remaining_steps(self.dynamic_prob_per_timestep[event_name])
+                    for event_name in self._get_possible_dynamic_events(active_events)), default=sys.maxsize)
+
+    def get_next_preset_dynamic_event_position(self):
+        """
+        Returns the first position of the car at which the next preset dynamic event can possibly be generated, or
+        sys.maxsize if there is none.
+        """
+        if self.next_dynamic_event is None:
+            return sys.maxsize
+        # A small margin makes sure the event is not generated because of rounding
+        return self.next_dynamic_event.start - self.config.dynamic_event_max_lookahead - 1e-9
+
+    def skip_steps(self, steps, active_events):
+        """
+        Counts down steps timesteps in which no dynamic event is generated, given the names of the active events.
+        """
+        if self.preset_road is not None and self.preset_road.includes_dynamic_events():
+            # With preset events, a lookahead distance is drawn in every timestep
+            for _ in range(steps):
+                self._get_lookahead_distance()
+        else:
+            for event_name in self._get_possible_dynamic_events(active_events):
+                self.dynamic_samplers[event_name].skip(steps)
+
+    def _get_possible_dynamic_events(self, active_events):
+        """
+        Returns the names of the dynamic events that are not active and have not reached their maximum number of
+        occurrences yet.
+        """
+        return [event_name for event_name, event in self.config.allowed_dynamic_events.items()
+                if self.dynamic_event_counts[event_name] < event["max_occurrences"] and event_name not in active_events]
+
+    def _get_lookahead_distance(self):
+        """
+        Returns how far ahead an event is known, which is a random number within predefined bounds.
+        """
+        return self.rng.uniform(self.config.dynamic_event_min_lookahead, self.config.dynamic_event_max_lookahead)
+
+    def _occurs(self, event_name):
+        """
+        Returns True if the dynamic event with the given name happens in the current timestep.
+        """
+        if self.config.geometric_sampling:
+            return self.dynamic_samplers[event_name].occurs(self.dynamic_prob_per_timestep[event_name])
+        return self.rng.rand() < self.dynamic_prob_per_timestep[event_name]
@@ -0,0 +1,79 @@
+import os
+import pickle
+
+
+class Journal:
+    """
+    Journal of the finished runs of a simulation, which is used to resume a simulation that stopped before all of its
+    runs were finished (see the resume setting). As soon as a run is finished, its seed and the summary of its results
+    (see Statistics.summarize_run) are appended to the journal file.
+
+    The journal file starts with the hashes of the input files of the simulation (see Writer.hash_input_files), which is
+    followed by pickled (seed, summary) tuples. If the simulation stopped while an entry was being written, the
+    incomplete entry is ignored and overwritten when the simulation is resumed.
+    """
+
+    def __init__(self, file_path, resume=False, input_hashes=None):
+        """
+        Opens the journal at file_path. If resume is True, the entries that are already in the journal are read (see
+        summaries), and new entries are appended to them. Else, the journal is emptied.
+
+        A simulation is only resumed if its input files did not change since the journal was started, so the runs in
+        the journal have the same results as when they would be run again. If input_hashes differs from the hashes in
+        the journal, a ValueError is raised.
+        """
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.file_path = file_path
+        self.input_hashes = input_hashes if input_hashes is not None else {}
+        self.summaries = {}  # The summary of every run in the journal, per seed
+        length = 0  # The length of the complete entries in the file
+        if resume and os.path.isfile(file_path):
+            length = self.__read()
+            self.file = open(file_path, "r+b")
+        else:
+            self.file = open(file_path, "wb")
+        self.file.seek(length)
+        self.file.truncate()
+        if length == 0:
+            pickle.dump(self.input_hashes, self.file)
+            self.file.flush()
+
+    def __read(self):
+        """
+        Reads the entries in the journal file, and returns the length of the complete entries (which is 0 if the file
+        does not start with complete input hashes).
+        """
+        with open(self.file_path, "rb") as f:
+            try:
+                input_hashes = pickle.load(f)
+            except Exception:
+                # The simulation stopped before the input hashes were written
+                return 0
+            if input_hashes != self.input_hashes:
+                # A journal that does not start with input hashes (i.e. an older journal) has no known input files
+                input_hashes = input_hashes if isinstance(input_hashes, dict) else {}
+                changed_files = sorted(file for file in set(input_hashes) | set(self.input_hashes)
+                                       if input_hashes.get(file) != self.input_hashes.get(file))
+                raise ValueError("The simulation of journal {0} cannot be resumed, since its input files changed: {1}"
+                                 .format(self.file_path, ", ".join(changed_files)))
+            length = f.tell()
+            while True:
+                try:
+                    seed, summary = pickle.load(f)
+                except Exception:
+                    # The end of the file, or an incomplete entry (which can raise several kinds of errors)
+                    return length
+                self.summaries[seed] = summary
+                length = f.tell()
+
+    def add(self, seed, summary):
+        """
+        Appends the summary of the finished run with the given seed to the journal.
+        """
+        pickle.dump((seed, summary), self.file)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
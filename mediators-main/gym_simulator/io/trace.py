@@ -0,0 +1,169 @@
+import io
+import os
+import queue
+import struct
+import threading
+
+import numpy as np
+
+from gym_simulator.evaluation.safety_types import SafetyType
+from gym_simulator.utils.utils import level_index
+
+# The columns of a trace with their types. Levels are stored as their index including L0 (see level_index), and a
+# driver request of None or an action of None is stored as -1.
+TRACE_COLUMNS = {
+    "step": np.int32,
+    "time": np.float64,
+    "position": np.float64,
+    "speed": np.float64,
+    "level": np.int8,
+    "max_level": np.int8,
+    "ttaf_L2": np.float64,
+    "ttaf_L3": np.float64,
+    "ttaf_L4": np.float64,
+    "ttau_L2": np.float64,
+    "ttau_L3": np.float64,
+    "ttau_L4": np.float64,
+    "fatigue": np.int8,
+    "distraction": np.int8,
+    "ndrt": np.int8,
+    "driver_request": np.int8,
+    "ttdf": np.float64,
+    "ttdu": np.float64,
+    "action": np.int16,
+    "safety_misc": np.bool_,
+    "safety_uncomfortable": np.bool_,
+    "safety_critical": np.bool_
+}
+
+# Format of the length that precedes every chunk in a trace file
+_LENGTH_FORMAT = "<Q"
+
+
+class TraceRecorder:
+    """
+    Records the state of the simulation in every step to a trace file. The values are collected in typed columns of
+    chunk_size steps. Every full chunk is compressed (as npz) and written to the file by a background thread. At most
+    max_queued_chunks chunks wait to be written, so the memory used does not depend on the length of the route.
+
+    A trace file consists of chunks, where every chunk is preceded by its length in bytes. Use read_trace to read it.
+    """
+
+    def __init__(self, file_path, chunk_size=4096, max_queued_chunks=4):
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.chunk = self._new_chunk()
+        self.length = 0  # The number of steps in the current chunk
+        self.error = None  # Holds an exception raised by the writer thread
+        self.queue = queue.Queue(maxsize=max_queued_chunks)
+        self.file = open(file_path, "wb")
+        self.writer = threading.Thread(target=self._write_chunks, daemon=True)
+        self.writer.start()
+
+    def record(self, env, action=None):
+        """
+        Records the current state of env, and the (integer) action that was taken in the last step.
+        """
+        ttaf = env.car.get_ttaf()
+        ttau = env.car.get_ttau()
+        values = {
+            "step": env.steps,
+            "time": env.time_passed,
+            "position": env.car.position,
+            "speed": env.car.speed,
+            "level": level_index(env.car.current_level, True),
+            "max_level": level_index(env.road.current_max_level, True),
+            "ttaf_L2": ttaf[0],
+            "ttaf_L3": ttaf[1],
+            "ttaf_L4": ttaf[2],
+            "ttau_L2": ttau[0],
+            "ttau_L3": ttau[1],
+            "ttau_L4": ttau[2],
+            "fatigue": env.driver.fatigue,
+            "distraction": env.driver.distraction,
+            "ndrt": env.driver.ndrt,
+            "driver_request": -1 if env.driver.driver_request is None else level_index(env.driver.driver_request, True),
+            "ttdf": env.driver.ttdf,
+            "ttdu": env.driver.ttdu,
+            "action": -1 if action is None else action,
+            "safety_misc": env.safety.current_step_is_active[SafetyType.MISC],
+            "safety_uncomfortable": env.safety.current_step_is_active[SafetyType.UNCOMFORTABLE],
+            "safety_critical": env.safety.current_step_is_active[SafetyType.CRITICAL]
+        }
+        for name, value in values.items():
+            self.chunk[name][self.length] = value
+        self.length += 1
+        if self.length == self.chunk_size:
+            self._flush()
+
+    def close(self):
+        """
+        Writes the remaining steps and waits until everything is written to the file.
+        """
+        if self.file.closed:
+            return
+        if self.length > 0:
+            self._flush()
+        self.queue.put(None)
+        self.writer.join()
+        self.file.close()
+        self._raise_error()
+
+    def _new_chunk(self):
+        return {name: np.empty(self.chunk_size, dtype=dtype) for name, dtype in TRACE_COLUMNS.items()}
+
+    def _flush(self):
+        self._raise_error()
+        # Blocks when max_queued_chunks chunks are waiting to be written
+        self.queue.put({name: column[:self.length] for name, column in self.chunk.items()})
+        self.chunk = self._new_chunk()
+        self.length = 0
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise IOError("Writing the trace {0} failed.".format(self.file_path)) from self.error
+
+    def _write_chunks(self):
+        while True:
+            chunk = self.queue.get()
+            if chunk is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                buffer = io.BytesIO()
+                np.savez_compressed(buffer, **chunk)
+                data = buffer.getvalue()
+                self.file.write(struct.pack(_LENGTH_FORMAT, len(data)))
+                self.file.write(data)
+            except Exception as e:
+                self.error = e
+
+
+def iter_trace_chunks(file_path):
+    """
+    Yields the chunks of a trace file one by one, as dictionaries mapping the column names to arrays.
+    """
+    length_size = struct.calcsize(_LENGTH_FORMAT)
+    with open(file_path, "rb") as f:
+        while True:
+            length = f.read(length_size)
+            if len(length) < length_size:
+                return
+            data = f.read(struct.unpack(_LENGTH_FORMAT, length)[0])
+            with np.load(io.BytesIO(data)) as chunk:
+                yield {name: chunk[name] for name in chunk.files}
+
+
+def read_trace(file_path):
+    """
+    Reads a complete trace file. Returns a dictionary mapping the column names (see TRACE_COLUMNS) to arrays with the
+    values of all recorded steps.
+    """
+    chunks = list(iter_trace_chunks(file_path))
+    if not chunks:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in TRACE_COLUMNS.items()}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
@@ -21,13 +21,44 @@ class Writer:
                 hash_md5.update(chunk)
         return hash_md5.hexdigest()
 
+    def hash_input_files(self, input_files):
+        """
+        Returns the md5 hash of every input file, per file.
+        """
+        return {input_file: self.hash_config(input_file) for input_file in input_files}
+
+    def get_config_dir(self, config_file, config_dir_preamble=""):
+        """
+        Returns the directory for the results of all simulations with a config file, which includes the hash of the
+        config file. See write_statistics for the parameters.
+        """
+        config_hash = self.hash_config(os.path.join("gym_simulator", "config", "config_files", config_file))
+        return os.path.join("results", "config_{0}_{1}".format(config_dir_preamble, config_hash))
+
+    def get_decision_maker_dir(self, tree_file=None, method=None, model_name="", noise=None, tta_levels="levels"):
+        """
+        Returns the name of the directory for the results of a decision maker (a tree or an RL model), which includes
+        the noise and the levels that are used. See write_statistics for the parameters.
+        """
+        decision_maker_dir = "{0}_tree".format(tree_file[:-5]) if tree_file else "RL_{0}_{1}".format(method.__name__,
+                                                                                                     model_name)
+        if noise:
+            decision_maker_dir = "{0}_noise_ttaf_{1}_ttau_{2}_ttdf_{3}_ttdu_{4}".format(decision_maker_dir,
+                                                                                        noise["ttaf"], noise["ttau"],
+                                                                                        noise["ttdf"], noise["ttdu"])
+        if not tta_levels == "levels":
+            decision_maker_dir = "{0}_{1}".format(decision_maker_dir, tta_levels)
+        return decision_maker_dir
+
     def write_statistics(self, config_file, settings, stats, tree_file=None, parsed_tree="", method=None, model_name="",
-                         write_all_runs=False, config_dir_preamble="", noise=None, tta_levels="levels"):
+                         write_all_runs=False, config_dir_preamble="", noise=None, tta_levels="levels", directory=None):
         """
         Writes the statistics to file. The location of the results is
         'results/config_[config_dir_preamble]_[config_hash]/[tree_file_name]_tree/[current_date]/'
         In this folder the decision tree with which the simulation was run is stored along with a results.csv file
-        detailing the results.
+        detailing the results. If directory is defined (e.g. the directory returned by a previous call to write the
+        partial results of the same simulation), the results are written to that directory instead, overwriting the
+        previous results.
         The config file which is used for the simulation is stored in the parent config directory, since all runs
         in that directory are run with the same config file, so it only needs to be stored once.
 
@@ -43,28 +74,24 @@ class Writer:
             config_dir_preamble: the preamble that is placed in the name of directory where the config file is stored
             noise: the noise parameters used for this run (default is None in case no noise is used)
             tta_levels: in case pessimistic or optimistic levels are used, this is reflected in the directory name.
+            directory: the directory to write the results to (default is None, in which case a new one is created)
+
+        Returns the directory to which the results are written.
         """
         config_loc = os.path.join("gym_simulator", "config", "config_files", config_file)
-        config_hash = self.hash_config(config_loc)
+        config_hash_dir = self.get_config_dir(config_file, config_dir_preamble)
 
         # a directory with the hash of this config does not yet exist
-        config_hash_dir = os.path.join("results", "config_{0}_{1}".format(config_dir_preamble, config_hash))
         if not os.path.isdir(config_hash_dir):
             os.makedirs(config_hash_dir)
             copyfile(config_loc, os.path.join(config_hash_dir, "config.yaml"))
 
-        decision_maker_dir = "{0}_tree".format(tree_file[:-5]) if tree_file else "RL_{0}_{1}".format(method.__name__,
-                                                                                                     model_name)
-        if noise:
-            decision_maker_dir = "{0}_noise_ttaf_{1}_ttau_{2}_ttdf_{3}_ttdu_{4}".format(decision_maker_dir,
-                                                                                        noise["ttaf"], noise["ttau"],
-                                                                                        noise["ttdf"], noise["ttdu"])
-        if not tta_levels == "levels":
-            decision_maker_dir = "{0}_{1}".format(decision_maker_dir, tta_levels)
-        directory = os.path.join(config_hash_dir, decision_maker_dir,
-                                 datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S'))
+        if directory is None:
+            decision_maker_dir = self.get_decision_maker_dir(tree_file, method, model_name, noise, tta_levels)
+            directory = os.path.join(config_hash_dir, decision_maker_dir,
+                                     datetime.datetime.now().strftime('%Y-%m-%d-%H-%M-%S'))
+            os.makedirs(directory)
 
-        os.makedirs(directory)
         with open(os.path.join(directory, "preferences.yaml"), 'w', newline='', encoding='utf-8') as f:
             yaml.dump(settings, f, default_flow_style=False, sort_keys=False)
         if tree_file:
@@ -72,7 +99,9 @@ class Writer:
                 f.write(parsed_tree)
 
         runs = stats.pop("runs", None)
-        with open(os.path.join(directory, "results.csv"), 'w', newline='', encoding='utf-8') as f:
+        # The results are written to a temporary file first, so the previous results are not lost if writing fails
+        results_file = os.path.join(directory, "results.csv")
+        with open(results_file + ".tmp", 'w', newline='', encoding='utf-8') as f:
             w = csv.writer(f)
             w.writerow(stats.keys())
             w.writerow(stats.values())
@@ -81,3 +110,5 @@ class Writer:
             for run in runs:
                 if write_all_runs or (run['Number of unsafe events'] > 0 or run['Number of uncomfortable events'] > 0):
                     w.writerow(run.values())
+        os.replace(results_file + ".tmp", results_file)
+        return directory
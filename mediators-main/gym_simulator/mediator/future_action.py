@@ -104,8 +104,7 @@ class FutureAction:
         next_available_level = levels[current_levels_index + 1][0] if current_levels_index < len(levels) - 1 else \
             current_available_level
 
-        speed = next(speed for i, (speed, end) in enumerate(max_auto_levels.speeds) if end >= next_level_change and
-                     (i == 0 or next_level_change > max_auto_levels.speeds[i - 1][1]))
+        speed = max_auto_levels.get_speed_at_position(next_level_change)
         if current_available_level > next_available_level:
             next_level_change -= (((self.config.comfortable_shift_time + 2 * self.config.timestep) * speed) / 3600)
         return next_level_change, next_available_level > current_available_level
@@ -31,3 +31,12 @@ class Mediator(ABC):
         Calculates an action ahead of time, predicting future MEDIATOR behaviour.
         """
         pass
+
+    def is_idle_until(self, env, position, time_passed, ttdu):
+        """
+        Returns True if the mediator is guaranteed to return DN in every step while the environment moves from its
+        current state to the state with the given position, time passed and TTDU, where all values in between change
+        monotonically and nothing else changes. Used to fast forward through quiet parts of the road. By default, no
+        guarantee is given.
+        """
+        return False
@@ -31,15 +31,12 @@ class TreeMediator(Mediator):
         Builds a dictionary with variables used in the trees, representing the current state of the environment.
         If defined, noise is added to the state.
         """
-        add_noise = self.noise is not None
         ttaf = ttaf if is_future_action_state else env.car.get_ttaf(self.tta_levels)
         ttau = ttau if is_future_action_state else env.car.get_ttau(self.tta_levels)
-        ttaf_with_possible_noise = [t + (self.noise["ttaf"] if add_noise and t > 0 else 0) for t in ttaf]
-        ttau_with_possible_noise = [t + (self.noise["ttau"] if add_noise and t > 0 else 0) for t in ttau]
-        ttdf_with_possible_noise = env.driver.ttdf + (
-            self.noise["ttdf"] if add_noise and env.driver.ttdf > 0 else 0)
-        ttdu_with_possible_noise = env.driver.ttdu + (
-            self.noise["ttdu"] if add_noise and env.driver.ttdu > 0 else 0)
+        ttaf_with_possible_noise = [self.__add_noise(t, "ttaf") for t in ttaf]
+        ttau_with_possible_noise = [self.__add_noise(t, "ttau") for t in ttau]
+        ttdf_with_possible_noise = self.__add_noise(env.driver.ttdf, "ttdf")
+        ttdu_with_possible_noise = self.__add_noise(env.driver.ttdu, "ttdu")
 
         return {
             "comfortable_shift_time": self.config.comfortable_shift_time,
@@ -68,6 +65,35 @@ class TreeMediator(Mediator):
             "woo_time": self.config.window_of_opportunity_time
         }
 
+    def __add_noise(self, value, name):
+        """
+        Adds noise to a positive time value, if noise is defined.
+        """
+        return value + (self.noise[name] if self.noise is not None and value > 0 else 0)
+
+    def is_idle_until(self, env, position, time_passed, ttdu):
+        """
+        Returns True if the tree returns DN for every state in between the current state of env and the state at the
+        given position, time passed and TTDU. Logging mediators are never idle, since every state should be logged.
+        """
+        if self.log is not None or self.is_random() or env.pending_action is not None:
+            return False
+        first_parameters = self.build_state(env)
+        ttaf = env.car.get_ttaf(self.tta_levels, position)
+        ttau = env.car.get_ttau(self.tta_levels, position)
+        if self.noise is not None:
+            # Noise is only added to positive values, so whether it's added should not change in between
+            first_values = env.car.get_ttaf(self.tta_levels) + env.car.get_ttau(self.tta_levels) + [env.driver.ttdu]
+            if any((first > 0) != (last > 0) for first, last in zip(first_values, ttaf + ttau + [ttdu])):
+                return False
+        last_parameters = dict(first_parameters, position=position, time_passed=time_passed,
+                               ttaf=[self.__add_noise(t, "ttaf") for t in ttaf],
+                               ttau=[self.__add_noise(t, "ttau") for t in ttau],
+                               ttdu=self.__add_noise(ttdu, "ttdu"))
+        action = self.mediator_interface.get_constant_action(first_parameters, last_parameters)
+        # Actions that are not available are replaced by DN, see __update_action
+        return action == 'DN' or (action is not None and action not in self.action_mapper.available_actions)
+
     def __update_action(self, action, pending_action, args, position):
         """
         Update the action returned by the decision tree. If the action returned by the decision tree is the same as the
@@ -1,3 +1,5 @@
+import sys
+
 from gym_simulator.events.road_events.road_event_generator import RoadEventGenerator
 
 
@@ -14,11 +16,18 @@ class RoadEventManager:
         # Events that are currently active
         self.active_events = []
         self.event_index = 0  # The index in the event list from where to start looking for new events
+        self.event_listeners = []  # Functions that are called with every new dynamic event
+
+    def add_event_listener(self, listener):
+        """
+        Adds a function that is called with every event that is added to the events after the start.
+        """
+        self.event_listeners.append(listener)
 
     def step(self, car):
         """
-        Updates the active events and possibly creates a new dynamic event. Returns True if a new event has been created,
-        False otherwise.
+        Updates the active events and possibly creates a new dynamic event. Returns the new event if one has been
+        created, None otherwise.
         """
         self.update_active_events(car)
         # Possibly creates a new event
@@ -28,8 +37,10 @@ class RoadEventManager:
             # Insert new event in list
             index = next((i for i, event in enumerate(self.events) if event.start > new_event.start), len(self.events))
             self.events.insert(index, new_event)
-            return True
-        return False
+            for listener in self.event_listeners:
+                listener(new_event)
+            return new_event
+        return None
 
     def update_active_events(self, car):
         """
@@ -43,3 +54,32 @@ class RoadEventManager:
             elif event.start > car.position:
                 self.event_index = self.event_index + i
                 return
+
+    def get_next_change(self, position):
+        """
+        Returns the first position from position onwards at which the active events can change, because an event starts
+        or ends, or a preset dynamic event can be generated.
+        """
+        next_start = next((event.start for event in self.events[self.event_index:] if event.start > position), None)
+        if next_start is None and self.active_events:
+            # Without a next event, update_active_events adds the active events again in every step
+            return position
+        return min([event.end for event in self.active_events] +
+                   [sys.maxsize if next_start is None else next_start,
+                    self.road_event_generator.get_next_preset_dynamic_event_position()])
+
+    def get_steps_until_next_dynamic_event(self):
+        """
+        Returns the number of timesteps until the next random dynamic event is generated (including the current one).
+        """
+        return self.road_event_generator.get_steps_until_next_dynamic_event(
+            [event.name for event in self.active_events])
+
+    def skip_steps(self, steps, car):
+        """
+        Skips steps timesteps in which the active events stay the same and no dynamic event is generated, after which
+        the car is at its new position.
+        """
+        # No events start or end, but the index of the next event can still move past events that have ended already
+        self.update_active_events(car)
+        self.road_event_generator.skip_steps(steps, [event.name for event in self.active_events])
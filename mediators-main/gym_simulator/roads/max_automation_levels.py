@@ -1,4 +1,7 @@
+import heapq
+import math
 import sys
+from bisect import bisect_left, bisect_right
 
 
 class MaxAutomationLevels:
@@ -14,64 +17,220 @@ class MaxAutomationLevels:
         # Levels is a sorted list with tuples of the form (<LEVEL>, <END_POSITION>) where LEVEL is the maximum level for
         # that entry, and END_POSITION is where the maximum level ends and switches to the next entry in the list. The
         # list is sorted in ascending order on <END_POSITION>
-        self.levels, self.speeds = self.calculate_max_levels()
-        self.pessimistic_levels, _ = self.calculate_max_levels("pessimistic_max_level")
-        self.optimistic_levels, _ = self.calculate_max_levels("optimistic_max_level")
+        self.road_part_ends = [road_part.end for road_part in road.road_parts]  # Used to look up road parts
+        self.intervals = self.get_event_intervals()  # The intervals on which automation levels might change
+        self.levels, self.speeds, self.pessimistic_levels, self.optimistic_levels = self.calculate_max_levels()
         self.ttaf = None
         self.ttau = None
+        # Lookup tables for the TTAF and TTAU calculations, rebuilt every time the max levels change
+        self.level_tables = None
+        self.speed_ends = None
+        self.segment_times = None
+        self.travel_times = None
+        self.build_lookup_tables()
 
-    def update_max_levels(self):
+    def update_max_levels(self, new_event=None):
         """
-        Recalculates the maximum automation levels throughout the road.
+        Recalculates the maximum automation levels throughout the road. If new_event is set, only the levels and speeds
+        on the part of the road affected by that (newly added) event are recalculated, and spliced into the existing
+        lists.
         """
-        self.levels, self.speeds = self.calculate_max_levels()
-        self.pessimistic_levels, _ = self.calculate_max_levels("pessimistic_max_level")
-        self.optimistic_levels, _ = self.calculate_max_levels("optimistic_max_level")
+        if new_event is None:
+            self.intervals = self.get_event_intervals()
+            self.levels, self.speeds, self.pessimistic_levels, self.optimistic_levels = self.calculate_max_levels()
+        else:
+            window_start, window_end = self._add_event_to_intervals(new_event)
+            window = self.intervals[bisect_left(self.intervals, window_start):
+                                    bisect_left(self.intervals, window_end) + 1]
+            # Only the events that overlap with the window can change the levels in it
+            events = []
+            for event in self.road.event_manager.events:
+                if event.start >= window_end:
+                    break
+                elif event.end > window_start:
+                    events.append(event)
+
+            levels, speeds, pessimistic_levels, optimistic_levels = self.calculate_max_levels(window, events)
+            self.levels = self._splice(self.levels, self.level_tables["levels"][0], levels, window_start, window_end)
+            self.speeds = self._splice(self.speeds, self.speed_ends, speeds, window_start, window_end)
+            self.pessimistic_levels = self._splice(self.pessimistic_levels, self.level_tables["pessimistic_levels"][0],
+                                                   pessimistic_levels, window_start, window_end)
+            self.optimistic_levels = self._splice(self.optimistic_levels, self.level_tables["optimistic_levels"][0],
+                                                  optimistic_levels, window_start, window_end)
+        self.build_lookup_tables()
 
-    def calculate_max_levels(self, level_type="max_level"):
+    def _add_event_to_intervals(self, event):
+        """
+        Adds the start and end of a new event to the intervals. Returns the start and end of the window in which the
+        levels need to be recalculated: from the last existing point before the event start, to the first existing point
+        after the event end (or the end of the intervals if the event continues beyond the end of the road).
+        """
+        road_length = self.road.total_distance
+        window_start = self.intervals[bisect_right(self.intervals, min(event.start, road_length)) - 1]
+        if event.end > road_length:
+            window_end = self.intervals[-1]
+        else:
+            window_end = self.intervals[bisect_left(self.intervals, event.end)]
+        for point in (min(event.start, road_length), min(event.end, road_length)):
+            index = bisect_left(self.intervals, point)
+            if index == len(self.intervals) or self.intervals[index] != point:
+                self.intervals.insert(index, point)
+        return window_start, window_end
+
+    @staticmethod
+    def _splice(old_values, old_ends, window_values, window_start, window_end):
+        """
+        Returns a new list of (<VALUE>, <END_POSITION>) tuples, where the part of old_values between window_start and
+        window_end is replaced by window_values. Neighbouring entries with the same value are merged, like in
+        calculate_max_levels.
         """
-        Calculates the maximum automation levels throughout the road and returns them in a sorted list of tuples with
-        the level and the end position of that level. Also calculates the maximum speeds in a similar fashion.
+        # Entries that end before the window, where the entry that overlaps with the window is cut off at its start
+        start_index = bisect_right(old_ends, window_start)
+        values = old_values[:start_index]
+        if start_index < len(old_values) and window_start > (old_ends[start_index - 1] if start_index > 0 else 0):
+            values.append((old_values[start_index][0], window_start))
+        # Entries that end after the window
+        remaining_values = old_values[bisect_right(old_ends, window_end):]
+        for part in (window_values, remaining_values):
+            if part and values and values[-1][0] == part[0][0]:
+                values[-1] = (part[0][0], part[0][1])
+                values.extend(part[1:])
+            else:
+                values.extend(part)
+        return values
+
+    def build_lookup_tables(self):
+        """
+        Builds the lookup tables used to calculate TTAF and TTAU. For every list of levels, this holds the end positions
+        of the levels (to find the current level with a bisect) and, for every index and level, the result of
+        get_start_of_next_level. For the speeds, it holds the end positions, the travel time of every speed segment and
+        the cumulative travel time from the start of the road to the end of every speed segment.
+        """
+        self.level_tables = {level_type: self._build_level_table(getattr(self, level_type))
+                             for level_type in ["levels", "pessimistic_levels", "optimistic_levels"]}
+        self.speed_ends = [end for _, end in self.speeds]
+        self.segment_times = []
+        self.travel_times = []
+        total_time = 0
+        previous_end = 0
+        for speed, end in self.speeds:
+            self.segment_times.append((float(end - previous_end) / speed) * 3600)
+            total_time += self.segment_times[-1]
+            self.travel_times.append(total_time)
+            previous_end = end
+
+    @staticmethod
+    def _build_level_table(levels):
+        """
+        Returns a tuple with the end positions of the levels and a dictionary that maps every level to a list with the
+        start of the next occurrence of that level for every index in levels (see get_start_of_next_level).
+        """
+        ends = [end for _, end in levels]
+        next_starts = {}
+        for level in ["L0", "L2", "L3", "L4"]:
+            starts = [sys.maxsize] * len(levels)
+            # Walk backwards, so the start of the next occurrence is known at every index
+            next_start = sys.maxsize
+            for i in range(len(levels) - 1, -1, -1):
+                if levels[i][0] == level:
+                    # If the level occurs at the index itself, the end of the last level is used
+                    starts[i] = ends[-1]
+                    next_start = ends[i - 1] if i > 0 else ends[-1]
+                else:
+                    starts[i] = next_start
+            next_starts[level] = starts
+        return ends, next_starts
+
+    def _get_level_table(self, levels):
         """
-        levels = []
+        Returns the lookup table for the given list of levels, which is built on the fly if it is not one of the max
+        levels of this road.
+        """
+        for level_type, table in self.level_tables.items():
+            if getattr(self, level_type) is levels:
+                return table
+        return self._build_level_table(levels)
+
+    def calculate_max_levels(self, intervals=None, events=None):
+        """
+        Calculates the maximum automation levels throughout the road and returns them in sorted lists of tuples with
+        the level and the end position of that level. Also calculates the maximum speeds in a similar fashion. Returns
+        the realistic levels, the speeds, the pessimistic levels and the optimistic levels, in that order.
+        If intervals and events are set, the levels are only calculated for those intervals and events.
+
+        This is a sweep over the intervals: an event becomes active once the end of the interval is past its start
+        (events are sorted on starting position), and stops being active once the start of the interval is at or past
+        its end. The levels and speeds of the active events are kept in counters, so the lowest level and speed of an
+        interval are known without looping through all events.
+        """
+        if intervals is None:
+            intervals = self.intervals
+        if events is None:
+            events = self.road.event_manager.events
+        level_types = ["max_level", "pessimistic_max_level", "optimistic_max_level"]
+        all_levels = {level_type: [] for level_type in level_types}
         speeds = []
-        intervals = self.get_event_intervals()  # The intervals on which automation levels might change
-        # This is O(n^2), which might not be the quickest possible solution, but there are only a few events so the
-        # time it takes is negligible anyway.
+        # For every level type, the number of active events per level, and the same for the speeds
+        active_levels = {level_type: {} for level_type in level_types}
+        active_speeds = {}
+        active_ends = []  # Heap with the ends of the active events
+        event_index = 0
         for i in range(len(intervals) - 1):  # Loop through the intervals
             start = intervals[i]
             end = intervals[i + 1]
-            lowest_level = self.config.maximum_automation_level
-            lowest_speed = sys.maxsize
-            # Loop through the events to see which ones overlap with the current interval
-            for event_index, event in enumerate(self.road.event_manager.events):
-                # Events are sorted on starting position, so from the first event that starts after the current interval
-                # end, all other events after it will also be outside the interval
-                if event.start >= end:
-                    break
-                # If the event ends after the start of the interval, it must be in the interval range because of the
-                # previous if clause (its start is before the end of the interval). So if then the max level of the
-                # event is lower than the current lowest level for this interval, update it
-                elif event.end > start:
-                    if getattr(event, level_type) < lowest_level:
-                        lowest_level = getattr(event, level_type)
-                    if event.max_speed < lowest_speed:
-                        lowest_speed = event.max_speed
+            # Activate the events that start before the end of the interval
+            while event_index < len(events) and events[event_index].start < end:
+                event = events[event_index]
+                heapq.heappush(active_ends, (event.end, event_index))
+                for level_type in level_types:
+                    self._add_to_counter(active_levels[level_type], getattr(event, level_type), 1)
+                self._add_to_counter(active_speeds, event.max_speed, 1)
+                event_index += 1
+            # Deactivate the events that end before the start of the interval
+            while active_ends and active_ends[0][0] <= start:
+                event = events[heapq.heappop(active_ends)[1]]
+                for level_type in level_types:
+                    self._add_to_counter(active_levels[level_type], getattr(event, level_type), -1)
+                self._add_to_counter(active_speeds, event.max_speed, -1)
 
             # Get the current road part and take the minimum level for that road part
-            current_road_part = self.road.get_road_part(end - 0.01)
-            lowest_level = min(lowest_level, current_road_part.max_level)
-            lowest_speed = min(lowest_speed, current_road_part.speed)
-            # If the previous level had the same lowest level, simply extend it
-            if len(levels) > 0 and levels[-1][0] == lowest_level:
-                levels[-1] = (lowest_level, end)
-            else:
-                levels.append((lowest_level, end))
-            if len(speeds) > 0 and speeds[-1][0] == lowest_speed:
-                speeds[-1] = (lowest_speed, end)
-            else:
-                speeds.append((lowest_speed, end))
-        return levels, speeds
+            current_road_part = self._get_road_part(end - 0.01)
+            for level_type in level_types:
+                lowest_level = min(active_levels[level_type], default=self.config.maximum_automation_level)
+                lowest_level = min(lowest_level, self.config.maximum_automation_level, current_road_part.max_level)
+                self._extend(all_levels[level_type], lowest_level, end)
+            lowest_speed = min(active_speeds, default=sys.maxsize)
+            self._extend(speeds, min(lowest_speed, current_road_part.speed), end)
+        return all_levels["max_level"], speeds, all_levels["pessimistic_max_level"], \
+            all_levels["optimistic_max_level"]
+
+    @staticmethod
+    def _add_to_counter(counter, value, count):
+        """
+        Adds count to the number of occurrences of value in counter, removing the value once it does not occur anymore.
+        """
+        counter[value] = counter.get(value, 0) + count
+        if counter[value] == 0:
+            del counter[value]
+
+    @staticmethod
+    def _extend(values, value, end):
+        """
+        Adds a (<VALUE>, <END_POSITION>) tuple to values. If the previous entry has the same value, simply extend it.
+        """
+        if len(values) > 0 and values[-1][0] == value:
+            values[-1] = (value, end)
+        else:
+            values.append((value, end))
+
+    def _get_road_part(self, position):
+        """
+        Returns the road part a position is on, like Road.get_road_part but using a bisect on the road part ends.
+        """
+        index = bisect_left(self.road_part_ends, position)
+        if index < len(self.road_part_ends) and self.road.road_parts[index].start <= position:
+            return self.road.road_parts[index]
+        return self.road.last_road_part
 
     def get_event_intervals(self):
         """
@@ -93,11 +252,10 @@ class MaxAutomationLevels:
         """
         Returns TTAF for L2, L3, and L4 in a list of length 3, in that respective order
         """
-        levels = getattr(self, level_type)
-        self.ttaf = self._get_time_to_max_levels(position, levels)
+        self.ttaf = self._get_time_to_max_levels(position, level_type)
         return self.ttaf
 
-    def _get_time_to_max_levels(self, position, levels):
+    def _get_time_to_max_levels(self, position, level_type):
         """
         Calculates the time it takes for the car before it reaches the various maximum automation levels.
         """
@@ -105,42 +263,45 @@ class MaxAutomationLevels:
         if position > self.road.last_road_part.end:
             return self.ttaf
 
-        index = self.get_index_of_current_level(position, levels)  # Index of current position in levels list
+        levels = getattr(self, level_type)
+        ends, next_starts = self.level_tables[level_type]
+        # Index of current position in levels list
+        index = min(bisect_right(ends, position), len(levels) - 1)
         current_level = levels[index][0]  # Current max level
 
         if current_level == "L4":  # In this case, all automation levels are currently available
             return [0, 0, 0]
         elif current_level == "L3":  # In this case, L3 and L2 are currently available. L4 needs to be calculated.
-            l4_starts_at = self.get_start_of_next_level("L4", index, levels)
-            return [0, 0, self.road.get_time_to_position(position, l4_starts_at)]
+            l4_starts_at = next_starts["L4"][index]
+            return [0, 0, self.get_time_to_position(position, l4_starts_at)]
         elif current_level == "L2":  # In this case, L2 is currently available. L3 and L4 need to be calculated.
-            l4_starts_at = self.get_start_of_next_level("L4", index, levels)
-            l3_starts_at = self.get_start_of_next_level("L3", index, levels)
+            l4_starts_at = next_starts["L4"][index]
+            l3_starts_at = next_starts["L3"][index]
             if l3_starts_at > l4_starts_at:  # If L4 is available before L3, then L3 is available at the moment L4 is
                 # Use time to L4 fitness for both L3 and L4
-                time_to_l4 = self.road.get_time_to_position(position, l4_starts_at)
+                time_to_l4 = self.get_time_to_position(position, l4_starts_at)
                 return [0, time_to_l4, time_to_l4]
             else:  # Else, both L4 and L3 need to be calculated separately
-                return [0, self.road.get_time_to_position(position, l3_starts_at),
-                        self.road.get_time_to_position(position, l4_starts_at)]
+                return [0, self.get_time_to_position(position, l3_starts_at),
+                        self.get_time_to_position(position, l4_starts_at)]
         else:  # In the last case, L4, L3 and L2 all need to be calculated
-            l4_starts_at = self.get_start_of_next_level("L4", index, levels)
-            l3_starts_at = self.get_start_of_next_level("L3", index, levels)
-            l2_starts_at = self.get_start_of_next_level("L2", index, levels)
+            l4_starts_at = next_starts["L4"][index]
+            l3_starts_at = next_starts["L3"][index]
+            l2_starts_at = next_starts["L2"][index]
 
-            time_to_l4 = self.road.get_time_to_position(position, l4_starts_at)
+            time_to_l4 = self.get_time_to_position(position, l4_starts_at)
             if l4_starts_at < l3_starts_at:  # Same logic as above
                 # Time to L3 is the same as time to L4
                 time_to_l3 = time_to_l4
             else:
-                time_to_l3 = self.road.get_time_to_position(position, l3_starts_at)
+                time_to_l3 = self.get_time_to_position(position, l3_starts_at)
 
             if l4_starts_at < l2_starts_at:
                 time_to_l2 = time_to_l4
             elif l3_starts_at < l2_starts_at:
                 time_to_l2 = time_to_l3
             else:
-                time_to_l2 = self.road.get_time_to_position(position, l2_starts_at)
+                time_to_l2 = self.get_time_to_position(position, l2_starts_at)
 
             return [time_to_l2, time_to_l3, time_to_l4]
 
@@ -148,46 +309,48 @@ class MaxAutomationLevels:
         """
         Returns TTAU for L2, L3, and L4 in a list of length 3, in that respective order.
         """
-        levels = getattr(self, level_type)
-        self.ttau = self._get_time_to_end_of_levels(position, levels)
+        self.ttau = self._get_time_to_end_of_levels(position, level_type)
         return self.ttau
 
-    def _get_time_to_end_of_levels(self, position, levels):
+    def _get_time_to_end_of_levels(self, position, level_type):
         # If the car has driven the complete route, keep the ttau the same as the last level it was on
         if position > self.road.last_road_part.end:
             return self.ttau
 
-        index = self.get_index_of_current_level(position, levels)  # Index of current position in levels list
+        levels = getattr(self, level_type)
+        ends, next_starts = self.level_tables[level_type]
+        # Index of current position in levels list
+        index = min(bisect_right(ends, position), len(levels) - 1)
         current_level = levels[index][0]  # Current max level
 
         if current_level == "L0":  # If max level is L0, all levels are currently unavailable
             return [0, 0, 0]
         elif current_level == "L2":  # In this case, L3 and L4 are unavailable and L2 needs to be calculated
-            l2_ends_at = self.get_start_of_next_level("L0", index, levels)
-            return [self.road.get_time_to_position(position, l2_ends_at), 0, 0]
+            l2_ends_at = next_starts["L0"][index]
+            return [self.get_time_to_position(position, l2_ends_at), 0, 0]
         elif current_level == "L3":  # L4 unavailable, L3 and L2 need to be calculated
-            l2_ends_at = self.get_start_of_next_level("L0", index, levels)
-            l3_ends_at = self.get_start_of_next_level("L2", index, levels)
+            l2_ends_at = next_starts["L0"][index]
+            l3_ends_at = next_starts["L2"][index]
             # If L2 ends (meaning it is not available anymore) before L3, their TTAU is the same
             if l2_ends_at < l3_ends_at:
-                time_to_l0 = self.road.get_time_to_position(position, l2_ends_at)
+                time_to_l0 = self.get_time_to_position(position, l2_ends_at)
                 return [time_to_l0, time_to_l0, 0]
             else:
-                return [self.road.get_time_to_position(position, l2_ends_at),
-                        self.road.get_time_to_position(position, l3_ends_at), 0]
+                return [self.get_time_to_position(position, l2_ends_at),
+                        self.get_time_to_position(position, l3_ends_at), 0]
         else:
-            l2_ends_at = self.get_start_of_next_level("L0", index, levels)
-            l3_ends_at = min(self.get_start_of_next_level("L2", index, levels), l2_ends_at)
-            l4_ends_at = min(self.get_start_of_next_level("L3", index, levels), l3_ends_at)
-            time_to_l0 = self.road.get_time_to_position(position, l2_ends_at)
+            l2_ends_at = next_starts["L0"][index]
+            l3_ends_at = min(next_starts["L2"][index], l2_ends_at)
+            l4_ends_at = min(next_starts["L3"][index], l3_ends_at)
+            time_to_l0 = self.get_time_to_position(position, l2_ends_at)
             if l2_ends_at == l3_ends_at:
                 time_l3_ends = time_to_l0
             else:
-                time_l3_ends = self.road.get_time_to_position(position, l3_ends_at)
+                time_l3_ends = self.get_time_to_position(position, l3_ends_at)
             if l3_ends_at == l4_ends_at:
                 time_l4_ends = time_l3_ends
             else:
-                time_l4_ends = self.road.get_time_to_position(position, l4_ends_at)
+                time_l4_ends = self.get_time_to_position(position, l4_ends_at)
             return [time_to_l0, time_l3_ends, time_l4_ends]
 
     def get_index_of_current_level(self, position, levels=None):
@@ -198,8 +361,8 @@ class MaxAutomationLevels:
         """
         if levels is None:
             levels = self.levels
-        return next((i for i, level in enumerate(levels) if position < level[1] and
-                    (i == 0 or position >= levels[i - 1][1])), len(levels) - 1)
+        ends, _ = self._get_level_table(levels)
+        return min(bisect_right(ends, position), len(levels) - 1)
 
     def get_start_of_next_level(self, level, current_level_index, levels=None):
         """
@@ -208,5 +371,110 @@ class MaxAutomationLevels:
         """
         if levels is None:
             levels = self.levels
-        remaining_levels = levels[current_level_index:]
-        return next((remaining_levels[i - 1][1] for i, v in enumerate(remaining_levels) if v[0] == level), sys.maxsize)
+        _, next_starts = self._get_level_table(levels)
+        return next_starts[level][current_level_index] if level in next_starts else sys.maxsize
+
+    def get_time_to_position(self, current_position, final_position):
+        """
+        Calculates the time (in seconds) it takes to travel from one position to another on the road, given the max
+        speeds. Uses the cumulative travel times, so only the partial speed segments at both positions are calculated.
+        """
+        # If the final position is beyond the end of the road, the time it takes is infinite
+        if final_position > self.road.last_road_part.end:
+            return sys.maxsize
+
+        speeds = self.speeds
+        final_position = min(final_position, self.speed_ends[-1])
+        current_index = bisect_left(self.speed_ends, current_position)  # Index of the speed at the current position
+        final_index = bisect_left(self.speed_ends, final_position)  # Index of the speed at the final position
+
+        speed, end = speeds[current_index]
+        first_time = (float(min(final_position, end) - current_position) / speed) * 3600
+        if final_index <= current_index:
+            return round(first_time, 2)
+
+        # Time to the end of the part of the last speed segment up to the final position
+        speed, _ = speeds[final_index]
+        last_time = (float(final_position - speeds[final_index - 1][1]) / speed) * 3600
+        # Full speed segments in between
+        total_time = first_time + (self.travel_times[final_index - 1] - self.travel_times[current_index]) + last_time
+        # The result should be the same as when the segments are summed one by one (first_time, every full segment and
+        # last_time, in the order they are driven), as the time has always been calculated. Both sums differ by at most
+        # a rounding error, so they are rounded to the same hundredth unless a value halfway between two hundredths is
+        # within that error of total_time. Only in that case, the segments are summed one by one.
+        if self._is_near_rounding_tie(total_time, self._get_summation_error(final_index, total_time)):
+            total_time = first_time
+            for segment_time in self.segment_times[current_index + 1:final_index]:
+                total_time += segment_time
+            total_time += last_time
+        return round(total_time, 2)
+
+    def _get_summation_error(self, final_index, total_time):
+        """
+        Returns an upper bound of the difference between total_time, calculated with the cumulative travel times up to
+        final_index, and the sum of the same segment times one by one. The cumulative time after i segments has an error
+        of at most i * u times its value (where u is the unit roundoff, half the machine epsilon), the sum of the
+        segments one by one one of at most final_index * u * total_time, and the remaining additions one of u times
+        their result each. All times are positive, so the sum of these errors is less than the returned bound.
+        """
+        return (3 * final_index + 6) * sys.float_info.epsilon * (self.travel_times[final_index - 1] + total_time)
+
+    @staticmethod
+    def _is_near_rounding_tie(time, error):
+        """
+        Returns True if a value halfway between two hundredths, where round(time, 2) changes, is within error of time.
+        """
+        hundredths = time * 100
+        distance = abs(hundredths - math.floor(hundredths) - 0.5)
+        # Multiplying by 100 adds an error of at most epsilon times the result
+        return distance <= 100 * error + sys.float_info.epsilon * hundredths
+
+    def get_position_in_time(self, current_position, time):
+        """
+        Calculates the position the car will be in in time seconds, given the max speeds. Uses a bisect on the
+        cumulative travel times to find the speed segment the car will be in.
+        """
+        speeds = self.speeds
+        current_index = bisect_left(self.speed_ends, current_position)  # Index of the speed at the current position
+        if current_index == len(speeds):
+            return current_position
+
+        speed, end = speeds[current_index]
+        time_to_end = (float(end - current_position) / speed) * 3600
+        if time_to_end > time:
+            return current_position + (speed * time) / float(3600)
+
+        # Index of the first speed segment that is not passed completely within time
+        final_index = bisect_right(self.travel_times, time - time_to_end + self.travel_times[current_index],
+                                   current_index + 1)
+        if final_index == len(speeds):
+            return self.speed_ends[-1]
+        time -= time_to_end + (self.travel_times[final_index - 1] - self.travel_times[current_index])
+        return self.speed_ends[final_index - 1] + (speeds[final_index][0] * time) / float(3600)
+
+    def get_next_change(self, position):
+        """
+        Returns the first position from position onwards at which one of the (pessimistic, realistic or optimistic)
+        max levels or the max speed ends, or sys.maxsize if there is none.
+        """
+        next_change = sys.maxsize
+        for ends in [table[0] for table in self.level_tables.values()] + [self.speed_ends]:
+            index = bisect_left(ends, position)
+            if index < len(ends):
+                next_change = min(next_change, ends[index])
+        return next_change
+
+    def get_speed_at_position(self, position):
+        """
+        Returns the max speed at the given position. The speed segment that ends at the position is taken.
+        """
+        return self.speeds[bisect_left(self.speed_ends, position)][0]
+
+    def get_level_at_position(self, position):
+        """
+        Returns the max automation level at the given position. The level that ends at the position is taken, and if the
+        position is beyond the end of the road, the maximum automation level is returned.
+        """
+        ends, _ = self.level_tables["levels"]
+        index = bisect_left(ends, position)
+        return self.levels[index][0] if index < len(self.levels) else self.config.maximum_automation_level
@@ -1,6 +1,6 @@
 import sys
 
-from gym.utils import seeding
+from gym_simulator.utils.utils import create_rng
 from gym_simulator.roads.event_manager import RoadEventManager
 from gym_simulator.roads.max_automation_levels import MaxAutomationLevels
 from gym_simulator.roads.road_generator import RoadGenerator
@@ -14,7 +14,7 @@ class Road:
 
     def __init__(self, config, seed, preset_road=None):
         self.config = config
-        self.rng, _ = seeding.np_random(seed)
+        self.rng = create_rng(seed)
         self.preset_road = preset_road
         # A list of AbstractRoad objects
         self.road_parts = RoadGenerator(self.config, self.rng, preset_road).generate_road()
@@ -33,14 +33,32 @@ class Road:
         Updates the current road part and the current maximum level.
         """
         self._update_current_road_part(car.position)
-        self.current_max_level = next((level for i, (level, end) in enumerate(self.max_automation_levels.levels) if
-                                      end >= car.position and
-                                      (i == 0 or car.position > self.max_automation_levels.levels[i - 1][1])),
-                                      self.config.maximum_automation_level)
+        self.current_max_level = self.max_automation_levels.get_level_at_position(car.position)
         # Possibly creates a new event
-        event_added = self.event_manager.step(car)
-        if event_added:
-            self.max_automation_levels.update_max_levels()  # Update the maximum automation levels
+        new_event = self.event_manager.step(car)
+        if new_event:
+            # Update the maximum automation levels on the part of the road affected by the new event
+            self.max_automation_levels.update_max_levels(new_event)
+
+    def get_next_change(self, position):
+        """
+        Returns the first position from position onwards at which something on the road can change, which is the end of
+        the current road part, the start or end of an event, or the end of a max level or speed.
+        """
+        return min(self.current_road_part.end, self.total_distance, self.max_automation_levels.get_next_change(position),
+                   self.event_manager.get_next_change(position))
+
+    def get_steps_until_next_event(self):
+        """
+        Returns the number of timesteps until the next random dynamic event is generated (including the current one).
+        """
+        return self.event_manager.get_steps_until_next_dynamic_event()
+
+    def skip_steps(self, steps, car):
+        """
+        Skips steps timesteps in which nothing changes on the road, after which the car is at its new position.
+        """
+        self.event_manager.skip_steps(steps, car)
 
     def get_target_speed(self):
         """
@@ -72,21 +90,7 @@ class Road:
         if final_position > self.road_parts[-1].end:
             return sys.maxsize
 
-        speeds = self.max_automation_levels.speeds
-        current_speed_index = next(i for i, (_, end) in enumerate(speeds) if
-                                   end >= current_position and (i == 0 or current_position > speeds[i - 1][1]))
-
-        total_time = 0
-        previous_end = current_position
-        for (speed, end) in speeds[current_speed_index:]:
-            start = max(current_position, previous_end)
-            end = min(final_position, end)
-            previous_end = end
-            total_time += (float(end - start) / speed) * 3600
-            if end > final_position:
-                break
-
-        return round(total_time, 2)
+        return self.max_automation_levels.get_time_to_position(current_position, final_position)
 
     def get_position_in_time(self, current_position, time):
         """
@@ -96,17 +100,4 @@ class Road:
         if current_position > self.road_parts[-1].end:
             return current_position
 
-        speeds = self.max_automation_levels.speeds
-        current_speed_index = next(i for i, (_, end) in enumerate(speeds) if
-                                   end >= current_position and (i == 0 or current_position > speeds[i - 1][1]))
-
-        for (speed, end) in speeds[current_speed_index:]:
-            time_to_end = (float(end - current_position) / speed) * 3600
-            if time_to_end > time:
-                current_position += (speed * time) / float(3600)
-                break
-            else:
-                current_position = end
-                time -= time_to_end
-
-        return current_position
+        return self.max_automation_levels.get_position_in_time(current_position, time)
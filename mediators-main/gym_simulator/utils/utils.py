@@ -1,3 +1,5 @@
+import numpy as np
+from gym.utils import seeding
 from scipy.special import ndtri
 import sys
 
@@ -15,6 +17,59 @@ def calculate_probability_per_timestep(timesteps, required_probability):
     return 1 - ((1 - required_probability) ** (1 / float(timesteps)))
 
 
+def create_rng(seed):
+    """
+    Creates a random number generator from a seed, which is either an integer or a SeedSequence (e.g. a stream spawned
+    for a component of a run, see MediatorEnv.get_component_seeds). Both result in a RandomState, which is what
+    seeding.np_random returns, with the same Mersenne Twister bit generator.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.RandomState(np.random.MT19937(seed))
+    rng, _ = seeding.np_random(seed)
+    return rng
+
+
+class GeometricSampler:
+    """
+    Decides if an event with a fixed probability per timestep happens in the current timestep, without drawing a random
+    number in every timestep. Instead, the number of timesteps until the event happens is drawn from a geometric
+    distribution, and counted down in every timestep that the event could happen. This is statistically equivalent to
+    checking rng.rand() < probability in each of these timesteps.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.probability = None  # The probability the current countdown is drawn for
+        self.remaining_steps = None  # The number of timesteps until the event happens (including the current one)
+
+    def occurs(self, probability):
+        """
+        Returns True if the event happens in the current timestep. When the probability differs from the previous
+        timestep, a new countdown is drawn, which is allowed because the geometric distribution is memoryless.
+        """
+        self.remaining_steps = self.get_remaining_steps(probability) - 1
+        if self.remaining_steps == 0:
+            self.remaining_steps = None
+            return True
+        return False
+
+    def get_remaining_steps(self, probability):
+        """
+        Returns the number of timesteps until the event happens, including the current one, if it has the given
+        probability. A new countdown is drawn in the same way as in occurs.
+        """
+        if self.remaining_steps is None or probability != self.probability:
+            self.probability = probability
+            self.remaining_steps = sys.maxsize if probability <= 0 else int(self.rng.geometric(min(probability, 1)))
+        return self.remaining_steps
+
+    def skip(self, steps):
+        """
+        Counts down steps timesteps at once, which should be fewer than the remaining steps.
+        """
+        self.remaining_steps -= steps
+
+
 def calculate_gaussian_distribution(start, end, success_probability, skew=0.0):
     """
     This function calculates mean and standard deviation for a Gaussian distribution such that the probability that a
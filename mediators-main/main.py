@@ -25,12 +25,17 @@ if __name__ == '__main__':
         "render": True,
         "dir_name": "test",
         "no_threads": 1,
+        # "chunk_size": 10,  # Runs per task of the process pool, by default 4 tasks per process per tree and noise
+        # "progress_interval": 10,  # Seconds between progress reports when running in parallel
+        # "flush_interval": 60,  # Seconds between writing the partial results when running in parallel
+        # "resume": True,  # Skips the runs that are in the journal of a previous simulation with the same settings
         # When used, used this file to preset (parts of) the road
         # "road_file": os.path.join("sweden_route", "new_route.yaml"),
         # "include_road_data": True,
         # "route_data_file": os.path.join("sweden_route", "route_data.pkl"),
         # "log_mediator": "ACTIONS",  # Can be left out (or None), ALL, or ACTIONS
-        # "save_fig": "testrun.png",  # When uncommented, saves figures in images directory
+        # "save_fig": "testrun.png",  # When uncommented, saves figures in images directory (also without rendering)
+        # "trace_dir": "traces",  # When uncommented, records the state of every step of every run in this directory
     })
 
     if settings.render and settings.no_threads > 1:
@@ -34,6 +34,9 @@ class ActionNode(AbstractNode):
 
         return self.action, args
 
+    def evaluate_action(self, state):
+        return self.action
+
     def get_evaluation_path(self, state):
         return self.action
 
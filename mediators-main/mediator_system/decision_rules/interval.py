@@ -0,0 +1,149 @@
+from numbers import Number
+
+from mediator_system.decision_rules.tree_exceptions import IndeterminateError
+
+
+class Interval:
+    """
+    A closed interval [low, high] that stands for a numeric state variable of which only the bounds are known. It can be
+    used in the expressions of a decision tree instead of a number: arithmetic (+, -, *, /, abs and round) results in a
+    new Interval containing all possible outcomes, and a comparison results in a bool if it has the same outcome for all
+    values in the Interval(s). If the outcome depends on the value, an IndeterminateError is raised.
+    """
+
+    def __init__(self, low, high):
+        if low > high:
+            raise ValueError("The lower bound of an Interval cannot be larger than its upper bound.")
+        self.low = low
+        self.high = high
+
+    @staticmethod
+    def _bounds(other):
+        """
+        Returns the bounds of other, which is either an Interval or a number, or None if it's neither of these.
+        """
+        if isinstance(other, Interval):
+            return other.low, other.high
+        if isinstance(other, Number) and not isinstance(other, bool):
+            return other, other
+        return None
+
+    def __add__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return Interval(self.low + bounds[0], self.high + bounds[1])
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Interval(-self.high, -self.low)
+
+    def __sub__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return Interval(self.low - bounds[1], self.high - bounds[0])
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        products = [self.low * bounds[0], self.low * bounds[1], self.high * bounds[0], self.high * bounds[1]]
+        return Interval(min(products), max(products))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._divide((self.low, self.high), bounds, "/", other)
+
+    def __rtruediv__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._divide(bounds, (self.low, self.high), "/", other)
+
+    def _divide(self, dividend, divisor, operator, other):
+        """
+        Returns the Interval with all quotients of the values within the bounds of dividend and divisor. If the divisor
+        can be zero, the quotient is unbounded (or undefined), so an IndeterminateError is raised.
+        """
+        if divisor[0] <= 0 <= divisor[1]:
+            raise IndeterminateError("The outcome of {0} {1} {2} is not bounded for all values.".format(self, operator,
+                                                                                                       other))
+        quotients = [dividend[0] / divisor[0], dividend[0] / divisor[1], dividend[1] / divisor[0],
+                     dividend[1] / divisor[1]]
+        return Interval(min(quotients), max(quotients))
+
+    def __abs__(self):
+        if self.low >= 0:
+            return Interval(self.low, self.high)
+        if self.high <= 0:
+            return -self
+        return Interval(0, max(-self.low, self.high))
+
+    def __round__(self, ndigits=None):
+        # Rounding is non-decreasing, so the bounds of the result are the rounded bounds
+        return Interval(round(self.low, ndigits), round(self.high, ndigits))
+
+    def __lt__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._decide(self.high < bounds[0], self.low >= bounds[1], "<", other)
+
+    def __le__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._decide(self.high <= bounds[0], self.low > bounds[1], "<=", other)
+
+    def __gt__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._decide(self.low > bounds[1], self.high <= bounds[0], ">", other)
+
+    def __ge__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return NotImplemented
+        return self._decide(self.low >= bounds[1], self.high < bounds[0], ">=", other)
+
+    def __eq__(self, other):
+        bounds = self._bounds(other)
+        if bounds is None:
+            return False
+        return self._decide(self.low == self.high == bounds[0] == bounds[1],
+                            self.high < bounds[0] or self.low > bounds[1], "==", other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def _decide(self, always_true, always_false, operator, other):
+        """
+        Returns the outcome of a comparison, given whether it is true or false for all values.
+        """
+        if always_true:
+            return True
+        if always_false:
+            return False
+        raise IndeterminateError("The outcome of {0} {1} {2} is not the same for all values.".format(self, operator,
+                                                                                                     other))
+
+    def __bool__(self):
+        raise IndeterminateError("The truth value of {0} is not the same for all values.".format(self))
+
+    def __str__(self):
+        return "[{0}, {1}]".format(self.low, self.high)
+
+    def __repr__(self):
+        return str(self)
@@ -14,6 +14,13 @@ class AbstractNode(ABC):
         """
         pass
 
+    @abstractmethod
+    def evaluate_action(self, state):
+        """
+        Evaluate the current state, returning only the name of the action that is reached.
+        """
+        pass
+
     @abstractmethod
     def get_evaluation_path(self, state):
         """
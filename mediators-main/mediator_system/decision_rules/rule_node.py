@@ -1,7 +1,8 @@
 import sys
 from keyword import iskeyword
 
-from mediator_system.decision_rules.tree_exceptions import VariableError, NoSpacesError
+from mediator_system.decision_rules.interval import Interval
+from mediator_system.decision_rules.tree_exceptions import VariableError, NoSpacesError, IndeterminateError
 
 
 class RuleNode:
@@ -49,6 +50,17 @@ class RuleNode:
                   "which is possibly missing in the following statement: {0}".format(self.expr)
             raise NoSpacesError(err) from None
 
+    def evaluate_action(self, state):
+        """
+        Evaluates the current state like evaluate, but only returns the name of the action that is reached, without
+        evaluating its arguments. Values in the state may be Intervals, in which case an IndeterminateError is raised if
+        the path through the tree is not the same for all values in the Intervals.
+        """
+        result = self.eval_expr_func(state)
+        if isinstance(result, Interval):
+            raise IndeterminateError("The outcome of {0} is not the same for all values.".format(self.expr))
+        return self.children[str(result)].evaluate_action(state)
+
     def get_evaluation_path(self, state):
         result = str(self.eval_expr_func(state))
         return "{0} ==> {1}:{2}".format(self.expr, result, self.children[result].get_evaluation_path(state))
@@ -8,3 +8,7 @@ class NoSpacesError(Exception):
 
 class IndentError(Exception):
     pass
+
+
+class IndeterminateError(Exception):
+    pass
@@ -15,6 +15,17 @@ class TreeParser:
 
     def __init__(self, tree_name, available_actions):
         self.actions = available_actions
+        TreeParser.find_trees()
+
+        with open(TreeParser.paths[tree_name]) as tree_file:
+            tree_lines = tree_file.readlines()
+            self.tree_lines = [line.replace('\t', '    ') for line in tree_lines if line.strip().split("#", 1)[0]]
+
+    @staticmethod
+    def find_trees():
+        """
+        Finds the tree files, if they were not found yet.
+        """
         # All tree files are the decision_trees directory. self.trees contains all the names of these files,
         # which can be used to parse subtrees (defined in a different file)
         if len(TreeParser.trees) == 0:
@@ -26,9 +37,26 @@ class TreeParser:
                                          .format(file))
                     TreeParser.paths[file] = os.path.join(root, file)
 
-        with open(TreeParser.paths[tree_name]) as tree_file:
-            tree_lines = tree_file.readlines()
-            self.tree_lines = [line.replace('\t', '    ') for line in tree_lines if line.strip().split("#", 1)[0]]
+    @staticmethod
+    def get_locations(tree_name):
+        """
+        Returns the locations of the tree file and of the files of all its subtrees, which are parsed with the tree.
+        """
+        TreeParser.find_trees()
+        locations = []
+        tree_names = [tree_name]
+        while tree_names:
+            location = TreeParser.paths[tree_names.pop()]
+            if location in locations:
+                continue
+            locations.append(location)
+            with open(location) as tree_file:
+                for line in tree_file:
+                    # The expression of a node, as in parse and parse_node
+                    expr = line.strip().split("#", 1)[0].split(':')[-1].split("=>")[0].strip()
+                    if expr in TreeParser.trees:
+                        tree_names.append(expr)
+        return locations
 
     def parse(self):
         root = None
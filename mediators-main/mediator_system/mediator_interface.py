@@ -1,5 +1,10 @@
+from numbers import Number
+from types import SimpleNamespace
+
+from mediator_system.decision_rules.interval import Interval
+from mediator_system.decision_rules.tree_exceptions import IndeterminateError
 from mediator_system.decision_rules.tree_parser import TreeParser
-from mediator_system.util import DotDict, level_index, get_position_in_time
+from mediator_system.util import level_index, get_position_in_time
 
 
 class MediatorInterface:
@@ -22,7 +27,49 @@ class MediatorInterface:
         """
         Get action.
         """
-        variables = DotDict(parameters)
+        state = self.build_state(parameters)
+        return self.tree.evaluate(state), state
+
+    def get_constant_action(self, first_parameters, last_parameters):
+        """
+        Returns the name of the action that the tree returns for every state in between the states built from
+        first_parameters and last_parameters, or None if that cannot be guaranteed.
+
+        All state variables should change monotonically between the two states (i.e. each variable either stays the
+        same, or only increases or only decreases). A variable that is equal in both states is then constant, and a
+        numeric variable that differs is replaced by the Interval between its two values, widened by the precision with
+        which TTA values are rounded. If any other variable differs, or the path through the tree depends on the values
+        within an Interval or on an operation that an Interval does not support, None is returned.
+        """
+        first_state = self.build_state(first_parameters)
+        last_state = self.build_state(last_parameters)
+        state = {}
+        for name, first_value in first_state.items():
+            last_value = last_state[name]
+            if first_value == last_value:
+                state[name] = first_value
+            elif self.__is_number(first_value) and self.__is_number(last_value):
+                state[name] = Interval(min(first_value, last_value) - 0.01, max(first_value, last_value) + 0.01)
+            else:
+                return None
+        try:
+            return self.tree.evaluate_action(state)
+        except (IndeterminateError, TypeError):
+            # A TypeError is raised if an expression uses an operation that is not supported by an Interval, in which
+            # case the outcome is unknown as well
+            return None
+
+    @staticmethod
+    def __is_number(value):
+        return isinstance(value, Number) and not isinstance(value, bool)
+
+    def build_state(self, parameters):
+        """
+        Builds the state that the tree is evaluated on from the parameters describing the environment.
+        """
+        # A namespace is used instead of a DotDict, since every attribute lookup on a DotDict first raises an
+        # AttributeError internally, which makes building the state slow
+        variables = SimpleNamespace(**parameters)
         current_level = variables.current_level  # Current level the car is driving in
         ttau_current = None if current_level == 'L0' else variables.ttau[level_index(current_level)]
 
@@ -84,8 +131,7 @@ class MediatorInterface:
             'driver_request': variables.driver_request,
             'road_length': variables.road_length
         }
-
-        return self.tree.evaluate(state), state
+        return state
 
     def __get_max_level_long(self, minimum_availability_time, ttaf_l2, ttaf_l3, ttaf_l4, ttau_l2, ttau_l3, ttau_l4):
         """
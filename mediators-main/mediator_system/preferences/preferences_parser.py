@@ -10,17 +10,21 @@ class PreferencesParser:
     """
 
     def __init__(self, filename, custom_loc=False):
-        if custom_loc:
-            preference_dir = filename
-        else:
-            preference_dir = os.path.join(ROOT_DIR, 'mediator_system', 'preferences', 'driver_profiles', filename)
-
-        with open(preference_dir, 'r') as stream:
+        with open(PreferencesParser.get_location(filename, custom_loc), 'r') as stream:
             try:
                 self.preferences_map = yaml.safe_load(stream)
             except yaml.YAMLError as exc:
                 print(exc)
 
+    @staticmethod
+    def get_location(filename, custom_loc=False):
+        """
+        Returns the location of the preferences file that is parsed.
+        """
+        if custom_loc:
+            return filename
+        return os.path.join(ROOT_DIR, 'mediator_system', 'preferences', 'driver_profiles', filename)
+
     def parse(self):
         """
         Create an object of the Preferences class from the parsed YAML file.
@@ -1,4 +1,5 @@
 import sys
+from bisect import bisect_left, bisect_right
 
 
 class DotDict(dict):
@@ -40,16 +41,42 @@ def get_position_in_time(speeds, current_position, time):
     road, where ending position is defined as the distance travelled since the start of the route (in KM).
     current_position specifies the current location of the car as distance travelled (in KM) since the start.
     """
-    current_speed_index = next(i for i, (_, end) in enumerate(speeds) if
-                               end >= current_position and (i == 0 or current_position > speeds[i - 1][1]))
-
-    for (speed, end) in speeds[current_speed_index:]:
-        time_to_end = (float(end - current_position) / speed) * 3600
-        if time_to_end > time:
-            current_position += (speed * time) / float(3600)
-            break
-        else:
-            current_position = end
-            time -= time_to_end
-
-    return current_position
+    speed_ends, travel_times = _get_speed_index(speeds)
+    current_index = bisect_left(speed_ends, current_position)  # Index of the speed at the current position
+    if current_index == len(speeds):
+        return current_position
+
+    speed, end = speeds[current_index]
+    time_to_end = (float(end - current_position) / speed) * 3600
+    if time_to_end > time:
+        return current_position + (speed * time) / float(3600)
+
+    # Index of the first speed segment that is not passed completely within time
+    final_index = bisect_right(travel_times, time - time_to_end + travel_times[current_index], current_index + 1)
+    if final_index == len(speeds):
+        return speed_ends[-1]
+    time -= time_to_end + (travel_times[final_index - 1] - travel_times[current_index])
+    return speed_ends[final_index - 1] + (speeds[final_index][0] * time) / float(3600)
+
+
+# The last speeds list that get_position_in_time was called with, together with its index
+_speed_index = {"speeds": None, "length": None, "index": None}
+
+
+def _get_speed_index(speeds):
+    """
+    Returns the end positions and the cumulative travel times from the start of the road for a list of speeds. The
+    index is only rebuilt when a different speeds list is passed, so speeds lists should not be changed in place.
+    """
+    if _speed_index["speeds"] is not speeds or _speed_index["length"] != len(speeds):
+        speed_ends = []
+        travel_times = []
+        total_time = 0
+        previous_end = 0
+        for speed, end in speeds:
+            total_time += (float(end - previous_end) / speed) * 3600
+            speed_ends.append(end)
+            travel_times.append(total_time)
+            previous_end = end
+        _speed_index.update(speeds=speeds, length=len(speeds), index=(speed_ends, travel_times))
+    return _speed_index["index"]
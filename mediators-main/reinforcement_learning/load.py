@@ -14,5 +14,12 @@ class Loader:
         self.env = env
 
     def load(self):
-        return self.method.load(os.path.join(ROOT_DIR, "RL_models", self.method.__name__, self.model_name,
-                                             "trained_model"), self.env)
+        return self.method.load(os.path.join(Loader.get_model_dir(self.method, self.model_name), "trained_model"),
+                                self.env)
+
+    @staticmethod
+    def get_model_dir(method, model_name):
+        """
+        Returns the directory in which the model is saved.
+        """
+        return os.path.join(ROOT_DIR, "RL_models", method.__name__, model_name)
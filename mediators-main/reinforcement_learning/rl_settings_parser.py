@@ -12,16 +12,20 @@ class RLSettingsParser:
     """
 
     def __init__(self, rl_settings_file, custom_loc):
-        if custom_loc:
-            settings_loc = rl_settings_file
-        else:
-            settings_loc = os.path.join(ROOT_DIR, 'reinforcement_learning', 'settings', rl_settings_file)
-
-        with open(settings_loc, 'r') as stream:
+        with open(RLSettingsParser.get_location(rl_settings_file, custom_loc), 'r') as stream:
             try:
                 self.settings_map = yaml.safe_load(stream)
             except yaml.YAMLError as exc:
                 print(exc)
 
+    @staticmethod
+    def get_location(rl_settings_file, custom_loc=False):
+        """
+        Returns the location of the RL settings file that is parsed.
+        """
+        if custom_loc:
+            return rl_settings_file
+        return os.path.join(ROOT_DIR, 'reinforcement_learning', 'settings', rl_settings_file)
+
     def parse(self):
         return RLSettings(**self.settings_map)
@@ -17,6 +17,10 @@ settings = DotDict({
     "render": True,
     "dir_name": "default",
     "no_threads": 10,
+    # "chunk_size": 10,  # Runs per task of the process pool, by default 4 tasks per process per tree and noise
+    # "progress_interval": 10,  # Seconds between progress reports when running in parallel
+    # "flush_interval": 60,  # Seconds between writing the partial results when running in parallel
+    # "resume": True,  # Skips the runs that are in the journal of a previous simulation with the same settings
     "road_file": "new_route.yaml",  # When used, used this file to preset (parts of) the road
     "include_road_data": True,
     "route_data_file": "route_data.pkl",
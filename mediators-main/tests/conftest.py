@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# The root of the simulator, from which the packages are imported and the config files are read
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def root_dir(monkeypatch):
+    """
+    Runs every test in the root of the simulator, since the config files are read relative to it.
+    """
+    monkeypatch.chdir(ROOT)
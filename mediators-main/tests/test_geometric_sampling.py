@@ -0,0 +1,77 @@
+import numpy as np
+from scipy import stats
+
+from gym_simulator.utils.utils import GeometricSampler
+
+# The minimum p-value for which two distributions are considered equal. The tests use fixed seeds, so they are
+# deterministic.
+ALPHA = 0.01
+
+
+def count_events(rng, probabilities, sampler=None):
+    """
+    Returns the number of timesteps in which an event with the given probability per timestep happens, decided by the
+    sampler if defined, else by drawing a random number in every timestep.
+    """
+    if sampler is None:
+        return sum(rng.rand() < probability for probability in probabilities)
+    return sum(sampler.occurs(probability) for probability in probabilities)
+
+
+def get_waiting_times(rng, probability, events, sampler=None):
+    """
+    Returns the number of timesteps until each of the given number of consecutive events with the given probability
+    per timestep, decided by the sampler if defined, else by drawing a random number in every timestep.
+    """
+    waiting_times = []
+    steps = 0
+    while len(waiting_times) < events:
+        steps += 1
+        if sampler.occurs(probability) if sampler else rng.rand() < probability:
+            waiting_times.append(steps)
+            steps = 0
+    return waiting_times
+
+
+def test_sampler_matches_bernoulli_event_counts():
+    """
+    The number of events in a sequence of timesteps should have the same distribution with a GeometricSampler as when
+    checking rng.rand() < probability in every timestep, also when the probability changes halfway.
+    """
+    probabilities = [0.01] * 100 + [0.03] * 100
+    rng = np.random.RandomState(0)
+    bernoulli = [count_events(rng, probabilities) for _ in range(10000)]
+    geometric = [count_events(rng, probabilities, GeometricSampler(rng)) for _ in range(10000)]
+
+    assert abs(np.mean(bernoulli) - 4) < 0.1
+    assert abs(np.mean(geometric) - 4) < 0.1
+    # The counts of 10 or more events are combined, so every cell of the contingency table has enough observations
+    table = [np.bincount(np.minimum(counts, 10), minlength=11) for counts in (bernoulli, geometric)]
+    assert stats.chi2_contingency(table)[1] > ALPHA
+
+
+def test_sampler_matches_bernoulli_waiting_times():
+    """
+    The number of timesteps between consecutive events should have the same distribution with a GeometricSampler as
+    when checking rng.rand() < probability in every timestep.
+    """
+    rng = np.random.RandomState(1)
+    bernoulli = get_waiting_times(rng, 0.05, 5000)
+    geometric = get_waiting_times(rng, 0.05, 5000, GeometricSampler(rng))
+
+    assert abs(np.mean(bernoulli) - 20) < 1
+    assert abs(np.mean(geometric) - 20) < 1
+    assert stats.ks_2samp(bernoulli, geometric).pvalue > ALPHA
+
+
+def test_sampler_bounds():
+    """
+    An event with probability 0 never happens, also after the probability was positive, and an event with probability 1
+    (or more) happens in every timestep.
+    """
+    sampler = GeometricSampler(np.random.RandomState(2))
+    assert not any(sampler.occurs(0) for _ in range(1000))
+    sampler.occurs(0.5)
+    assert not any(sampler.occurs(0) for _ in range(1000))
+    assert all(sampler.occurs(1) for _ in range(100))
+    assert all(sampler.occurs(1.5) for _ in range(100))
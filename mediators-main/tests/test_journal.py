@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from controller.specs import EnvSpec, MediatorSpec
+from gym_simulator.io.journal import Journal
+from gym_simulator.io.writer import Writer
+
+INPUT_HASHES = {"config.yaml": "a", "driver_preferences.yaml": "b"}
+
+
+def test_resume_reads_finished_runs(tmp_path):
+    """
+    A resumed journal contains the runs of the previous simulation, and ignores an entry that was not written
+    completely.
+    """
+    file_path = str(tmp_path / "journal.pkl")
+    journal = Journal(file_path, input_hashes=INPUT_HASHES)
+    journal.add(0, {"steps": 10})
+    journal.add(1, {"steps": 20})
+    journal.close()
+    with open(file_path, "ab") as f:
+        f.write(b"\x80\x04\x95")  # The start of an entry that was interrupted
+
+    journal = Journal(file_path, resume=True, input_hashes=INPUT_HASHES)
+    assert journal.summaries == {0: {"steps": 10}, 1: {"steps": 20}}
+    journal.add(2, {"steps": 30})
+    journal.close()
+    assert Journal(file_path, resume=True, input_hashes=INPUT_HASHES).summaries[2] == {"steps": 30}
+
+
+def test_resume_refuses_changed_input_files(tmp_path):
+    """
+    A simulation is not resumed if one of its input files changed, or if the journal has no input hashes.
+    """
+    file_path = str(tmp_path / "journal.pkl")
+    journal = Journal(file_path, input_hashes=INPUT_HASHES)
+    journal.add(0, {"steps": 10})
+    journal.close()
+
+    with pytest.raises(ValueError, match="driver_preferences.yaml"):
+        Journal(file_path, resume=True, input_hashes=dict(INPUT_HASHES, **{"driver_preferences.yaml": "c"}))
+    with pytest.raises(ValueError, match="road.yaml"):
+        Journal(file_path, resume=True, input_hashes=dict(INPUT_HASHES, **{"road.yaml": "d"}))
+    # A new simulation starts a new journal
+    assert Journal(file_path, input_hashes={}).summaries == {}
+
+
+def test_input_files_exist():
+    """
+    The input files of the specs are the files that the environment and the mediator are parsed from, including the
+    subtrees of the tree.
+    """
+    input_files = EnvSpec("config.yaml", "driver_preferences.yaml", "view.yaml").get_input_files() + \
+        MediatorSpec(tree_file="mediator.tree").get_input_files()
+    names = [os.path.basename(input_file) for input_file in input_files]
+    assert names[:3] == ["config.yaml", "ttd.yaml", "driver_preferences.yaml"]
+    assert "mediator.tree" in names and "automation_level.tree" in names
+    assert "view.yaml" not in names
+    assert len(Writer().hash_input_files(input_files)) == len(input_files)
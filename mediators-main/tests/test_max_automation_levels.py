@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from gym_simulator.envs import MediatorEnv
+from gym_simulator.roads.max_automation_levels import MaxAutomationLevels
+
+
+def get_time_by_segments(speeds, current_position, final_position):
+    """
+    Returns the time it takes to travel from current_position to final_position by summing the time spent in every
+    speed segment one by one, in the order they are driven.
+    """
+    total_time = 0
+    previous_end = current_position
+    for speed, end in speeds:
+        if end < current_position:
+            continue
+        start = max(current_position, previous_end)
+        end = min(final_position, end)
+        previous_end = end
+        total_time += (float(end - start) / speed) * 3600
+    return round(total_time, 2)
+
+
+@pytest.fixture(scope="module")
+def max_automation_levels():
+    """
+    The max automation levels of a few randomly generated roads.
+    """
+    env = MediatorEnv("config.yaml", "driver_preferences.yaml", "view.yaml", render=False)
+    # The components get their own streams (see create_rng), so the roads do not depend on the version of gym
+    env.config.seed_streams = True
+    levels = []
+    for seed in range(5):
+        env.current_seed = seed - 1  # reset increments the seed
+        env.reset()
+        levels.append(env.road.max_automation_levels)
+    return levels
+
+
+def test_time_to_position_matches_segment_sum(max_automation_levels):
+    """
+    get_time_to_position uses the cumulative travel times, but should return the same rounded time as summing the
+    segments one by one, also for positions at the ends of the speed segments (where the times tend to be round).
+    """
+    rng = np.random.RandomState(0)
+    for levels in max_automation_levels:
+        ends = [0.0] + levels.speed_ends
+        positions = ends + list(rng.uniform(0, ends[-1], 200)) + [round(p, 1) for p in rng.uniform(0, ends[-1], 200)]
+        for current_position in positions:
+            for final_position in rng.choice(positions, 50):
+                if final_position >= current_position:
+                    assert levels.get_time_to_position(current_position, final_position) == \
+                        get_time_by_segments(levels.speeds, current_position, final_position)
+
+
+def test_time_to_position_at_rounding_ties(max_automation_levels):
+    """
+    Where the time between two positions is halfway between two hundredths, the cumulative travel times and the sum of
+    the segments one by one can be rounded differently, so get_time_to_position should still match the segment sum.
+    """
+    rng = np.random.RandomState(0)
+    for levels in max_automation_levels:
+        for _ in range(2000):
+            current_index, final_index = sorted(rng.randint(0, len(levels.speeds), 2))
+            current_position = levels.speed_ends[current_index - 1] if current_index > 0 else 0.0
+            start_time = levels.travel_times[current_index - 1] if current_index > 0 else 0.0
+            previous_end = levels.speed_ends[final_index - 1] if final_index > 0 else 0.0
+            previous_time = levels.travel_times[final_index - 1] if final_index > 0 else 0.0
+            speed, end = levels.speeds[final_index]
+            # A time ending in 5 thousandths within the final speed segment
+            time_to_segment = previous_time - start_time
+            tie = np.floor((time_to_segment + rng.uniform(0, levels.segment_times[final_index])) * 100) / 100 + 0.005
+            final_position = previous_end + speed * (tie - time_to_segment) / 3600
+            if current_position <= final_position <= end:
+                assert levels.get_time_to_position(current_position, final_position) == \
+                    get_time_by_segments(levels.speeds, current_position, final_position)
+
+
+def test_rounding_tie_detection():
+    """
+    A time is near a rounding tie if a value halfway between two hundredths is within the error, regardless of the
+    magnitude of the time.
+    """
+    for time in (0.125, 12.345, 123456.785):
+        assert MaxAutomationLevels._is_near_rounding_tie(time, 0)
+        assert MaxAutomationLevels._is_near_rounding_tie(time + 1e-9, 2e-9)
+        assert not MaxAutomationLevels._is_near_rounding_tie(time + 1e-6, 1e-9)
+    assert not MaxAutomationLevels._is_near_rounding_tie(12.34, 1e-6)
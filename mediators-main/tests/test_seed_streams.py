@@ -0,0 +1,34 @@
+import numpy as np
+
+from gym_simulator.envs import MediatorEnv
+from gym_simulator.evaluation.statistics import Statistics
+from gym_simulator.mediator.tree_mediator import TreeMediator
+
+
+def run_episode(seed):
+    """
+    Runs one episode of mediator.tree with seed_streams enabled, and returns the environment and the summary of the
+    results.
+    """
+    env = MediatorEnv("config.yaml", "driver_preferences.yaml", "view.yaml", render=False)
+    env.config.seed_streams = True
+    mediator = TreeMediator(env.config, "mediator.tree", env.action_mapper, None, None, "levels")
+    env.current_seed = seed - 1  # reset increments the seed
+    env.reset()
+    done = False
+    while not done:
+        _, _, done, _ = env.step(mediator.get_action(env))
+    return env, Statistics.summarize_run(env)
+
+
+def test_episode_with_seed_streams():
+    """
+    An episode with seed_streams runs to the end, every component gets the same kind of generator as without
+    seed_streams, and the results only depend on the seed of the run.
+    """
+    env, summary = run_episode(3)
+    assert env.current_seed == 3
+    assert summary["steps"] > 0
+    for rng in (env.road.rng, env.car.rng, env.driver.rng, env.action_mapper.rng):
+        assert isinstance(rng, np.random.RandomState)
+    assert run_episode(3)[1] == summary
@@ -0,0 +1,80 @@
+import numpy as np
+
+
+def decimate(x, y, x_limits, buckets):
+    """
+    Reduces a line to the points that are visible when it is drawn with the given number of buckets (e.g. pixels) in
+    the x range x_limits, where x is non-decreasing. Per bucket, the first and last point and the points with the
+    minimum and maximum y are kept, so extrema and the edges of steps are preserved (min-max decimation). Points
+    outside of x_limits are dropped, except for the ones directly next to it, so the line still reaches the borders.
+    NaN values (gaps in the line) are kept once per bucket.
+
+    Returns the decimated x and y.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    start, end = get_visible_range(x, x_limits)
+    if not needs_decimation(start, end, x_limits, buckets):
+        return x[start:end], y[start:end]
+
+    indices = get_decimated_indices(y[start:end], get_buckets(x[start:end], x_limits, buckets)) + start
+    return x[indices], y[indices]
+
+
+def get_visible_range(x, x_limits):
+    """
+    Returns the start and end index of the points of x that are within x_limits, including the points directly next
+    to it.
+    """
+    x_min, x_max = x_limits
+    start = max(np.searchsorted(x, x_min, side="left") - 1, 0)
+    end = min(np.searchsorted(x, x_max, side="right") + 1, len(x))
+    return start, end
+
+
+def needs_decimation(start, end, x_limits, buckets):
+    """
+    Returns True if the visible range of a line contains enough points to be decimated.
+    """
+    return end - start > 4 * buckets and x_limits[1] > x_limits[0]
+
+
+def get_buckets(x, x_limits, buckets):
+    """
+    Returns the bucket of every point of x, which is non-decreasing. Points outside of x_limits are assigned to bucket
+    -1 or buckets.
+    """
+    x_min, x_max = x_limits
+    return np.clip(((x - x_min) * (buckets / (x_max - x_min))).astype(np.int64), -1, buckets)
+
+
+def get_decimated_indices(y, bucket):
+    """
+    Returns the (sorted) indices of the points that are kept by the min-max decimation (see decimate), given the bucket
+    of every point. Only the points of a bucket determine which of them are kept.
+    """
+    # The index of the first point of every bucket
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    ends = np.append(starts[1:], len(bucket)) - 1
+
+    is_nan = np.isnan(y)
+    minima = np.minimum.reduceat(np.where(is_nan, np.inf, y), starts)
+    maxima = np.maximum.reduceat(np.where(is_nan, -np.inf, y), starts)
+    counts = np.diff(np.append(starts, len(bucket)))
+    indices = np.concatenate((
+        starts,
+        ends,
+        _first_per_bucket(y == np.repeat(minima, counts), bucket),
+        _first_per_bucket(y == np.repeat(maxima, counts), bucket),
+        _first_per_bucket(is_nan, bucket)
+    ))
+    return np.unique(indices)
+
+
+def _first_per_bucket(mask, bucket):
+    """
+    Returns the index of the first True value in mask for every bucket that contains one.
+    """
+    indices = np.flatnonzero(mask)
+    _, first = np.unique(bucket[indices], return_index=True)
+    return indices[first]
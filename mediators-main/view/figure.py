@@ -0,0 +1,131 @@
+import math
+import os
+
+import matplotlib.gridspec as gridspec
+from matplotlib.figure import Figure
+from matplotlib.ticker import MultipleLocator
+
+import seaborn as sns
+
+from view.sliding_window import get_window_limits, uses_sliding_window
+from view.util import map_view
+
+# Padding of the figure, used for its tight layout
+TIGHT_LAYOUT = {"pad": 2, "w_pad": 2, "h_pad": 0.2}
+
+
+def get_plot_classes(config):
+    """
+    Returns the classes of the plots that are specified in the view yaml file.
+    """
+    return [map_view(view) for view in config.views if map_view(view) is not None]
+
+
+def get_grid_height(plot_classes):
+    """
+    Returns the total number of rows in the grid, based on the plots that are included.
+    """
+    return sum(plot.grid_height() for plot in plot_classes)
+
+
+def get_color_palette():
+    """
+    Sets the theme of the plots, and returns the color palette that is used by the plots.
+    """
+    cp = sns.color_palette("pastel")
+    sns.set_theme()
+    sns.set_context("paper")
+    return cp
+
+
+def create_figure(config, grid_height):
+    """
+    Creates the (empty) figure that holds all plots. Its size depends on the road length (or the length of the sliding
+    window, if it is used) and the number of rows.
+    """
+    shown_length = config.sliding_window if uses_sliding_window(config) else config.road_length
+    fig_width = max((2.5 / 3.0) * shown_length, 15)  # Width of figure in inches
+    fig_height = max(grid_height / 1.8, 5)  # Height of figure in inches
+    return Figure(figsize=(fig_width, fig_height), tight_layout=TIGHT_LAYOUT)
+
+
+def init_plots(fig, config, data, plot_classes, cp):
+    """
+    Creates all plots in fig, with their accompanying axes. Returns the plots.
+    """
+    plots = [plot(config, data, cp) for plot in plot_classes]
+
+    # Create the accompanying axes and set their limits
+    axes = _get_axes(fig, plots, get_grid_height(plot_classes))
+    _set_x_limits(axes, config, data)
+    _set_x_labels(axes)
+
+    # Initialize the plots with their respective axes
+    for plot, ax in zip(plots, axes):
+        plot.init_plot(ax)
+    return plots
+
+
+def set_x_limits(axes, x_limits):
+    """
+    Sets the limits of the x-axis of all axes.
+    """
+    for ax in axes:
+        ax.set_xlim(*x_limits)
+
+
+def save_figure(fig, config, data, file_path, dpi=600):
+    """
+    Saves the figure to file_path. If the sliding window is used, the route is split into pages of the length of the
+    window, which are saved to separate files, with the number of the page appended to the file name (e.g. fig_0.png,
+    fig_1.png, ...). The x limits of the axes are restored afterwards.
+    """
+    if not uses_sliding_window(config):
+        fig.savefig(file_path, dpi=dpi)
+        return
+
+    x_limits = fig.axes[0].get_xlim()
+    root, extension = os.path.splitext(file_path)
+    for page in range(max(math.ceil(data.road_length / config.sliding_window), 1)):
+        set_x_limits(fig.axes, get_window_limits(config, page * config.sliding_window))
+        fig.savefig("{0}_{1}{2}".format(root, page, extension), dpi=dpi)
+    set_x_limits(fig.axes, x_limits)
+
+
+def _get_axes(fig, plots, grid_height):
+    axes = []
+
+    # Used to specify the relative heights of the subplots
+    gs = gridspec.GridSpec(grid_height, 1)
+    cur_height = 0
+    for plot in plots:
+        size = plot.get_grid_height()
+        axes.append(fig.add_subplot(gs[cur_height:cur_height + size, :]))
+        cur_height = cur_height + size
+
+    return axes
+
+
+def _set_x_limits(axes, config, data):
+    # Sets the limits of the x-axis for all subplots, since this is the same for all subplots
+    for ax in axes:
+        if uses_sliding_window(config):
+            # Only the ticks within the window are created
+            ax.xaxis.set_major_locator(MultipleLocator(1))
+            ax.set_xlim(*get_window_limits(config, 0))
+        else:
+            ax.set_xticks(range(int(data.road_length) + 1))
+            if config.partial_render:
+                ax.set_xlim(config.start_position, config.end_position)
+            else:
+                ax.set_xlim(-0.01 * data.road_length, data.road_length + 0.01 * data.road_length)
+
+
+def _set_x_labels(axes):
+    # Only the top plot has a label on the x-axis on top, the others do not (for space saving purposes)
+    for i, ax in enumerate(axes):
+        if i == 0:
+            ax.xaxis.set_label_position('top')
+            ax.xaxis.tick_top()
+        else:
+            ax.set_xticklabels([])
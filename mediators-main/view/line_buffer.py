@@ -0,0 +1,66 @@
+import numpy as np
+
+from view.decimation import get_buckets, get_decimated_indices, get_visible_range, needs_decimation
+
+
+class LineBuffer:
+    """
+    Keeps the decimated points (see decimate) of a line that grows by appending values, such as the lines with one
+    value per timestep. When the line is updated, only the buckets that changed since the previous update are
+    decimated, instead of the whole line, and the decimated points are written to preallocated arrays, of which views
+    are passed to matplotlib. This way, the time it takes to update a line does not depend on the number of steps.
+
+    Only the last value of a line can still change after it is appended (e.g. the NDRT), which is fine since the bucket
+    of the last value is always decimated again. When the x limits or the number of buckets change, the line is
+    decimated from scratch.
+    """
+
+    def __init__(self, chunk_size=1024):
+        self.chunk_size = chunk_size
+        self.x = None  # The complete x values of the line
+        self.y = None  # The complete y values of the line
+        self._x = np.empty(chunk_size, dtype=np.float64)  # The decimated x values
+        self._y = np.empty(chunk_size, dtype=np.float64)  # The decimated y values
+        self._settings = None  # The x limits, number of buckets and start of the visible range of the decimation
+        self._final_length = 0  # The number of decimated values that are final (of buckets that are complete)
+        self._open_start = 0  # The index of the first value of the line that is not in a complete bucket
+
+    def update(self, x, y, x_limits, buckets):
+        """
+        Sets the values of the line, of which the first values should be equal to the values of the previous update,
+        and returns the decimated x and y. These are views that are changed by the next update.
+        """
+        self.x = x = np.asarray(x)
+        self.y = y = np.asarray(y)
+        start, end = get_visible_range(x, x_limits)
+        if not needs_decimation(start, end, x_limits, buckets):
+            self._settings = None
+            return x[start:end], y[start:end]
+
+        settings = (tuple(x_limits), buckets, start)
+        if settings != self._settings:
+            self._settings = settings
+            self._final_length = 0
+            self._open_start = start
+
+        bucket = get_buckets(x[self._open_start:end], x_limits, buckets)
+        indices = get_decimated_indices(y[self._open_start:end], bucket) + self._open_start
+        length = self._final_length + len(indices)
+        self.__reserve(length)
+        self._x[self._final_length:length] = x[indices]
+        self._y[self._final_length:length] = y[indices]
+
+        # The buckets before the bucket of the last value are complete
+        complete = np.searchsorted(bucket, bucket[end - 1 - self._open_start])
+        self._final_length += np.searchsorted(indices, self._open_start + complete)
+        self._open_start += complete
+        return self._x[:length], self._y[:length]
+
+    def __reserve(self, length):
+        if length <= len(self._x):
+            return
+        size = max(2 * len(self._x), length + self.chunk_size - 1) // self.chunk_size * self.chunk_size
+        for name in ("_x", "_y"):
+            values = np.empty(size, dtype=np.float64)
+            values[:self._final_length] = getattr(self, name)[:self._final_length]
+            setattr(self, name, values)
@@ -0,0 +1,30 @@
+import os
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from view.figure import create_figure, get_color_palette, get_grid_height, get_plot_classes, init_plots, save_figure
+
+
+def render_figure(config, data, file_path, dpi=600):
+    """
+    Renders the plots specified in the view yaml file for the data of a finished run, and saves the figure to
+    file_path. The format (e.g. PNG or SVG) is determined by the extension of file_path. If the sliding window is used,
+    the figure is split into multiple pages (see save_figure).
+
+    In contrast to the Viewer, the figure is drawn on an Agg canvas, so no Qt application (or display) is needed. This
+    makes it possible to render the figures in the processes that execute the runs.
+    """
+    plot_classes = get_plot_classes(config)
+    fig = create_figure(config, get_grid_height(plot_classes))
+    FigureCanvasAgg(fig)  # Attaches the canvas to the figure
+    # Draw at the resolution of the saved figure, which also determines the number of points of decimated lines
+    fig.set_dpi(dpi)
+
+    plots = init_plots(fig, config, data, plot_classes, get_color_palette())
+    for plot in plots:
+        plot.update_plot()
+
+    directory = os.path.dirname(file_path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    save_figure(fig, config, data, file_path, dpi)
@@ -8,15 +8,37 @@ class AbstractEventsPlot(AbstractPlot, ABC):
     def __init__(self, config, data, cp):
         super().__init__(config, data, cp)
         self.event_lines = []
+        self.line_segments = {}  # The segments that were last set per line
+        self.line_colors = {}  # The colors that were last set per line
+
+    def get_animated_artists(self):
+        return self.event_lines
 
     def set_interval_segments(self, line, intervals, i):
+        """
+        Sets the segments of line to the intervals at height i. Returns True if the segments changed.
+        """
         starts = intervals["start"]
         ends = intervals["end"]
         segments = []
         for index in range(len(starts)):
             segment = [[starts[index], i], [ends[index], i]]
             segments.append(segment)
+        if self.line_segments.get(line) == segments:
+            return False
+        self.line_segments[line] = segments
         line.set_segments(segments)
+        return True
+
+    def set_interval_colors(self, line, colors):
+        """
+        Sets the colors of the segments of line. Returns True if the colors changed.
+        """
+        if self.line_colors.get(line) == colors:
+            return False
+        self.line_colors[line] = colors
+        line.set_colors(colors)
+        return True
 
     def get_event_intervals(self, events):
         event_intervals = {}
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from view.line_buffer import LineBuffer
+
 
 class AbstractPlot(ABC):
 
@@ -7,6 +9,8 @@ class AbstractPlot(ABC):
         self.config = config
         self.data = data
         self.cp = cp
+        self.line_buffers = {}  # The buffer with the decimated data per line, see set_line_data
+        self.decimated_axes = set()  # The axes that are decimated again when their x limits change
 
     @staticmethod
     @abstractmethod
@@ -23,4 +27,44 @@ class AbstractPlot(ABC):
 
     @abstractmethod
     def update_plot(self):
+        """
+        Updates the artists of the plot with the latest data. Returns True if any of the artists changed.
+        """
         pass
+
+    def get_animated_artists(self):
+        """
+        Returns the artists that can be changed by update_plot. All other parts of the plot (e.g. labels, legends and
+        spans) are static, so when blitting only these artists are redrawn.
+        """
+        return []
+
+    def set_line_data(self, line, x, y):
+        """
+        Sets the data of a line with one value per timestep. If decimate_plots is set in the view file, only the points
+        that are visible at the width (in pixels) of the axes within its current x limits are drawn (see decimate), so
+        the time it takes to draw the line does not depend on the length of the route. The line is decimated again
+        when the x limits change, e.g. when zooming in. Since the values of the line are only appended, only the new
+        values are decimated in every update (see LineBuffer).
+
+        x can be longer than y (e.g. for the real TTAF, which is not known yet for the last steps), in which case only
+        its first values are used.
+        """
+        x = x[:len(y)]
+        if not self.config.decimate_plots:
+            line.set_data(x, y)
+            return
+        ax = line.axes
+        if ax not in self.decimated_axes:
+            self.decimated_axes.add(ax)
+            ax.callbacks.connect('xlim_changed', self.__decimate_axes)
+        # Getting the x limits can change them (autoscaling), so the buffer is only added after
+        x_limits = ax.get_xlim()
+        if line not in self.line_buffers:
+            self.line_buffers[line] = LineBuffer()
+        line.set_data(*self.line_buffers[line].update(x, y, x_limits, int(ax.bbox.width)))
+
+    def __decimate_axes(self, ax):
+        for line, buffer in self.line_buffers.items():
+            if line.axes is ax:
+                line.set_data(*buffer.update(buffer.x, buffer.y, ax.get_xlim(), int(ax.bbox.width)))
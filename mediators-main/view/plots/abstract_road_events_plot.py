@@ -32,7 +32,9 @@ class AbstractRoadEventsPlot(AbstractEventsPlot, ABC):
             self.event_lines.append(line)
 
     def update_road_lines(self, event_intervals):
+        changed = False
         for i, key in enumerate(event_intervals):
             line = self.event_lines[i]
             event = event_intervals[key]
-            self.set_interval_segments(line, event, i)
+            changed |= self.set_interval_segments(line, event, i)
+        return changed
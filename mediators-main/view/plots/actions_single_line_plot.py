@@ -35,8 +35,12 @@ class ActionsSingleLinePlot(AbstractEventsPlot):
 
     def update_plot(self):
         action_intervals = self.get_event_intervals(self.data.actions)
-        self.set_interval_segments(self.actions_line, action_intervals, 0)
-        self.actions_line.set_colors(action_intervals["color"])
+        changed = self.set_interval_segments(self.actions_line, action_intervals, 0)
+        changed |= self.set_interval_colors(self.actions_line, action_intervals["color"])
+        return changed
+
+    def get_animated_artists(self):
+        return [self.actions_line]
 
     def get_event_intervals(self, events):
         action_intervals = {"start": [], "end": [], "color": []}
@@ -29,8 +29,10 @@ class DriverEventsPlot(AbstractEventsPlot):
             self.event_lines.append(line)
 
     def update_plot(self):
+        changed = False
         event_intervals = self.get_event_intervals(self.data.driver_events)
         for i, key in enumerate(event_intervals):
             line = self.event_lines[i]
             event = event_intervals[key]
-            self.set_interval_segments(line, event, i)
+            changed |= self.set_interval_segments(line, event, i)
+        return changed
@@ -4,19 +4,6 @@ from view.plots.abstract_plot import AbstractPlot
 import seaborn as sns
 
 
-def _map_driver_request(request):
-    if request is None:
-        return 0
-    elif request == "L0":
-        return 1
-    elif request == "L2":
-        return 2
-    elif request == "L3":
-        return 3
-    elif request == "L4":
-        return 4
-
-
 class DriverPlot(AbstractPlot):
 
     def __init__(self, config, data, cp):
@@ -61,14 +48,18 @@ class DriverPlot(AbstractPlot):
         ax.legend()
 
     def update_plot(self):
-        positions = self.data.positions
+        positions = self.data.positions.values()
         for key, line in self.lines.items():
-            line.set_xdata(positions)
             if key == 'fatigue':
-                line.set_ydata(self.data.fatigue)
+                self.set_line_data(line, positions, self.data.fatigue.values())
             elif key == 'distraction':
-                line.set_ydata(self.data.distraction)
+                self.set_line_data(line, positions, self.data.distraction.values())
             elif key == 'ndrt':
-                line.set_ydata(self.data.ndrt)
+                self.set_line_data(line, positions, self.data.ndrt.values())
             elif key == 'request':
-                line.set_ydata([_map_driver_request(request) for request in self.data.driver_request])
+                # Requests are stored as level indices, with -1 for no request, which is shown as "None" at 0
+                self.set_line_data(line, positions, self.data.driver_request.values() + 1)
+        return True
+
+    def get_animated_artists(self):
+        return list(self.lines.values())
@@ -30,9 +30,11 @@ class EvalPlot(AbstractEventsPlot):
     def update_plot(self):
         eval_intervals = self.data.evaluation
         keys = [st for st in SafetyType]
+        changed = False
         for i, key in enumerate(keys):
             if key not in eval_intervals:
                 continue
             line = self.event_lines[i]
             evaluation = eval_intervals[key]
-            self.set_interval_segments(line, evaluation, i)
+            changed |= self.set_interval_segments(line, evaluation, i)
+        return changed
@@ -32,13 +32,15 @@ class FutureActionsPlot(AbstractEventsPlot):
         action_intervals = self.get_event_intervals(self.data.future_actions)
         keys = [label for label in self.config.available_actions if (label.startswith('SSL') or
                                                                      label.startswith('ESL'))]
+        changed = False
         for i, key in enumerate(keys):
             if key not in action_intervals:
                 continue
             line = self.event_lines[i]
             action = action_intervals[key]
-            self.set_interval_segments(line, action, i)
-            line.set_colors(action["color"])
+            changed |= self.set_interval_segments(line, action, i)
+            changed |= self.set_interval_colors(line, action["color"])
+        return changed
 
     def get_event_intervals(self, events):
         action_intervals = {}
@@ -1,5 +1,8 @@
+from matplotlib.transforms import Bbox, TransformedBbox
+
 from view.interactive_legend import InteractiveLegend
 from view.plots.abstract_plot import AbstractPlot
+from view.sliding_window import uses_sliding_window
 
 
 def _map_level(level):
@@ -34,9 +37,8 @@ class LevelsPlot(AbstractPlot):
         self.opt_levels_line = None
         self.pess_levels_line = None
         self.current_level_line = None
-        self.current_level_data = []
-        self.last_position_index = 0
         self.legend = None
+        self.levels = {}  # The max levels per level type that are drawn, so the lines are only updated if they change
 
     @staticmethod
     def grid_height():
@@ -79,33 +81,39 @@ class LevelsPlot(AbstractPlot):
         start_position = self.config.start_position
         end_position = self.config.end_position
         if not self.config.partial_render or start >= start_position and end <= end_position:
-            ax.text(((start + end) / float(2)) - 0.1, height, name)
+            text = ax.text(((start + end) / float(2)) - 0.1, height, name)
         elif start_position <= start <= end_position:
-            ax.text(((start + end_position) / float(2)) - 0.1, height, name)
+            text = ax.text(((start + end_position) / float(2)) - 0.1, height, name)
         elif start_position <= end <= end_position:
-            ax.text(((start_position + end) / float(2)) - 0.1, height, name)
+            text = ax.text(((start_position + end) / float(2)) - 0.1, height, name)
+        else:
+            return
+        if uses_sliding_window(self.config):
+            # The names of the road parts outside of the sliding window are not drawn, but names above the axes are
+            text.set_clip_box(TransformedBbox(Bbox([[0, -1], [1, 2]]), ax.transAxes))
+            text.set_clip_on(True)
 
     def update_plot(self):
-        x, y = self.__get_levels()
-        self.max_levels_line.set_ydata(y)
-        self.max_levels_line.set_xdata(x)
-
+        self.__update_levels(self.max_levels_line)
         if self.opt_levels_line:
-            x_opt, y_opt = self.__get_levels("optimistic_automation_levels")
-            self.opt_levels_line.set_ydata(y_opt)
-            self.opt_levels_line.set_xdata(x_opt)
-
+            self.__update_levels(self.opt_levels_line, "optimistic_automation_levels")
         if self.pess_levels_line:
-            x_pess, y_pess = self.__get_levels("pessimistic_automation_levels")
-            self.pess_levels_line.set_ydata(y_pess)
-            self.pess_levels_line.set_xdata(x_pess)
-
-        for i in range(self.last_position_index, len(self.data.positions)):
-            self.current_level_data.append(_map_level(self.data.current_levels[i]))
-        self.last_position_index = len(self.data.positions)
-
-        self.current_level_line.set_ydata(self.current_level_data)
-        self.current_level_line.set_xdata(self.data.positions)
+            self.__update_levels(self.pess_levels_line, "pessimistic_automation_levels")
+
+        # The current levels are stored as the same indices that _map_level returns
+        self.set_line_data(self.current_level_line, self.data.positions.values(), self.data.current_levels.values())
+        return True
+
+    def get_animated_artists(self):
+        lines = [self.max_levels_line, self.current_level_line, self.opt_levels_line, self.pess_levels_line]
+        return [line for line in lines if line is not None]
+
+    def __update_levels(self, line, level_type="max_automation_levels"):
+        # The max levels only change when the road changes (e.g. by a dynamic event)
+        levels = getattr(self.data, level_type)
+        if self.levels.get(level_type) != levels:
+            self.levels[level_type] = levels
+            line.set_data(*self.__get_levels(level_type))
 
     def __get_levels(self, level_type="max_automation_levels"):
         max_levels = getattr(self.data, level_type)
@@ -31,11 +31,13 @@ class SafetyPlot(AbstractEventsPlot):
 
     def update_plot(self):
         event_intervals = self.get_event_intervals(self.data.safety_events)
+        changed = False
         for i, key in enumerate(event_intervals):
             line = self.event_lines[i]
             event = event_intervals[key]
-            self.set_interval_segments(line, event, i)
-            line.set_colors(event["color"])
+            changed |= self.set_interval_segments(line, event, i)
+            changed |= self.set_interval_colors(line, event["color"])
+        return changed
 
     def get_event_intervals(self, events):
         safety_event_intervals = {}
@@ -21,5 +21,8 @@ class SpeedPlot(AbstractPlot):
         ax.legend()
 
     def update_plot(self):
-        self.speed_line.set_xdata(self.data.positions)
-        self.speed_line.set_ydata(self.data.speeds)
+        self.set_line_data(self.speed_line, self.data.positions.values(), self.data.speeds.values())
+        return True
+
+    def get_animated_artists(self):
+        return [self.speed_line]
@@ -13,4 +13,4 @@ class StaticRoadEventsPlot(AbstractRoadEventsPlot):
 
     def update_plot(self):
         event_intervals = self.get_event_intervals(self.data.road_events["static"])
-        self.update_road_lines(event_intervals)
+        return self.update_road_lines(event_intervals)
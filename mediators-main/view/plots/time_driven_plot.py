@@ -22,5 +22,8 @@ class TimeDrivenPlot(AbstractPlot):
         ax.legend()
 
     def update_plot(self):
-        self.time_line.set_xdata(self.data.positions)
-        self.time_line.set_ydata(self.data.times)
+        self.set_line_data(self.time_line, self.data.positions.values(), self.data.times.values())
+        return True
+
+    def get_animated_artists(self):
+        return [self.time_line]
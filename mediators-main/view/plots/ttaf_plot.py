@@ -72,44 +72,39 @@ class TTAFPlot(AbstractPlot):
                                                           "TTAFL4-opt", "TTAFL4-pes", "RealTTAFL4"])
 
     def update_plot(self):
-        positions = self.data.positions
+        positions = self.data.positions.values()
 
         if self.ttafl2_line:
-            self.ttafl2_line.set_ydata(self.data.ttaf["L2"])
-            self.ttafl2_line.set_xdata(positions)
+            self.set_line_data(self.ttafl2_line, positions, self.data.ttaf["L2"].values())
         if self.real_ttafl2_line:
-            self.real_ttafl2_line.set_ydata(self.data.real_ttaf["L2"])
-            self.real_ttafl2_line.set_xdata(positions[:len(self.data.real_ttaf["L2"])])
+            self.set_line_data(self.real_ttafl2_line, positions, self.data.real_ttaf["L2"].values())
         if self.parsed_ttafl2_line:
-            self.parsed_ttafl2_line.set_ydata(self.data.real_route_ttaf_l2)
-            self.parsed_ttafl2_line.set_xdata(positions)
+            self.set_line_data(self.parsed_ttafl2_line, positions, self.data.real_route_ttaf_l2.values())
         if self.optimistic_ttafl2_line:
-            self.optimistic_ttafl2_line.set_ydata(self.data.optimistic_ttaf["L2"])
-            self.optimistic_ttafl2_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttafl2_line, positions, self.data.optimistic_ttaf["L2"].values())
         if self.pessimistic_ttafl2_line:
-            self.pessimistic_ttafl2_line.set_ydata(self.data.pessimistic_ttaf["L2"])
-            self.pessimistic_ttafl2_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttafl2_line, positions, self.data.pessimistic_ttaf["L2"].values())
         if self.ttafl3_line:
-            self.ttafl3_line.set_ydata(self.data.ttaf["L3"])
-            self.ttafl3_line.set_xdata(positions)
+            self.set_line_data(self.ttafl3_line, positions, self.data.ttaf["L3"].values())
         if self.real_ttafl3_line:
-            self.real_ttafl3_line.set_ydata(self.data.real_ttaf["L3"])
-            self.real_ttafl3_line.set_xdata(positions[:len(self.data.real_ttaf["L3"])])
+            self.set_line_data(self.real_ttafl3_line, positions, self.data.real_ttaf["L3"].values())
         if self.optimistic_ttafl3_line:
-            self.optimistic_ttafl3_line.set_ydata(self.data.optimistic_ttaf["L3"])
-            self.optimistic_ttafl3_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttafl3_line, positions, self.data.optimistic_ttaf["L3"].values())
         if self.pessimistic_ttafl3_line:
-            self.pessimistic_ttafl3_line.set_ydata(self.data.pessimistic_ttaf["L3"])
-            self.pessimistic_ttafl3_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttafl3_line, positions, self.data.pessimistic_ttaf["L3"].values())
         if self.ttafl4_line:
-            self.ttafl4_line.set_ydata(self.data.ttaf["L4"])
-            self.ttafl4_line.set_xdata(positions)
+            self.set_line_data(self.ttafl4_line, positions, self.data.ttaf["L4"].values())
         if self.real_ttafl4_line:
-            self.real_ttafl4_line.set_ydata(self.data.real_ttaf["L4"])
-            self.real_ttafl4_line.set_xdata(positions[:len(self.data.real_ttaf["L4"])])
+            self.set_line_data(self.real_ttafl4_line, positions, self.data.real_ttaf["L4"].values())
         if self.optimistic_ttafl4_line:
-            self.optimistic_ttafl4_line.set_ydata(self.data.optimistic_ttaf["L4"])
-            self.optimistic_ttafl4_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttafl4_line, positions, self.data.optimistic_ttaf["L4"].values())
         if self.pessimistic_ttafl4_line:
-            self.pessimistic_ttafl4_line.set_ydata(self.data.pessimistic_ttaf["L4"])
-            self.pessimistic_ttafl4_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttafl4_line, positions, self.data.pessimistic_ttaf["L4"].values())
+        return True
+
+    def get_animated_artists(self):
+        lines = [self.ttafl2_line, self.parsed_ttafl2_line, self.real_ttafl2_line, self.optimistic_ttafl2_line,
+                 self.pessimistic_ttafl2_line, self.ttafl3_line, self.real_ttafl3_line, self.optimistic_ttafl3_line,
+                 self.pessimistic_ttafl3_line, self.ttafl4_line, self.real_ttafl4_line, self.optimistic_ttafl4_line,
+                 self.pessimistic_ttafl4_line]
+        return [line for line in lines if line is not None]
@@ -72,44 +72,39 @@ class TTAUPlot(AbstractPlot):
                                                           "TTAUL4-opt", "TTAUL4-pes", "RealTTAUL4"])
 
     def update_plot(self):
-        positions = self.data.positions
+        positions = self.data.positions.values()
 
         if self.ttaul2_line:
-            self.ttaul2_line.set_ydata(self.data.ttau["L2"])
-            self.ttaul2_line.set_xdata(positions)
+            self.set_line_data(self.ttaul2_line, positions, self.data.ttau["L2"].values())
         if self.real_ttaul2_line:
-            self.real_ttaul2_line.set_ydata(self.data.real_ttau["L2"])
-            self.real_ttaul2_line.set_xdata(positions[:len(self.data.real_ttau["L2"])])
+            self.set_line_data(self.real_ttaul2_line, positions, self.data.real_ttau["L2"].values())
         if self.parsed_ttaul2_line:
-            self.parsed_ttaul2_line.set_ydata(self.data.real_route_ttau_l2)
-            self.parsed_ttaul2_line.set_xdata(positions)
+            self.set_line_data(self.parsed_ttaul2_line, positions, self.data.real_route_ttau_l2.values())
         if self.optimistic_ttaul2_line:
-            self.optimistic_ttaul2_line.set_ydata(self.data.optimistic_ttau["L2"])
-            self.optimistic_ttaul2_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttaul2_line, positions, self.data.optimistic_ttau["L2"].values())
         if self.pessimistic_ttaul2_line:
-            self.pessimistic_ttaul2_line.set_ydata(self.data.pessimistic_ttau["L2"])
-            self.pessimistic_ttaul2_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttaul2_line, positions, self.data.pessimistic_ttau["L2"].values())
         if self.ttaul3_line:
-            self.ttaul3_line.set_ydata(self.data.ttau["L3"])
-            self.ttaul3_line.set_xdata(positions)
+            self.set_line_data(self.ttaul3_line, positions, self.data.ttau["L3"].values())
         if self.real_ttaul3_line:
-            self.real_ttaul3_line.set_ydata(self.data.real_ttau["L3"])
-            self.real_ttaul3_line.set_xdata(positions[:len(self.data.real_ttau["L3"])])
+            self.set_line_data(self.real_ttaul3_line, positions, self.data.real_ttau["L3"].values())
         if self.optimistic_ttaul3_line:
-            self.optimistic_ttaul3_line.set_ydata(self.data.optimistic_ttau["L3"])
-            self.optimistic_ttaul3_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttaul3_line, positions, self.data.optimistic_ttau["L3"].values())
         if self.pessimistic_ttaul3_line:
-            self.pessimistic_ttaul3_line.set_ydata(self.data.pessimistic_ttau["L3"])
-            self.pessimistic_ttaul3_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttaul3_line, positions, self.data.pessimistic_ttau["L3"].values())
         if self.ttaul4_line:
-            self.ttaul4_line.set_ydata(self.data.ttau["L4"])
-            self.ttaul4_line.set_xdata(positions)
+            self.set_line_data(self.ttaul4_line, positions, self.data.ttau["L4"].values())
         if self.real_ttaul4_line:
-            self.real_ttaul4_line.set_ydata(self.data.real_ttau["L4"])
-            self.real_ttaul4_line.set_xdata(positions[:len(self.data.real_ttau["L4"])])
+            self.set_line_data(self.real_ttaul4_line, positions, self.data.real_ttau["L4"].values())
         if self.optimistic_ttaul4_line:
-            self.optimistic_ttaul4_line.set_ydata(self.data.optimistic_ttau["L4"])
-            self.optimistic_ttaul4_line.set_xdata(positions)
+            self.set_line_data(self.optimistic_ttaul4_line, positions, self.data.optimistic_ttau["L4"].values())
         if self.pessimistic_ttaul4_line:
-            self.pessimistic_ttaul4_line.set_ydata(self.data.pessimistic_ttau["L4"])
-            self.pessimistic_ttaul4_line.set_xdata(positions)
+            self.set_line_data(self.pessimistic_ttaul4_line, positions, self.data.pessimistic_ttau["L4"].values())
+        return True
+
+    def get_animated_artists(self):
+        lines = [self.ttaul2_line, self.parsed_ttaul2_line, self.real_ttaul2_line, self.optimistic_ttaul2_line,
+                 self.pessimistic_ttaul2_line, self.ttaul3_line, self.real_ttaul3_line, self.optimistic_ttaul3_line,
+                 self.pessimistic_ttaul3_line, self.ttaul4_line, self.real_ttaul4_line, self.optimistic_ttaul4_line,
+                 self.pessimistic_ttaul4_line]
+        return [line for line in lines if line is not None]
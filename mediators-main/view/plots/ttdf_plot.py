@@ -21,5 +21,8 @@ class TTDFPlot(AbstractPlot):
         ax.legend()
 
     def update_plot(self):
-        self.ttdf_line.set_ydata(self.data.ttdf)
-        self.ttdf_line.set_xdata(self.data.positions)
+        self.set_line_data(self.ttdf_line, self.data.positions.values(), self.data.ttdf.values())
+        return True
+
+    def get_animated_artists(self):
+        return [self.ttdf_line]
@@ -22,5 +22,8 @@ class TTDUPlot(AbstractPlot):
         ax.legend()
 
     def update_plot(self):
-        self.ttdu_line.set_ydata(self.data.ttdu)
-        self.ttdu_line.set_xdata(self.data.positions)
+        self.set_line_data(self.ttdu_line, self.data.positions.values(), self.data.ttdu.values())
+        return True
+
+    def get_animated_artists(self):
+        return [self.ttdu_line]
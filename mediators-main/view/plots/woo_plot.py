@@ -33,13 +33,15 @@ class WOOPlot(AbstractEventsPlot):
     def update_plot(self):
         action_intervals = self.get_event_intervals(self.data.actions)
         keys = [label for label in self.config.available_actions if not (label == 'DN' or label == 'CANCEL')]
+        changed = False
         for i, key in enumerate(keys):
             if key not in action_intervals:
                 continue
             line = self.event_lines[i]
             action = action_intervals[key]
-            self.set_interval_segments(line, action, i)
+            changed |= self.set_interval_segments(line, action, i)
             # line.set_colors(action["color"])
+        return changed
 
     def get_event_intervals(self, events):
         action_intervals = {}
@@ -0,0 +1,25 @@
+import math
+
+
+def uses_sliding_window(config):
+    """
+    Returns True if only a window of sliding_window km of the route is shown at a time, instead of the whole route.
+    """
+    return config.sliding_window is not None and not config.partial_render
+
+
+def get_window_limits(config, start):
+    """
+    Returns the x limits of the sliding window that starts at position start (in km).
+    """
+    return start - 0.01 * config.sliding_window, start + 1.01 * config.sliding_window
+
+
+def get_following_window_start(config, data, position):
+    """
+    Returns the start of the sliding window that follows the car at position. The window moves in steps of half its
+    length, such that the car is always in the window, and its limits only change once in a while.
+    """
+    step = config.sliding_window / 2
+    start = (math.floor(position / step) - 1) * step
+    return max(min(start, data.road_length - config.sliding_window), 0)
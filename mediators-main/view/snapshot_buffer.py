@@ -0,0 +1,32 @@
+from collections import deque
+
+
+class SnapshotBuffer:
+    """
+    Ring buffer of snapshots of the data of a run (see Data.snapshot), used to pass the data from the simulation thread
+    to the Viewer without blocking the simulation. The simulation pushes a snapshot whenever a step should be rendered,
+    and the Viewer takes the latest snapshot whenever it draws a frame. Snapshots that are not drawn in time are
+    dropped.
+    """
+
+    def __init__(self, size=2):
+        # Appending to and popping from a deque are thread safe
+        self.snapshots = deque(maxlen=size)
+
+    def push(self, snapshot, last=False):
+        """
+        Pushes a snapshot to the buffer. last should be True for the snapshot of the last step of the run.
+        """
+        self.snapshots.append((snapshot, last))
+
+    def pop_latest(self):
+        """
+        Returns the latest snapshot and whether it is the snapshot of the last step, and removes all snapshots from the
+        buffer. Returns (None, False) if the buffer is empty.
+        """
+        latest = (None, False)
+        while True:
+            try:
+                latest = self.snapshots.popleft()
+            except IndexError:
+                return latest
@@ -1,15 +1,14 @@
-from PyQt5.QtCore import pyqtSlot, Qt
-from PyQt5.QtWidgets import QPushButton, QScrollArea, QHBoxLayout, QVBoxLayout, QWidget, QMainWindow, QApplication
+from PyQt5.QtCore import pyqtSlot, Qt, QTimer
+from PyQt5.QtWidgets import QPushButton, QScrollArea, QHBoxLayout, QVBoxLayout, QWidget, QMainWindow, QSlider
 
 import matplotlib as plt
-import matplotlib.gridspec as gridspec
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
 
-import seaborn as sns
-
-from view.util import map_view
+from view.figure import create_figure, get_color_palette, get_grid_height, get_plot_classes, init_plots, save_figure, \
+    set_x_limits
+from view.sliding_window import get_following_window_start, get_window_limits, uses_sliding_window
+from view.snapshot_buffer import SnapshotBuffer
 
 # This plot backend is needed for the GUI
 plt.use('Qt5Agg')
@@ -18,6 +17,14 @@ plt.use('Qt5Agg')
 class Viewer(QMainWindow):
     """
     Viewer class that is used to plot view of the simulation.
+
+    The simulation pushes snapshots of its data to the snapshots buffer, and the viewer draws the latest one at most
+    max_frame_rate times per second, so the simulation does not wait for the viewer. The same viewer can be used for
+    multiple runs, by resetting it at the start of every run (see reset).
+
+    If sliding_window is set in the view yaml file, the figure only shows a window of that many km of the route, which
+    follows the car. With slider, the window can also be scrolled through the route, after which it stops following the
+    car.
     """
 
     def __init__(self, config, count):
@@ -26,25 +33,14 @@ class Viewer(QMainWindow):
         self.config = config
         self.cond = None  # A wait condition from the worker, which can be woken up from the viewer
         self.worker = None  # Will contain the worker that does all the work
-        self.initiated = False  # True when all plots have been initiated
-        self.data = None  # Will contain the data for the GUI
+        self.cp = get_color_palette()
 
-        # A list which contains all subplots
-        self.plots = [map_view(view) for view in self.config.views if map_view(view) is not None]
-        # The total number of rows in the grid, based on the plots that are included
-        self.grid_height = sum(plot.grid_height() for plot in self.plots)
-
-        self.cp = sns.color_palette("pastel")
-        sns.set_theme()
-        sns.set_context("paper")
-
-        self.setWindowTitle("Figure " + str(count))
         self.widget = QWidget()
         self.setCentralWidget(self.widget)
-        layout = QVBoxLayout(self.widget)
-        self.widget.setLayout(layout)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.layout().setSpacing(0)
+        self.main_layout = QVBoxLayout(self.widget)
+        self.widget.setLayout(self.main_layout)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.layout().setSpacing(0)
 
         button_layout = QHBoxLayout()
         self.buttonResume = QPushButton('Resume', self)
@@ -54,49 +50,94 @@ class Viewer(QMainWindow):
         button_layout.addWidget(self.buttonResume)
         button_layout.addWidget(self.buttonPause)
         button_layout.setAlignment(Qt.AlignCenter)
-        layout.addLayout(button_layout)
+        self.main_layout.addLayout(button_layout)
+
+        # Draws the latest snapshot at a capped frame rate
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_plots)
+
+        self.figure_widget = None  # Holds the canvas of the figure and its toolbar
+        self.reset(count)
+
+    def reset(self, count):
+        """
+        Prepares the viewer for a new run, with an empty figure, so the same window can be used for multiple runs. The
+        figure of the previous run is discarded.
+        """
+        self.initiated = False  # True when all plots have been initiated
+        self.data = None  # Will contain the data for the GUI
+        self.snapshots = SnapshotBuffer()  # Snapshots of the data pushed by the worker
+        self.animated_artists = {}  # The artists per axes that are redrawn when blitting
+        self.backgrounds = {}  # The static background per axes, cached at every full draw of the canvas
+        self.draw_connection = None  # The connection to the draw event of the canvas, used for blitting
+        self.fig_path = None  # If set, the final figure is saved to this path before the worker is woken up
+        self.window_start = 0  # The start (in km) of the sliding window, if it is used
+        self.follow_car = True  # True if the sliding window follows the car, until the slider is used
+        self.slider = None  # The slider to scroll the sliding window through the route, if it is used
+
+        # A list which contains all subplots
+        self.plots = get_plot_classes(self.config)
+        # The total number of rows in the grid, based on the plots that are included
+        self.grid_height = get_grid_height(self.plots)
+
+        self.setWindowTitle("Figure " + str(count))
+        self.__init_figure()
+        self.timer.start(int(1000 / self.config.max_frame_rate))
+
+    def __init_figure(self):
+        """
+        Creates a new (empty) figure with its canvas and toolbar, replacing the previous one if there is one.
+        """
+        if self.figure_widget is not None:
+            self.main_layout.removeWidget(self.figure_widget)
+            self.figure_widget.deleteLater()
+        self.figure_widget = QWidget(self.widget)
+        layout = QVBoxLayout(self.figure_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
 
-        fig_width = max((2.5 / 3.0) * config.road_length, 15)  # Width of figure in inches
-        fig_height = max(self.grid_height / 1.8, 5)  # Height of figure in inches
-        self.fig = Figure(figsize=(fig_width, fig_height), tight_layout={"pad": 2, "w_pad": 2, "h_pad": 0.2})
+        self.fig = create_figure(self.config, self.grid_height)
         self.canvas = FigureCanvas(self.fig)
         layout.addWidget(self.canvas)
         layout.addWidget(NavigationToolbar(self.canvas, self))
 
         # If the plots do not have to fit the screen, create a scrollarea so scrollbars appear on the plots if their
         # size exceeds the screen size
-        if not config.fit_screen:
-            scroll = QScrollArea(self.widget)
+        if not self.config.fit_screen:
+            scroll = QScrollArea(self.figure_widget)
             scroll.setAlignment(Qt.AlignCenter)
             scroll.setWidget(self.canvas)
             layout.addWidget(scroll)
 
+        if uses_sliding_window(self.config) and self.config.slider:
+            # The value of the slider is the start of the window in units of 100 m, its range is set once the length of
+            # the road is known
+            self.slider = QSlider(Qt.Horizontal, self.figure_widget)
+            self.slider.valueChanged.connect(self.__on_slider)
+            layout.addWidget(self.slider)
+        self.main_layout.addWidget(self.figure_widget)
+
     def __pause(self):
         self.worker.pause()
 
     def __resume(self):
         self.worker.resume()
 
-    def __init_plots(self):
+    def __init_plots(self, data):
         """
         Function to initialize the plots, after which the GUI will be shown.
         """
         self.initiated = True
-        self.data = self.worker.env.data
+        self.data = data
 
         # Create all plots that are specified in the view.yaml file
-        for i, plot in enumerate(self.plots):
-            self.plots[i] = plot(self.config, self.data, self.cp)
-
-        # Create the accompanying axes and set their limits
-        axes = self.__get_axes()
-        self.__set_x_limits(axes)
-        self.__set_x_labels(axes)
-        ax_iterator = iter(axes)
-
-        # Initialize the plots with their respective axes
-        for plot in self.plots:
-            plot.init_plot(next(ax_iterator))
+        self.plots = init_plots(self.fig, self.config, self.data, self.plots, self.cp)
+        if self.slider is not None:
+            self.slider.blockSignals(True)
+            self.slider.setRange(0, max(int(10 * (data.road_length - self.config.sliding_window)), 0))
+            self.slider.blockSignals(False)
+        if self.canvas.supports_blit:
+            self.__init_blitting()
 
         # Show the GUI
         self.show()
@@ -104,51 +145,103 @@ class Viewer(QMainWindow):
         self.raise_()
         self.showMaximized()
 
-    def __get_axes(self):
-        axes = []
-
-        # Used to specify the relative heights of the subplots
-        gs = gridspec.GridSpec(self.grid_height, 1)
-        cur_height = 0
+    def __init_blitting(self):
+        """
+        Marks the artists that can change as animated, so they are left out of full draws of the canvas. After every
+        full draw (e.g. the first one, or after resizing the window) the background of every axes is cached, and in
+        later updates only the animated artists of the axes that changed are redrawn on top of it.
+        """
         for plot in self.plots:
-            size = plot.get_grid_height()
-            axes.append(self.fig.add_subplot(gs[cur_height:cur_height + size, :]))
-            cur_height = cur_height + size
-
-        return axes
+            for artist in plot.get_animated_artists():
+                self.animated_artists.setdefault(artist.axes, []).append(artist)
+        for ax, artists in self.animated_artists.items():
+            # The legend is drawn on top of the animated artists
+            if ax.get_legend() is not None:
+                artists.append(ax.get_legend())
+            for artist in artists:
+                artist.set_animated(True)
+        self.draw_connection = self.canvas.mpl_connect('draw_event', self.__on_draw)
+
+    def __stop_blitting(self):
+        for artists in self.animated_artists.values():
+            for artist in artists:
+                artist.set_animated(False)
+        if self.draw_connection is not None:
+            self.canvas.mpl_disconnect(self.draw_connection)
+        self.animated_artists = {}
+        self.backgrounds = {}
+        self.draw_connection = None
+
+    def __on_draw(self, event):
+        for ax, artists in self.animated_artists.items():
+            self.backgrounds[ax] = self.canvas.copy_from_bbox(ax.bbox)
+            for artist in artists:
+                ax.draw_artist(artist)
+
+    def __move_window(self, start):
+        """
+        Moves the sliding window to start (in km). The canvas needs to be drawn completely afterwards.
+        """
+        self.window_start = start
+        set_x_limits(self.fig.axes, get_window_limits(self.config, start))
+        if self.slider is not None:
+            self.slider.blockSignals(True)
+            self.slider.setValue(int(10 * start))
+            self.slider.blockSignals(False)
+
+    @pyqtSlot(int)
+    def __on_slider(self, value):
+        self.follow_car = False
+        self.__move_window(value / 10)
+        self.fig.canvas.draw()
 
-    def __set_x_limits(self, axes):
-        # Sets the limits of the x-axis for all subplots, since this is the same for all subplots
+    def __blit(self, axes):
         for ax in axes:
-            ax.set_xticks(range(int(self.data.road_length) + 1))
-            if self.config.partial_render:
-                ax.set_xlim(self.config.start_position, self.config.end_position)
-            else:
-                ax.set_xlim(-0.01 * self.data.road_length, self.data.road_length + 0.01 * self.data.road_length)
-
-    def __set_x_labels(self, axes):
-        # Only the top plot has a label on the x-axis on top, the others do not (for space saving purposes)
-        for i, ax in enumerate(axes):
-            if i == 0:
-                ax.xaxis.set_label_position('top')
-                ax.xaxis.tick_top()
-            else:
-                ax.set_xticklabels([])
+            self.canvas.restore_region(self.backgrounds[ax])
+            for artist in self.animated_artists[ax]:
+                ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
 
     @pyqtSlot()
     def update_plots(self):
         """
-        Updates the data in the plots with the latest data available from the simulation. This way, the simulation
-        can be plotted live.
+        Updates the data in the plots with the latest snapshot of the data of the simulation, if a new one was pushed.
+        This way, the simulation can be plotted live. Only the axes in which something changed are redrawn, by
+        blitting their animated artists on the cached background.
         """
+        snapshot, last = self.snapshots.pop_latest()
+        if snapshot is None:
+            return
         if not self.initiated:
-            self.__init_plots()
+            self.__init_plots(snapshot)
+        self.data = snapshot
 
+        changed_axes = set()
         for plot in self.plots:
-            plot.update_plot()
-
-        self.fig.canvas.draw()
-        # Process events so rendering is paused as soon as pause button is clicked
-        QApplication.instance().processEvents()
-        # The runner is paused while the viewer renders, this wakes the runner back up to continue
-        self.cond.wakeAll()
+            plot.data = snapshot
+            if plot.update_plot():
+                changed_axes.update(artist.axes for artist in plot.get_animated_artists())
+
+        window_moved = False
+        if uses_sliding_window(self.config) and self.follow_car:
+            start = get_following_window_start(self.config, snapshot, snapshot.positions[-1])
+            window_moved = start != self.window_start
+            if window_moved:
+                self.__move_window(start)
+
+        if last:
+            # Draw the final figure completely, so it can be saved and zoomed like any other figure
+            self.timer.stop()
+            self.__stop_blitting()
+        if self.backgrounds and not window_moved:
+            self.__blit(changed_axes)
+        else:
+            self.fig.canvas.draw()
+
+        if last:
+            if self.fig_path is not None:
+                save_figure(self.fig, self.config, self.data, self.fig_path, dpi=600)
+            # The runner waits until the final figure is drawn (and saved), this wakes the runner back up
+            self.worker.mtx.lock()
+            self.cond.wakeAll()
+            self.worker.mtx.unlock()
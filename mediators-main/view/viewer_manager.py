@@ -0,0 +1,50 @@
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSlot
+
+from view.viewer import Viewer
+
+
+class ViewerManager(QtCore.QObject):
+    """
+    Creates the viewers of the runs lazily, when a run is rendered, instead of creating one for every run in advance.
+
+    If reuse_viewer is set in the view yaml file, all runs are drawn in the same window, which is reset at the start of
+    every run. Else, a new window is created for every run, of which at most max_open_viewers are kept open (if it is
+    set). The oldest windows are closed first; their figures are saved when the runs finish if save_fig is set.
+
+    Viewers can only be created in the main (GUI) thread, so the manager should be created there as well. Workers in
+    other threads request a viewer with the sig_request signal, which blocks until the viewer is available.
+    """
+
+    sig_request = QtCore.pyqtSignal(int)  # Signal send by a worker to request the viewer for a run
+
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        self.viewers = []  # The viewers that are open, from oldest to newest
+        self.viewer = None  # The viewer of the latest requested run
+        self.sig_request.connect(self.__create_viewer, QtCore.Qt.BlockingQueuedConnection)
+
+    def get_viewer(self, count):
+        """
+        Returns the viewer for run count. Can be called from any thread except the main thread.
+        """
+        self.sig_request.emit(count)
+        return self.viewer
+
+    @pyqtSlot(int)
+    def __create_viewer(self, count):
+        if self.config.reuse_viewer and self.viewers:
+            self.viewer = self.viewers[-1]
+            self.viewer.reset(count)
+            return
+
+        self.viewer = Viewer(self.config, count)
+        self.viewers.append(self.viewer)
+        while self.config.max_open_viewers is not None and len(self.viewers) > self.config.max_open_viewers:
+            viewer = self.viewers.pop(0)
+            # The viewer is hidden instead of closed, since closing the last visible window quits the application,
+            # and the new viewer is only shown once its run is rendered
+            viewer.timer.stop()
+            viewer.hide()
+            viewer.deleteLater()